@@ -0,0 +1,55 @@
+# Synthetic Emby payloads shared by the benchmark scripts.
+
+import json
+from typing import Any
+
+def media_source(index: int) -> dict[str, Any]:
+    return {
+        "Protocol": "File",
+        "Id": f"source{index}",
+        "Path": f"/media/movies/Movie {index}/Movie {index}.mkv",
+        "Type": "Default",
+        "Container": "mkv",
+        "Size": 4_000_000_000 + index,
+        "Name": f"Movie {index}",
+        "IsRemote": False,
+        "RunTimeTicks": 72_000_000_000,
+        "SupportsTranscoding": True,
+        "SupportsDirectStream": True,
+        "SupportsDirectPlay": True,
+        "Bitrate": 8_000_000,
+        "MediaStreams": [
+            {"Codec": "hevc", "Type": "Video", "Index": 0, "Width": 3840, "Height": 2160, "BitRate": 7_500_000, "IsDefault": True, "AverageFrameRate": 23.976},
+            {"Codec": "eac3", "Type": "Audio", "Index": 1, "Language": "eng", "Channels": 6, "SampleRate": 48000, "IsDefault": True},
+            {"Codec": "aac", "Type": "Audio", "Index": 2, "Language": "ger", "Channels": 2, "SampleRate": 48000},
+            {"Codec": "subrip", "Type": "Subtitle", "Index": 3, "Language": "eng", "IsTextSubtitleStream": True},
+        ],
+    }
+
+def item(index: int, full: bool = True) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "Name": f"Movie {index}",
+        "ServerId": "server",
+        "Id": str(100000 + index),
+        "Etag": f"etag{index}",
+        "DateCreated": "2024-01-01T00:00:00.0000000Z",
+        "DateModified": "2024-06-01T12:00:00.0000000Z",
+        "SortName": f"movie {index:06d}",
+        "Path": f"/media/movies/Movie {index}/Movie {index}.mkv",
+        "Genres": ["Action", "Drama"],
+        "RunTimeTicks": 72_000_000_000,
+        "Size": 4_000_000_000 + index,
+        "ProviderIds": {"Imdb": f"tt{index:07d}", "Tmdb": str(index)},
+        "ParentId": "3",
+        "Type": "Movie",
+    }
+    if full:
+        data["MediaSources"] = [media_source(index)]
+        data["People"] = [
+            {"Name": f"Actor {index}-{person}", "Id": f"{index}{person}", "Role": "Someone", "Type": "Actor"}
+            for person in range(10)
+        ]
+    return data
+
+def items_page(count: int, full: bool = True) -> bytes:
+    return json.dumps({"Items": [item(index, full) for index in range(count)], "TotalRecordCount": count}).encode()
@@ -0,0 +1,36 @@
+# decoding.py
+#
+# Compares the ways of turning a large /Items page (BaseItemDto with
+# MediaSources and People) into a QueryResultBaseItemDto.
+#
+#   uv run python benchmarks/decoding.py [items per page]
+
+import json
+import sys
+import timeit
+
+from _payloads import items_page
+from remby._decoding import DecodeOptions, decode
+from remby.models.emby._internal import QueryResultBaseItemDto
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    content = items_page(count)
+    print(f"/Items page: {count} items, {len(content) / 1024 / 1024:.1f} MiB")
+
+    candidates = {
+        "json.loads + model_validate (old)": lambda: QueryResultBaseItemDto.model_validate(json.loads(content)),
+        "pydantic model_validate_json": lambda: decode(QueryResultBaseItemDto, content, DecodeOptions(backend="pydantic")),
+    }
+    try:
+        import orjson  # noqa: F401
+        candidates["orjson.loads + model_validate"] = lambda: decode(QueryResultBaseItemDto, content, DecodeOptions(backend="orjson"))
+    except ImportError:
+        print("orjson not installed, skipping")
+
+    for name, candidate in candidates.items():
+        best = min(timeit.repeat(candidate, number=5, repeat=5)) / 5
+        print(f"{name:<40} {best * 1000:8.1f} ms/page  {best / count * 1e6:8.1f} us/item")
+
+if __name__ == "__main__":
+    main()
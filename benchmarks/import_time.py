@@ -0,0 +1,46 @@
+# import_time.py
+#
+# Cold-import cost of remby, measured in fresh interpreters: wall time and
+# number of modules loaded by `import remby`, and the time until the first
+# /Items page has been validated (which loads and builds the generated models).
+#
+#   uv run python benchmarks/import_time.py [runs]
+
+import json
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    "import remby": "import remby",
+    "import + first page": (
+        "import remby\n"
+        "from remby._decoding import decode\n"
+        "from remby.models.emby import QueryResultBaseItemDto\n"
+        "decode(QueryResultBaseItemDto, b'{\"Items\": [{\"Id\": \"1\"}], \"TotalRecordCount\": 1}')"
+    ),
+}
+
+PROBE = """
+import sys, time
+before = set(sys.modules)
+started = time.perf_counter()
+exec({snippet!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": len(set(sys.modules) - before), "internal": "remby.models.emby._internal" in sys.modules}}))
+"""
+
+def measure(snippet: str) -> dict:
+    code = "import json\n" + PROBE.format(snippet=snippet)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, snippet in SNIPPETS.items():
+        results = [measure(snippet) for _ in range(runs)]
+        median = statistics.median(result["seconds"] for result in results)
+        print(f"{name:<22} {median * 1000:8.1f} ms  {results[0]['modules']:4d} modules  generated models loaded: {results[0]['internal']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# projection.py
+#
+# Compares validating a large /Items page into the full BaseItemDto with
+# validating the same page into slim ItemProjection models. The body is the
+# same in every case, so this measures the validation side only; in practice
+# the server also sends less for smaller projections.
+#
+#   uv run python benchmarks/projection.py [items per page]
+
+import sys
+import timeit
+import tracemalloc
+
+from _payloads import items_page
+from remby import ItemProjection
+from remby._decoding import decode
+from remby.models.emby._internal import QueryResultBaseItemDto
+
+PROJECTIONS = {
+    "full BaseItemDto": None,
+    "id, name": ItemProjection("id", "name"),
+    "+ type, path, provider_ids": ItemProjection("id", "name", "type", "path", "provider_ids"),
+    "+ media_sources": ItemProjection("id", "name", "type", "path", "provider_ids", "media_sources"),
+}
+
+def retained_bytes(response_type: type, content: bytes) -> int:
+    tracemalloc.start()
+    page = decode(response_type, content)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del page
+    return size
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    content = items_page(count)
+    print(f"/Items page: {count} items, {len(content) / 1024 / 1024:.1f} MiB")
+
+    for name, projection in PROJECTIONS.items():
+        response_type = projection.page_model if projection else QueryResultBaseItemDto
+        best = min(timeit.repeat(lambda: decode(response_type, content), number=5, repeat=5)) / 5
+        memory = retained_bytes(response_type, content)
+        print(f"{name:<28} {best * 1000:8.1f} ms/page  {best / count * 1e6:8.1f} us/item  {memory / count:8.0f} B/item")
+
+if __name__ == "__main__":
+    main()
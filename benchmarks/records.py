@@ -0,0 +1,48 @@
+# records.py
+#
+# Memory per item of a library snapshot kept as validated BaseItemDto models,
+# as slim ItemProjection models and as compact ItemRecords, measured with
+# tracemalloc while holding every page of a synthetic library.
+#
+#   uv run python benchmarks/records.py [items]
+
+import json
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from _payloads import items_page
+from remby import ItemSnapshot
+from remby._decoding import decode
+from remby.models.emby._internal import QueryResultBaseItemDto
+from remby.models.records import RECORD_PROJECTION
+
+PAGE_SIZE = 500
+
+def retained(build: Callable[[], Any]) -> tuple[Any, int]:
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    pages = [items_page(PAGE_SIZE) for _ in range(count // PAGE_SIZE)]
+    count = len(pages) * PAGE_SIZE
+    print(f"library: {count} items in {len(pages)} pages of {PAGE_SIZE}")
+
+    candidates = {
+        "BaseItemDto": lambda: [item for page in pages for item in decode(QueryResultBaseItemDto, page).items],
+        "projected BaseItemDto": lambda: [item for page in pages for item in decode(RECORD_PROJECTION.page_model, page).items],
+        "ItemSnapshot (dicts)": lambda: ItemSnapshot.from_items(item for page in pages for item in json.loads(page)["Items"]),
+    }
+    for name, build in candidates.items():
+        result, size = retained(build)
+        print(f"{name:<24} {size / count:8.0f} B/item")
+        if isinstance(result, ItemSnapshot):
+            print(f"{'memory_usage()':<24} {result.bytes_per_item():8.0f} B/item")
+        del result
+
+if __name__ == "__main__":
+    main()
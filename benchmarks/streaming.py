@@ -0,0 +1,52 @@
+# streaming.py
+#
+# Peak memory and time of consuming a large /Items page item by item, either
+# decoded as a whole or split incrementally from 64 KiB chunks as done by
+# `stream_items`. Items are dropped after reading, like a scan that writes
+# them somewhere else would.
+#
+#   uv run python benchmarks/streaming.py [items per page]
+
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from _payloads import items_page
+from remby._decoding import decode
+from remby._streaming import ItemsSplitter
+from remby.models.emby._internal import BaseItemDto, QueryResultBaseItemDto
+
+CHUNK_SIZE = 65_536
+
+def whole_page(content: bytes) -> None:
+    for item in decode(QueryResultBaseItemDto, content).items:
+        item.id
+
+def streamed(content: bytes) -> None:
+    splitter = ItemsSplitter()
+    for offset in range(0, len(content), CHUNK_SIZE):
+        for item in splitter.feed(content[offset:offset + CHUNK_SIZE]):
+            decode(BaseItemDto, item).id
+    splitter.finish()
+
+def measure(consume: Callable[[bytes], None], content: bytes) -> tuple[float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    consume(content)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    content = items_page(count)
+    print(f"/Items page: {count} items, {len(content) / 1024 / 1024:.1f} MiB")
+
+    for name, consume in {"whole page": whole_page, "streamed": streamed}.items():
+        elapsed, peak = measure(consume, content)
+        print(f"{name:<12} {elapsed * 1000:8.1f} ms  peak {peak / 1024 / 1024:8.2f} MiB")
+
+if __name__ == "__main__":
+    main()
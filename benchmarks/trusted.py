@@ -0,0 +1,37 @@
+# trusted.py
+#
+# Compares validating and trusted (validate=False) decoding of a large
+# /Items page where BaseItemDto carries MediaSources, MediaStreams and People.
+# "decode" only builds the page, "decode + read" also reads a handful of
+# common fields from every item, like an export or dedupe job would.
+#
+#   uv run python benchmarks/trusted.py [items per page]
+
+import sys
+import timeit
+from typing import Any
+
+from _payloads import items_page
+from remby._decoding import DecodeOptions, decode
+from remby.models.emby._internal import QueryResultBaseItemDto
+
+def read(page: Any) -> None:
+    for item in page.items:
+        item.id, item.name, item.type, item.provider_ids, item.media_sources[0].size
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    content = items_page(count)
+    print(f"/Items page: {count} items, {len(content) / 1024 / 1024:.1f} MiB")
+
+    for validate in (True, False):
+        candidates = {
+            "decode": lambda: decode(QueryResultBaseItemDto, content, DecodeOptions(validate=validate)),
+            "decode + read": lambda: read(decode(QueryResultBaseItemDto, content, DecodeOptions(validate=validate))),
+        }
+        for name, candidate in candidates.items():
+            best = min(timeit.repeat(candidate, number=5, repeat=5)) / 5
+            print(f"validate={validate!s:<6} {name:<14} {best * 1000:8.1f} ms/page  {best / count * 1e6:8.1f} us/item")
+
+if __name__ == "__main__":
+    main()
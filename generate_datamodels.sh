@@ -8,4 +8,5 @@ uv run datamodel-codegen \
   --use-standard-collections \
   --use-schema-description \
   --use-double-quotes \
-  --enum-field-as-literal all
\ No newline at end of file
+  --enum-field-as-literal all \
+  && uv run python tools/defer_datamodels.py src/remby/models/emby
@@ -1,10 +1,56 @@
-from remby._client import EmbyClient
-from remby.exceptions import EmbyException, AuthenticationError
+from importlib import import_module
+from typing import Any
+
+from remby._client import AsyncEmbyClient, EmbyClient
+from remby._api.items import AdaptivePageSize, ItemsByIds, ItemsCursor
+from remby._arrow import ArrowItemWriter
+from remby._cache import CacheEntry, CacheStats, MemoryCache, ResponseCache, SQLiteCache
+from remby._breaker import CircuitBreaker, CircuitState
+from remby._mirror import LibraryMirror, SyncResult
+from remby._provider_index import ProviderIdIndex
+from remby._ratelimit import RateLimit, RateLimiter
+from remby._retry import RetryPolicy, RetryStats
+from remby.exceptions import EmbyException, AuthenticationError, CircuitOpenError
 from remby.models.items import GetItemRequest
+from remby.models.lazy import LazyModel
+from remby.models.projection import ItemProjection
+from remby.models.records import ItemRecord, ItemSnapshot
 
 __all__ = [
+    "ARROW_PROJECTION",
+    "AdaptivePageSize",
+    "ArrowItemWriter",
+    "AsyncEmbyClient",
+    "CacheEntry",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
     "EmbyClient",
     "EmbyException",
     "AuthenticationError",
-    "GetItemRequest"
-]
\ No newline at end of file
+    "GetItemRequest",
+    "ItemProjection",
+    "ItemsByIds",
+    "ItemsCursor",
+    "ItemRecord",
+    "ItemSnapshot",
+    "LazyModel",
+    "LibraryMirror",
+    "MemoryCache",
+    "ProviderIdIndex",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "RetryStats",
+    "SQLiteCache",
+    "SyncResult"
+]
+
+def __getattr__(name: str) -> Any:
+    # Projections load the generated models, so they are resolved on first access.
+    if name == "ARROW_PROJECTION":
+        value = globals()[name] = getattr(import_module("remby._arrow"), name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
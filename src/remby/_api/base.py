@@ -1,8 +1,12 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from remby._client import EmbyClient
+    from remby._client import AsyncEmbyClient, EmbyClient
 
 class BaseModule:
     def __init__(self, client: "EmbyClient") -> None:
-        self._client = client
\ No newline at end of file
+        self._client = client
+
+class AsyncBaseModule:
+    def __init__(self, client: "AsyncEmbyClient") -> None:
+        self._client = client
@@ -1,34 +1,600 @@
-from typing import Any, Callable, Iterator
+from __future__ import annotations
 
-from remby._api.base import BaseModule
-from remby.models.emby._internal import BaseItemDto, QueryResultBaseItemDto
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Literal
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+import httpx
+
+from remby._api.base import AsyncBaseModule, BaseModule
+from remby._decoding import ResponseFormat
+from remby.exceptions import EmbyException
+from remby.models import emby
 from remby.models.items import GetItemRequest
+from remby.models.projection import ItemProjection
 from remby.models.response import EmbyResponse
 
-def _paginate_items(fetch: Callable[..., Any], start: int = 0, page_size: int = 50, max_items: int | None = None) -> Iterator[BaseItemDto]:
+if TYPE_CHECKING:
+    from remby.models.emby._internal import BaseItemDto, QueryResultBaseItemDto
+
+Pagination = Literal["offset", "keyset"]
+
+@dataclass(frozen=True)
+class AdaptivePageSize:
+    """
+    Page sizing policy for the `iter_items*` methods.
+
+    After every page the next `limit` is derived from the measured time per item
+    and the `Content-Length` per item, aiming at `target_seconds` and `target_bytes`
+    per response. The size changes by at most `max_step` per page and always
+    stays between `min_size` and `max_size`.
+    """
+    initial: int = 100
+    min_size: int = 10
+    max_size: int = 1000
+    target_seconds: float = 1.0
+    target_bytes: int = 4_000_000
+    max_step: float = 2.0
+
+    def __post_init__(self) -> None:
+        if not 0 < self.min_size <= self.initial <= self.max_size:
+            raise ValueError("AdaptivePageSize requires 0 < min_size <= initial <= max_size")
+        if self.max_step <= 1.0:
+            raise ValueError("AdaptivePageSize.max_step must be greater than 1")
+
+    def next_size(self, current: int, count: int, elapsed: float, content_length: int | None) -> int:
+        if count <= 0:
+            return current
+        ideal = self.max_size
+        if elapsed > 0:
+            ideal = min(ideal, int(self.target_seconds * count / elapsed))
+        if content_length:
+            ideal = min(ideal, int(self.target_bytes * count / content_length))
+        lower = int(current / self.max_step)
+        upper = int(current * self.max_step)
+        return max(self.min_size, min(self.max_size, max(lower, min(upper, ideal))))
+
+def _iter_format(response_format: ResponseFormat | None) -> ResponseFormat | None:
+    # Raw bodies have to be parsed to split them into items, so iterators yield dicts instead.
+    return "dict" if response_format == "raw" else response_format
+
+def _projected(query: GetItemRequest, projection: ItemProjection | None) -> tuple[GetItemRequest, Any]:
+    if projection is None:
+        return query, emby.QueryResultBaseItemDto
+    return projection.apply(query), projection.page_model
+
+def _item_type(projection: ItemProjection | None) -> Any:
+    return emby.BaseItemDto if projection is None else projection.model
+
+def _page(response: Any) -> tuple[list[Any], int | None]:
+    """Return the items and `TotalRecordCount` of a page, decoded as a model or as a plain dict."""
+    data = response.data
+    if isinstance(data, dict):
+        return data.get("Items") or [], data.get("TotalRecordCount")
+    return data.items or [], data.total_record_count
+
+def _content_length(response: Any) -> int | None:
+    value = response.headers.get("content-length")
+    return int(value) if value else None
+
+def _page_windows(start: int, end: int, page_size: int) -> Iterator[tuple[int, int]]:
+    while start < end:
+        limit = min(page_size, end - start)
+        yield start, limit
+        start += limit
+
+def _prefetch_end(start: int, total: int, yielded: int, max_items: int | None) -> int:
+    if max_items:
+        return min(total, start + max_items - yielded)
+    return total
+
+def _sort_key(item: Any) -> tuple[str, str]:
+    if isinstance(item, dict):
+        return item.get("SortName") or "", item.get("Id") or ""
+    return item.sort_name or "", item.id or ""
+
+@dataclass
+class ItemsCursor:
+    """
+    Serializable position of an `iter_items*` scan, to resume it after a restart.
+
+    A cursor passed to `iter_items(..., cursor=...)` follows the items handed out:
+    `start` is the next `StartIndex` of an offset scan, `key` and `tied` are the last
+    `SortName` of a keyset scan and the IDs already yielded under it. `yielded` counts
+    items over all runs, `total` is the last `TotalRecordCount` seen and `done` is set
+    once the scan is exhausted. `query_hash` binds the cursor to the query it was
+    first used with; resuming a different query raises `ValueError`.
+    """
+    query_hash: str = ""
+    pagination: Pagination = "offset"
+    start: int = 0
+    key: str = ""
+    tied: set[str] = field(default_factory=set)
+    yielded: int = 0
+    total: int | None = None
+    done: bool = False
+
+    def to_json(self) -> str:
+        return json.dumps({**asdict(self), "tied": sorted(self.tied)})
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> ItemsCursor:
+        values = json.loads(data)
+        values["tied"] = set(values.get("tied", ()))
+        return cls(**values)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the cursor to `path` through a temporary file, so a crash never leaves a torn checkpoint."""
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(self.to_json(), encoding="utf-8")
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> ItemsCursor:
+        return cls.from_json(Path(path).read_text(encoding="utf-8"))
+
+    def _advance(self, item: Any, index: int | None = None) -> bool:
+        """
+        Move past `item`, found at `StartIndex` `index` of an offset scan.
+
+        Returns `False` if a keyset scan already yielded it.
+        """
+        if self.pagination == "keyset":
+            sort_name, item_id = _sort_key(item)
+            if sort_name != self.key:
+                # Pages are sorted by the server, so any other name lies past the boundary.
+                self.key, self.tied = sort_name, set()
+            elif item_id in self.tied:
+                return False
+            self.tied.add(item_id)
+        else:
+            self.start = self.start + 1 if index is None else index + 1
+        self.yielded += 1
+        return True
+
+def _query_hash(endpoint: str, query: GetItemRequest, projection: ItemProjection | None, pagination: Pagination) -> str:
+    params = query.model_dump(by_alias=True, exclude_none=True, exclude={"start_index", "limit"})
+    data = json.dumps([endpoint, params, projection.fields if projection else None, pagination], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+class _Progress:
+    """Keeps the `ItemsCursor` of a scan and saves it to `path` every `every` consumed pages."""
+    __slots__ = ("cursor", "path", "every", "pages")
+
+    def __init__(self, cursor: ItemsCursor | None = None, path: str | os.PathLike[str] | None = None, every: int = 1) -> None:
+        self.cursor = cursor or ItemsCursor()
+        self.path = path
+        self.every = every
+        self.pages = 0
+
+    def page(self, total: int | None) -> None:
+        """Record a page whose items have all been consumed."""
+        if total is not None:
+            self.cursor.total = total
+        self.pages += 1
+        if self.path is not None and self.pages % self.every == 0:
+            self.cursor.save(self.path)
+
+    def finish(self) -> None:
+        """Save the cursor, or delete the checkpoint once the scan is complete."""
+        if self.path is None:
+            return
+        if self.cursor.done:
+            Path(self.path).unlink(missing_ok=True)
+        else:
+            self.cursor.save(self.path)
+
+def _progress(query_hash: str, pagination: Pagination, start: int, cursor: ItemsCursor | None, checkpoint: str | os.PathLike[str] | None, checkpoint_every: int) -> _Progress:
+    """
+    Set up the progress of an `iter_items*` call.
+
+    Without a `cursor`, the one saved at `checkpoint` is resumed if the file exists
+    and records an unfinished scan. A fresh cursor is bound to the query and starts at `start`.
+    """
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    if cursor is None and checkpoint is not None and os.path.exists(checkpoint):
+        cursor = ItemsCursor.load(checkpoint)
+        if cursor.done:
+            cursor = None
+    cursor = cursor or ItemsCursor()
+    if not cursor.query_hash:
+        cursor.query_hash, cursor.pagination, cursor.start = query_hash, pagination, start
+    elif cursor.query_hash != query_hash:
+        raise ValueError("The cursor was created for a different query")
+    return _Progress(cursor, checkpoint, checkpoint_every)
+
+def _prefetch_pages(fetch: Callable[..., Any], start: int, end: int, page_size: int, workers: int, read_ahead: int, progress: _Progress) -> Iterator[BaseItemDto]:
+    """
+    Fetch the `[start, end)` range in `page_size` windows on a pool of `workers` threads.
+
+    At most `read_ahead` pages are requested or buffered at any time and
+    items are yielded strictly in window order.
+    """
+    windows = _page_windows(start, end, page_size)
+    pending: deque[tuple[int, int, Future[Any]]] = deque()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="remby-prefetch")
+
+    def submit() -> None:
+        window = next(windows, None)
+        if window is not None:
+            pending.append((*window, pool.submit(fetch, *window)))
+
+    try:
+        for _ in range(read_ahead):
+            submit()
+        while pending:
+            window_start, window_limit, future = pending.popleft()
+            items, total = _page(future.result())
+            submit()
+            for index, item in enumerate(items, window_start):
+                progress.cursor._advance(item, index)
+                yield item
+            progress.page(total)
+            if len(items) < window_limit:
+                # The server returned a short page (library changed or server-side limit cap),
+                # so fill the rest of this window sequentially to keep the order intact.
+                yield from _paginate_items(fetch, window_start + len(items), page_size, window_limit - len(items), progress=progress)
+                # Only the outermost loop knows whether the scan is exhausted.
+                progress.cursor.done = False
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _paginate_items(fetch: Callable[..., Any], start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, progress: _Progress | None = None) -> Iterator[BaseItemDto]:
+    """
+    Yield items page by page from `fetch(start, limit)`.
+
+    With `prefetch > 0`, the first page is used to learn `TotalRecordCount`, after which
+    the remaining pages are fetched by `prefetch` worker threads. `read_ahead` caps how
+    many pages may be in flight or buffered at once (defaults to `prefetch`).
+
+    With an `AdaptivePageSize`, the limit is re-computed after every page. When combined
+    with `prefetch`, the size measured on the first page is used for all prefetched windows.
+
+    `progress` is advanced past every item before it is yielded.
+    """
+    progress = progress or _Progress()
+    sizing = page_size if isinstance(page_size, AdaptivePageSize) else None
+    size = sizing.initial if sizing else page_size
     yielded = 0
     while True:
-        limit = page_size
+        limit = size
         if max_items:
-            limit = min(page_size, max_items - yielded)
-        result = fetch(start, limit).data
+            limit = min(size, max_items - yielded)
+        started = time.perf_counter()
+        response = fetch(start, limit)
+        items, total = _page(response)
+        if sizing and items:
+            size = sizing.next_size(limit, len(items), time.perf_counter() - started, _content_length(response))
         
-        if not result.items:
+        if not items:
+            progress.cursor.done = True
             return
         
-        for item in result.items:
+        for index, item in enumerate(items, start):
+            progress.cursor._advance(item, index)
             yield item
             yielded += 1
             if max_items and yielded >= max_items:
                 return
+        progress.page(total)
 
-        start += len(result.items)
+        start += len(items)
 
-        if result.total_record_count and start >= result.total_record_count:
+        if total and start >= total:
+            progress.cursor.done = True
             return
 
+        if prefetch > 0 and total:
+            end = _prefetch_end(start, total, yielded, max_items)
+            yield from _prefetch_pages(fetch, start, end, size, prefetch, max(read_ahead or prefetch, 1), progress)
+            progress.cursor.done = end >= total
+            return
+
+async def _aprefetch_pages(fetch: Callable[..., Awaitable[Any]], start: int, end: int, page_size: int, workers: int, read_ahead: int, progress: _Progress) -> AsyncIterator[BaseItemDto]:
+    windows = _page_windows(start, end, page_size)
+    pending: deque[tuple[int, int, asyncio.Task[Any]]] = deque()
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run(window_start: int, window_limit: int) -> Any:
+        async with semaphore:
+            return await fetch(window_start, window_limit)
+
+    def submit() -> None:
+        window = next(windows, None)
+        if window is not None:
+            pending.append((*window, asyncio.create_task(run(*window))))
+
+    try:
+        for _ in range(read_ahead):
+            submit()
+        while pending:
+            window_start, window_limit, task = pending.popleft()
+            items, total = _page(await task)
+            submit()
+            for index, item in enumerate(items, window_start):
+                progress.cursor._advance(item, index)
+                yield item
+            progress.page(total)
+            if len(items) < window_limit:
+                async for item in _apaginate_items(fetch, window_start + len(items), page_size, window_limit - len(items), progress=progress):
+                    yield item
+                progress.cursor.done = False
+    finally:
+        for _, _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
+
+async def _apaginate_items(fetch: Callable[..., Awaitable[Any]], start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, progress: _Progress | None = None) -> AsyncIterator[BaseItemDto]:
+    progress = progress or _Progress()
+    sizing = page_size if isinstance(page_size, AdaptivePageSize) else None
+    size = sizing.initial if sizing else page_size
+    yielded = 0
+    while True:
+        limit = size
+        if max_items:
+            limit = min(size, max_items - yielded)
+        started = time.perf_counter()
+        response = await fetch(start, limit)
+        items, total = _page(response)
+        if sizing and items:
+            size = sizing.next_size(limit, len(items), time.perf_counter() - started, _content_length(response))
+
+        if not items:
+            progress.cursor.done = True
+            return
+
+        for index, item in enumerate(items, start):
+            progress.cursor._advance(item, index)
+            yield item
+            yielded += 1
+            if max_items and yielded >= max_items:
+                return
+        progress.page(total)
+
+        start += len(items)
+
+        if total and start >= total:
+            progress.cursor.done = True
+            return
+
+        if prefetch > 0 and total:
+            end = _prefetch_end(start, total, yielded, max_items)
+            async for item in _aprefetch_pages(fetch, start, end, size, prefetch, max(read_ahead or prefetch, 1), progress):
+                yield item
+            progress.cursor.done = end >= total
+            return
+
+def _keyset_request(query: GetItemRequest, projection: ItemProjection | None) -> tuple[GetItemRequest, ItemProjection | None]:
+    """
+    Order `query` by `SortName` and make sure every item carries its `SortName`.
+
+    Keyset scans depend on that order, so a query sorted any other way is rejected.
+    """
+    if query.sort_by not in (None, "SortName") or query.sort_order not in (None, "Ascending"):
+        raise ValueError("Keyset pagination sorts by SortName ascending, remove sort_by/sort_order from the query")
+    query = query.model_copy(update={"sort_by": "SortName", "sort_order": "Ascending"})
+    if projection is not None:
+        if "sort_name" not in projection.fields:
+            projection = ItemProjection(*projection.fields, "sort_name")
+        return query, projection
+    fields = query.fields.split(",") if query.fields else []
+    if "SortName" not in fields:
+        query = query.model_copy(update={"fields": ",".join([*fields, "SortName"])})
+    return query, projection
+
+def _keyset_query(query: GetItemRequest, key: str, limit: int) -> GetItemRequest:
+    # Before the first item, the scan starts wherever the caller's own NameStartsWithOrGreater does.
+    return query.model_copy(update={"name_starts_with_or_greater": key or query.name_starts_with_or_greater, "start_index": None, "limit": limit})
+
+def _check_keyset(start: int, prefetch: int) -> None:
+    if start:
+        raise ValueError("Keyset pagination can't start at an offset")
+    if prefetch:
+        raise ValueError("Keyset pagination is sequential and can't prefetch pages")
+
+def _seek_items(fetch: Callable[..., Any], page_size: int | AdaptivePageSize = 50, max_items: int | None = None, progress: _Progress | None = None) -> Iterator[BaseItemDto]:
+    """
+    Yield items page by page from `fetch(key, limit)`, seeking by `SortName`
+    instead of paging by offset.
+
+    A page is requested with `NameStartsWithOrGreater` set to the last name yielded,
+    so every page costs the same however deep the scan is, and items added or
+    removed before the current position don't shift the remaining pages. Emby has
+    no unique sort key, so items sharing the boundary name are re-requested from
+    the start of that name, with `limit` raised by their number, and dropped by ID.
+    That holds up however the server orders them, without skipping unseen ones.
+    """
+    progress = progress or _Progress(ItemsCursor(pagination="keyset"))
+    cursor = progress.cursor
+    sizing = page_size if isinstance(page_size, AdaptivePageSize) else None
+    size = sizing.initial if sizing else page_size
+    yielded = 0
+    while True:
+        limit = size
+        if max_items:
+            limit = min(size, max_items - yielded)
+        seen = len(cursor.tied)
+        started = time.perf_counter()
+        response = fetch(cursor.key, seen + limit)
+        items, total = _page(response)
+        if sizing and items:
+            size = sizing.next_size(limit, len(items), time.perf_counter() - started, _content_length(response))
+
+        fresh = 0
+        for item in items:
+            if not cursor._advance(item):
+                continue
+            fresh += 1
+            yield item
+            yielded += 1
+            if max_items and yielded >= max_items:
+                return
+        progress.page(total)
+
+        if len(items) < seen + limit:
+            cursor.done = True
+            return
+        if not fresh:
+            raise EmbyException(f"Keyset pagination stalled at SortName {cursor.key!r}, the server ignored NameStartsWithOrGreater")
+
+async def _aseek_items(fetch: Callable[..., Awaitable[Any]], page_size: int | AdaptivePageSize = 50, max_items: int | None = None, progress: _Progress | None = None) -> AsyncIterator[BaseItemDto]:
+    progress = progress or _Progress(ItemsCursor(pagination="keyset"))
+    cursor = progress.cursor
+    sizing = page_size if isinstance(page_size, AdaptivePageSize) else None
+    size = sizing.initial if sizing else page_size
+    yielded = 0
+    while True:
+        limit = size
+        if max_items:
+            limit = min(size, max_items - yielded)
+        seen = len(cursor.tied)
+        started = time.perf_counter()
+        response = await fetch(cursor.key, seen + limit)
+        items, total = _page(response)
+        if sizing and items:
+            size = sizing.next_size(limit, len(items), time.perf_counter() - started, _content_length(response))
+
+        fresh = 0
+        for item in items:
+            if not cursor._advance(item):
+                continue
+            fresh += 1
+            yield item
+            yielded += 1
+            if max_items and yielded >= max_items:
+                return
+        progress.page(total)
+
+        if len(items) < seen + limit:
+            cursor.done = True
+            return
+        if not fresh:
+            raise EmbyException(f"Keyset pagination stalled at SortName {cursor.key!r}, the server ignored NameStartsWithOrGreater")
+
+def _scan_items(get: Callable[[GetItemRequest, ItemProjection | None], Any], endpoint: str, query: GetItemRequest, start: int, page_size: int | AdaptivePageSize, max_items: int | None, prefetch: int, read_ahead: int | None, projection: ItemProjection | None, pagination: Pagination, cursor: ItemsCursor | None, checkpoint: str | os.PathLike[str] | None, checkpoint_every: int) -> Iterator[BaseItemDto]:
+    """Run an `iter_items*` scan of `endpoint`, whose pages `get(query, projection)` fetches."""
+    progress = _progress(_query_hash(endpoint, query, projection, pagination), pagination, start, cursor, checkpoint, checkpoint_every)
+    if progress.cursor.done:
+        return
+    if pagination == "keyset":
+        _check_keyset(start, prefetch)
+        seek_query, seek_projection = _keyset_request(query, projection)
+        yield from _seek_items(
+            fetch=lambda key, limit: get(_keyset_query(seek_query, key, limit), seek_projection),
+            page_size=page_size,
+            max_items=max_items,
+            progress=progress
+        )
+    else:
+        yield from _paginate_items(
+            fetch=lambda start, limit: get(query.model_copy(update={"start_index": start, "limit": limit}), projection),
+            start=progress.cursor.start,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+            read_ahead=read_ahead,
+            progress=progress
+        )
+    progress.finish()
+
+async def _ascan_items(get: Callable[[GetItemRequest, ItemProjection | None], Awaitable[Any]], endpoint: str, query: GetItemRequest, start: int, page_size: int | AdaptivePageSize, max_items: int | None, prefetch: int, read_ahead: int | None, projection: ItemProjection | None, pagination: Pagination, cursor: ItemsCursor | None, checkpoint: str | os.PathLike[str] | None, checkpoint_every: int) -> AsyncIterator[BaseItemDto]:
+    progress = _progress(_query_hash(endpoint, query, projection, pagination), pagination, start, cursor, checkpoint, checkpoint_every)
+    if progress.cursor.done:
+        return
+    if pagination == "keyset":
+        _check_keyset(start, prefetch)
+        seek_query, seek_projection = _keyset_request(query, projection)
+        pages = _aseek_items(
+            fetch=lambda key, limit: get(_keyset_query(seek_query, key, limit), seek_projection),
+            page_size=page_size,
+            max_items=max_items,
+            progress=progress
+        )
+    else:
+        pages = _apaginate_items(
+            fetch=lambda start, limit: get(query.model_copy(update={"start_index": start, "limit": limit}), projection),
+            start=progress.cursor.start,
+            page_size=page_size,
+            max_items=max_items,
+            prefetch=prefetch,
+            read_ahead=read_ahead,
+            progress=progress
+        )
+    async for item in pages:
+        yield item
+    progress.finish()
+
+@dataclass
+class ItemsByIds:
+    """
+    Result of `get_items_by_ids`.
+
+    `items` follows the order of the requested IDs (duplicates removed) and
+    `missing` lists the IDs the server didn't return.
+    """
+    items: list[Any] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+def _as_projection(fields: ItemProjection | Iterable[str] | None) -> ItemProjection | None:
+    """Turn `fields` into a projection that always includes `id`, which items are matched by."""
+    if fields is None:
+        return None
+    fields = fields.fields if isinstance(fields, ItemProjection) else tuple(fields)
+    return ItemProjection(*fields, "id")
+
+def _id_chunks(ids: list[str], base_url: str, params: dict[str, Any], max_url_bytes: int) -> list[list[str]]:
+    """
+    Split `ids` into chunks whose request URL, `Ids` parameter included, fits in `max_url_bytes`.
+
+    An ID too long to share a URL with others is sent on its own.
+    """
+    base = len(str(httpx.URL(base_url, params={**params, "Ids": ""})))
+    if base >= max_url_bytes:
+        raise ValueError(f"The query alone needs {base} URL bytes, more than max_url_bytes={max_url_bytes}")
+    separator = len(str(httpx.QueryParams({"": ","}))) - 1
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    size = base
+    for item_id in ids:
+        cost = len(str(httpx.QueryParams({"": item_id}))) - 1 + (separator if chunk else 0)
+        if chunk and size + cost > max_url_bytes:
+            chunks.append(chunk)
+            chunk, size = [], base
+            cost -= separator
+        chunk.append(item_id)
+        size += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+def _item_id(item: Any) -> str | None:
+    return item.get("Id") if isinstance(item, dict) else item.id
+
+def _merge_by_ids(ids: list[str], pages: Iterable[Any]) -> ItemsByIds:
+    found: dict[str, Any] = {}
+    for response in pages:
+        for item in _page(response)[0]:
+            found.setdefault(_item_id(item), item)
+    result = ItemsByIds()
+    for item_id in ids:
+        item = found.get(item_id)
+        if item is None:
+            result.missing.append(item_id)
+        else:
+            result.items.append(item)
+    return result
+
 class ItemsModule(BaseModule):
-    def get_items(self, query: GetItemRequest) -> EmbyResponse[QueryResultBaseItemDto]:
+    def get_items(self, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> EmbyResponse[QueryResultBaseItemDto]:
         """
         GET /Items
 
@@ -38,21 +604,71 @@ class ItemsModule(BaseModule):
             * **200 OK**: Returns the fetched object.
         """
         endpoint = "/Items"
-        response = self._client.request("GET", endpoint, params=query.model_dump(by_alias=True, exclude_none=True))
-        data = QueryResultBaseItemDto.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        query, response_type = _projected(query, projection)
+        return self._client.request_model("GET", endpoint, response_type, validate=validate, response_format=response_format, params=query.model_dump(by_alias=True, exclude_none=True))
     
-    def iter_items(self, query: GetItemRequest, start: int = 0, page_size: int = 50, max_items: int | None = None) -> Iterator[BaseItemDto]:
-        yield from _paginate_items(
-            fetch=lambda start, limit: self.get_items(
-                query.model_copy(update={"start_index": start, "limit": limit})
-            ),
-            start=start,
-            page_size=page_size,
-            max_items = max_items
-        )
+    def iter_items(self, query: GetItemRequest, start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, pagination: Pagination = "offset", cursor: ItemsCursor | None = None, checkpoint: str | os.PathLike[str] | None = None, checkpoint_every: int = 1) -> Iterator[BaseItemDto]:
+        """
+        GET /Items
+
+        Yield every item matching `query`, one page at a time.
+
+        `pagination="offset"` pages with `StartIndex` and keeps the query's sort order.
+        `pagination="keyset"` sorts by `SortName` and seeks past the last name yielded,
+        which keeps deep pages as cheap as the first one and isn't thrown off by items
+        added or removed during the scan. It can't be combined with `start`, `prefetch`
+        or a query sorted by anything but `SortName` ascending; a `NameStartsWithOrGreater`
+        in the query sets where the scan begins.
+
+        An `ItemsCursor` passed as `cursor` tracks the position and resumes it when it
+        was used before. With `checkpoint`, the cursor is saved to that file every
+        `checkpoint_every` consumed pages and when `max_items` ends the scan, and a later call
+        without a `cursor` resumes from the file, so a restarted job skips the pages
+        it already processed. The file is deleted once the scan completes, so the
+        next call with the same `checkpoint` starts over.
+        """
+        response_format = _iter_format(response_format or self._client.response_format)
+        yield from _scan_items(lambda page_query, page_projection: self.get_items(page_query, validate, response_format, page_projection), "/Items", query, start, page_size, max_items, prefetch, read_ahead, projection, pagination, cursor, checkpoint, checkpoint_every)
     
-    def get_users_by_userid_items(self, user_id: str, query: GetItemRequest) -> EmbyResponse[QueryResultBaseItemDto]:
+    def stream_items(self, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, chunk_size: int = 65_536) -> Iterator[BaseItemDto]:
+        """
+        GET /Items
+
+        Like `get_items`, but parses the body incrementally and yields every item
+        as soon as it has been received, for pages too large to hold in memory.
+        """
+        endpoint = "/Items"
+        query, _ = _projected(query, projection)
+        yield from self._client.stream_items("GET", endpoint, _item_type(projection), validate=validate, response_format=response_format, chunk_size=chunk_size, params=query.model_dump(by_alias=True, exclude_none=True))
+
+    def get_items_by_ids(self, ids: Iterable[str], fields: ItemProjection | Iterable[str] | None = None, query: GetItemRequest | None = None, max_url_bytes: int = 4096, concurrency: int = 4, validate: bool | None = None, response_format: ResponseFormat | None = None) -> ItemsByIds:
+        """
+        GET /Items
+
+        Fetch many items by ID. The IDs are split into `Ids` chunks that keep every
+        request URL within `max_url_bytes`, and the chunks are fetched on up to
+        `concurrency` threads. `fields` (an `ItemProjection` or field names) limits
+        what is transferred and validated.
+
+        Returns:
+            * An `ItemsByIds` with the items in input order and the IDs that weren't found.
+        """
+        ids = list(dict.fromkeys(ids))
+        query = (query or GetItemRequest()).model_copy(update={"ids": None})
+        projection = _as_projection(fields)
+        params = _projected(query, projection)[0].model_dump(by_alias=True, exclude_none=True)
+        chunks = _id_chunks(ids, f"{self._client.base_url}/Items", params, max_url_bytes)
+        response_format = _iter_format(response_format or self._client.response_format)
+
+        def fetch(chunk: list[str]) -> Any:
+            return self.get_items(query.model_copy(update={"ids": ",".join(chunk)}), validate, response_format, projection)
+
+        if concurrency <= 1 or len(chunks) <= 1:
+            return _merge_by_ids(ids, map(fetch, chunks))
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks)), thread_name_prefix="remby-ids") as pool:
+            return _merge_by_ids(ids, pool.map(fetch, chunks))
+
+    def get_users_by_userid_items(self, user_id: str, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> EmbyResponse[QueryResultBaseItemDto]:
         """
         GET /Users/{UserId}/Items
 
@@ -62,22 +678,170 @@ class ItemsModule(BaseModule):
             * **200 OK**: Returns a list of items associated with this user.
         """
         endpoint = f"/Users/{user_id}/Items"
-        response = self._client.request("GET", endpoint, params=query.model_dump(by_alias=True, exclude_none=True))
-        data = QueryResultBaseItemDto.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        query, response_type = _projected(query, projection)
+        return self._client.request_model("GET", endpoint, response_type, validate=validate, response_format=response_format, params=query.model_dump(by_alias=True, exclude_none=True))
+
+    def iter_items_by_userid(self, user_id: str, query: GetItemRequest, start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, pagination: Pagination = "offset", cursor: ItemsCursor | None = None, checkpoint: str | os.PathLike[str] | None = None, checkpoint_every: int = 1) -> Iterator[BaseItemDto]:
+        """
+        GET /Users/{UserId}/Items
+
+        Like `iter_items`, but scans the items visible to `user_id`. Takes the same
+        pagination, cursor and checkpoint options.
+        """
+        response_format = _iter_format(response_format or self._client.response_format)
+        yield from _scan_items(lambda page_query, page_projection: self.get_users_by_userid_items(user_id, page_query, validate, response_format, page_projection), f"/Users/{user_id}/Items", query, start, page_size, max_items, prefetch, read_ahead, projection, pagination, cursor, checkpoint, checkpoint_every)
+    
+    def stream_items_by_userid(self, user_id: str, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, chunk_size: int = 65_536) -> Iterator[BaseItemDto]:
+        """
+        GET /Users/{UserId}/Items
+
+        Like `get_users_by_userid_items`, but yields every item as soon as it has been received.
+        """
+        endpoint = f"/Users/{user_id}/Items"
+        query, _ = _projected(query, projection)
+        yield from self._client.stream_items("GET", endpoint, _item_type(projection), validate=validate, response_format=response_format, chunk_size=chunk_size, params=query.model_dump(by_alias=True, exclude_none=True))
+
+    def get_users_by_userid_items_resume(self, user_id: str, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> EmbyResponse[QueryResultBaseItemDto]:
+        """
+        GET /Users/{UserId}/Items
+
+        Gets items that are on the "Continue Watching" list for a specific user.
 
-    def iter_items_by_userid(self, user_id: str, query: GetItemRequest, start: int = 0, page_size: int = 50, max_items: int | None = None) -> Iterator[BaseItemDto]:
+        Returns:
+            * **200 OK**: Returns a list of items on resume.
+        """
+        endpoint = f"/Users/{user_id}/Items/Resume"
+        query, response_type = _projected(query, projection)
+        return self._client.request_model("GET", endpoint, response_type, validate=validate, response_format=response_format, params=query.model_dump(by_alias=True, exclude_none=True))
+
+    def iter_items_by_userid_resume(self, user_id: str, query: GetItemRequest, start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> Iterator[BaseItemDto]:
         yield from _paginate_items(
-            fetch=lambda start, limit: self.get_users_by_userid_items(
+            fetch=lambda start, limit: self.get_users_by_userid_items_resume(
                 user_id,
-                query.model_copy(update={"start_index": start, "limit": limit})
+                query.model_copy(update={"start_index": start, "limit": limit}),
+                validate,
+                _iter_format(response_format or self._client.response_format),
+                projection
             ),
             start=start,
             page_size=page_size,
-            max_items = max_items
+            max_items = max_items,
+            prefetch=prefetch,
+            read_ahead=read_ahead
         )
-    
-    def get_users_by_userid_items_resume(self, user_id: str, query: GetItemRequest) -> EmbyResponse[QueryResultBaseItemDto]:
+
+class AsyncItemsModule(AsyncBaseModule):
+    async def get_items(self, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> EmbyResponse[QueryResultBaseItemDto]:
+        """
+        GET /Items
+
+        Get an item based on a query.
+
+        Returns:
+            * **200 OK**: Returns the fetched object.
+        """
+        endpoint = "/Items"
+        query, response_type = _projected(query, projection)
+        return await self._client.request_model("GET", endpoint, response_type, validate=validate, response_format=response_format, params=query.model_dump(by_alias=True, exclude_none=True))
+
+    async def iter_items(self, query: GetItemRequest, start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, pagination: Pagination = "offset", cursor: ItemsCursor | None = None, checkpoint: str | os.PathLike[str] | None = None, checkpoint_every: int = 1) -> AsyncIterator[BaseItemDto]:
+        """
+        GET /Items
+
+        Yield every item matching `query`, one page at a time.
+
+        `pagination="offset"` pages with `StartIndex` and keeps the query's sort order.
+        `pagination="keyset"` sorts by `SortName` and seeks past the last name yielded,
+        which keeps deep pages as cheap as the first one and isn't thrown off by items
+        added or removed during the scan. It can't be combined with `start`, `prefetch`
+        or a query sorted by anything but `SortName` ascending; a `NameStartsWithOrGreater`
+        in the query sets where the scan begins.
+
+        An `ItemsCursor` passed as `cursor` tracks the position and resumes it when it
+        was used before. With `checkpoint`, the cursor is saved to that file every
+        `checkpoint_every` consumed pages and when `max_items` ends the scan, and a later call
+        without a `cursor` resumes from the file, so a restarted job skips the pages
+        it already processed. The file is deleted once the scan completes, so the
+        next call with the same `checkpoint` starts over.
+        """
+        response_format = _iter_format(response_format or self._client.response_format)
+        async for item in _ascan_items(lambda page_query, page_projection: self.get_items(page_query, validate, response_format, page_projection), "/Items", query, start, page_size, max_items, prefetch, read_ahead, projection, pagination, cursor, checkpoint, checkpoint_every):
+            yield item
+
+    async def stream_items(self, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, chunk_size: int = 65_536) -> AsyncIterator[BaseItemDto]:
+        """
+        GET /Items
+
+        Like `get_items`, but parses the body incrementally and yields every item
+        as soon as it has been received, for pages too large to hold in memory.
+        """
+        endpoint = "/Items"
+        query, _ = _projected(query, projection)
+        async for item in self._client.stream_items("GET", endpoint, _item_type(projection), validate=validate, response_format=response_format, chunk_size=chunk_size, params=query.model_dump(by_alias=True, exclude_none=True)):
+            yield item
+
+    async def get_items_by_ids(self, ids: Iterable[str], fields: ItemProjection | Iterable[str] | None = None, query: GetItemRequest | None = None, max_url_bytes: int = 4096, concurrency: int = 4, validate: bool | None = None, response_format: ResponseFormat | None = None) -> ItemsByIds:
+        """
+        GET /Items
+
+        Fetch many items by ID. The IDs are split into `Ids` chunks that keep every
+        request URL within `max_url_bytes`, and up to `concurrency` chunks are
+        requested at once. `fields` (an `ItemProjection` or field names) limits
+        what is transferred and validated.
+
+        Returns:
+            * An `ItemsByIds` with the items in input order and the IDs that weren't found.
+        """
+        ids = list(dict.fromkeys(ids))
+        query = (query or GetItemRequest()).model_copy(update={"ids": None})
+        projection = _as_projection(fields)
+        params = _projected(query, projection)[0].model_dump(by_alias=True, exclude_none=True)
+        chunks = _id_chunks(ids, f"{self._client.base_url}/Items", params, max_url_bytes)
+        response_format = _iter_format(response_format or self._client.response_format)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(chunk: list[str]) -> Any:
+            async with semaphore:
+                return await self.get_items(query.model_copy(update={"ids": ",".join(chunk)}), validate, response_format, projection)
+
+        return _merge_by_ids(ids, await asyncio.gather(*(fetch(chunk) for chunk in chunks)))
+
+    async def get_users_by_userid_items(self, user_id: str, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> EmbyResponse[QueryResultBaseItemDto]:
+        """
+        GET /Users/{UserId}/Items
+
+        Appears to get items for a specific user account by UserId.
+
+        Returns:
+            * **200 OK**: Returns a list of items associated with this user.
+        """
+        endpoint = f"/Users/{user_id}/Items"
+        query, response_type = _projected(query, projection)
+        return await self._client.request_model("GET", endpoint, response_type, validate=validate, response_format=response_format, params=query.model_dump(by_alias=True, exclude_none=True))
+
+    async def iter_items_by_userid(self, user_id: str, query: GetItemRequest, start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, pagination: Pagination = "offset", cursor: ItemsCursor | None = None, checkpoint: str | os.PathLike[str] | None = None, checkpoint_every: int = 1) -> AsyncIterator[BaseItemDto]:
+        """
+        GET /Users/{UserId}/Items
+
+        Like `iter_items`, but scans the items visible to `user_id`. Takes the same
+        pagination, cursor and checkpoint options.
+        """
+        response_format = _iter_format(response_format or self._client.response_format)
+        async for item in _ascan_items(lambda page_query, page_projection: self.get_users_by_userid_items(user_id, page_query, validate, response_format, page_projection), f"/Users/{user_id}/Items", query, start, page_size, max_items, prefetch, read_ahead, projection, pagination, cursor, checkpoint, checkpoint_every):
+            yield item
+
+    async def stream_items_by_userid(self, user_id: str, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None, chunk_size: int = 65_536) -> AsyncIterator[BaseItemDto]:
+        """
+        GET /Users/{UserId}/Items
+
+        Like `get_users_by_userid_items`, but yields every item as soon as it has been received.
+        """
+        endpoint = f"/Users/{user_id}/Items"
+        query, _ = _projected(query, projection)
+        async for item in self._client.stream_items("GET", endpoint, _item_type(projection), validate=validate, response_format=response_format, chunk_size=chunk_size, params=query.model_dump(by_alias=True, exclude_none=True)):
+            yield item
+
+    async def get_users_by_userid_items_resume(self, user_id: str, query: GetItemRequest, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> EmbyResponse[QueryResultBaseItemDto]:
         """
         GET /Users/{UserId}/Items
 
@@ -87,17 +851,22 @@ class ItemsModule(BaseModule):
             * **200 OK**: Returns a list of items on resume.
         """
         endpoint = f"/Users/{user_id}/Items/Resume"
-        response = self._client.request("GET", endpoint, params=query.model_dump(by_alias=True, exclude_none=True))
-        data = QueryResultBaseItemDto.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        query, response_type = _projected(query, projection)
+        return await self._client.request_model("GET", endpoint, response_type, validate=validate, response_format=response_format, params=query.model_dump(by_alias=True, exclude_none=True))
 
-    def iter_items_by_userid_resume(self, user_id: str, query: GetItemRequest, start: int = 0, page_size: int = 50, max_items: int | None = None) -> Iterator[BaseItemDto]:
-        yield from _paginate_items(
+    async def iter_items_by_userid_resume(self, user_id: str, query: GetItemRequest, start: int = 0, page_size: int | AdaptivePageSize = 50, max_items: int | None = None, prefetch: int = 0, read_ahead: int | None = None, validate: bool | None = None, response_format: ResponseFormat | None = None, projection: ItemProjection | None = None) -> AsyncIterator[BaseItemDto]:
+        async for item in _apaginate_items(
             fetch=lambda start, limit: self.get_users_by_userid_items_resume(
                 user_id,
-                query.model_copy(update={"start_index": start, "limit": limit})
+                query.model_copy(update={"start_index": start, "limit": limit}),
+                validate,
+                _iter_format(response_format or self._client.response_format),
+                projection
             ),
             start=start,
             page_size=page_size,
-            max_items = max_items
-        )
\ No newline at end of file
+            max_items=max_items,
+            prefetch=prefetch,
+            read_ahead=read_ahead
+        ):
+            yield item
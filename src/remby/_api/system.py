@@ -1,12 +1,15 @@
-from typing import List, Optional
+from __future__ import annotations
 
-from pydantic import TypeAdapter
+from typing import TYPE_CHECKING, List, Optional
 
-from remby._api.base import BaseModule
+from remby._api.base import AsyncBaseModule, BaseModule
+from remby.models import emby
 from remby.models.emby.Net import EndPointInfo
-from remby.models.emby._internal import PackageVersionInfo, PublicSystemInfo, QueryResultString, SystemInfo, WakeOnLanInfo
 from remby.models.response import EmbyResponse
 
+if TYPE_CHECKING:
+    from remby.models.emby._internal import PackageVersionInfo, PublicSystemInfo, QueryResultString, SystemInfo, WakeOnLanInfo
+
 class SystemModule(BaseModule):
     def get_system_ping(self) -> str:
         """
@@ -32,9 +35,7 @@ class SystemModule(BaseModule):
             * **200 OK**: Returns a dict with is_local and is_in_network.
         """
         endpoint = "/System/Endpoint"
-        response = self._client.request("GET", endpoint)
-        data = EndPointInfo.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, EndPointInfo)
     
     def get_system_info(self) -> EmbyResponse[SystemInfo]:
         """
@@ -46,9 +47,7 @@ class SystemModule(BaseModule):
             * **200 OK**: Returns the api-only-accesible system info.
         """
         endpoint = "/System/Info"
-        response = self._client.request("GET", endpoint)
-        data = SystemInfo.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, emby.SystemInfo)
     
     def get_system_info_public(self) -> EmbyResponse[PublicSystemInfo]:
         """
@@ -60,9 +59,7 @@ class SystemModule(BaseModule):
             * **200 OK**: Returns the publicly available system info.
         """
         endpoint = "/System/Info/Public"
-        response = self._client.request("GET", endpoint)
-        data = PublicSystemInfo.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, emby.PublicSystemInfo)
     
     def get_system_logs_by_name(self, name: str) -> str:
         """
@@ -92,13 +89,10 @@ class SystemModule(BaseModule):
             These are however required to prevent returning an empty array!
         """
         endpoint = f"/System/Logs/{name}/Lines"
-        response = self._client.request("GET", endpoint, params={
+        return self._client.request_model("GET", endpoint, emby.QueryResultString, params={
             "StartIndex": start_index,
             "Limit": limit
         })
-        
-        data = QueryResultString.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
 
     def get_system_logs_query(self, start_index: int = 0, limit: int = 100) -> EmbyResponse[QueryResultString]:
         """
@@ -110,13 +104,10 @@ class SystemModule(BaseModule):
             * **200 OK**: Returns a text string containing all server logs between the lines of `start_index` and `limit`.
         """
         endpoint = f"/System/Logs/Query"
-        response = self._client.request("GET", endpoint, params={
+        return self._client.request_model("GET", endpoint, emby.QueryResultString, params={
             "StartIndex": start_index,
             "Limit": limit
         })
-        
-        data = QueryResultString.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
 
     def get_system_releasenotes(self) -> EmbyResponse[Optional[PackageVersionInfo]]:
         """
@@ -129,13 +120,7 @@ class SystemModule(BaseModule):
             * **204 NO CONTENT**: Returns None if no release notes are available.
         """
         endpoint = f"/System/ReleaseNotes"
-        response = self._client.request("GET", endpoint)
-
-        if response.status_code == 204:
-            return EmbyResponse.from_httpx(response, None)
-        
-        data = PackageVersionInfo.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, emby.PackageVersionInfo)
     
     def get_system_releasenotes_versions(self) -> EmbyResponse[Optional[List[PackageVersionInfo]]]:
         """
@@ -147,14 +132,7 @@ class SystemModule(BaseModule):
             * **200 OK**: Returns a list of all release note versions.
         """
         endpoint = f"/System/ReleaseNotes/Versions"
-        response = self._client.request("GET", endpoint)
-
-        if response.status_code == 204:
-            return EmbyResponse.from_httpx(response, None)
-
-        adapter = TypeAdapter(List[PackageVersionInfo])
-        data = adapter.validate_python(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, List[emby.PackageVersionInfo])
 
     def get_system_wakeonlaninfo(self) -> EmbyResponse[Optional[List[WakeOnLanInfo]]]:
         """
@@ -166,14 +144,7 @@ class SystemModule(BaseModule):
             * **200 OK**: Returns a list of WakeOnLan devices.
         """
         endpoint = f"/System/WakeOnLanInfo"
-        response = self._client.request("GET", endpoint)
-        
-        if response.status_code == 204:
-            return EmbyResponse.from_httpx(response, None)
-
-        adapter = TypeAdapter(List[WakeOnLanInfo])
-        data = adapter.validate_python(response.json())
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, List[emby.WakeOnLanInfo])
 
     def head_system_ping(self) -> bool:
         """
@@ -231,4 +202,196 @@ class SystemModule(BaseModule):
         response = self._client.request("POST", endpoint)
         
         return response.status_code == 200
-    
\ No newline at end of file
+
+class AsyncSystemModule(AsyncBaseModule):
+    async def get_system_ping(self) -> str:
+        """
+        GET /System/Ping
+
+        Ping the Emby API system.
+
+        Returns:
+            * **200 OK**: Returns a text string with "Emby Server".
+        """
+        endpoint = "/System/Ping"
+        response = await self._client.request("GET", endpoint)
+        
+        return response.text
+    
+    async def get_system_endpoint(self) -> EmbyResponse[EndPointInfo]:
+        """
+        GET /System/Endpoint
+
+        Check whether the emby server is in the network or on the local machine.
+
+        Returns:
+            * **200 OK**: Returns a dict with is_local and is_in_network.
+        """
+        endpoint = "/System/Endpoint"
+        return await self._client.request_model("GET", endpoint, EndPointInfo)
+    
+    async def get_system_info(self) -> EmbyResponse[SystemInfo]:
+        """
+        GET /System/Info
+
+        Get api-key-only information about the system Emby is running on.
+
+        Returns:
+            * **200 OK**: Returns the api-only-accesible system info.
+        """
+        endpoint = "/System/Info"
+        return await self._client.request_model("GET", endpoint, emby.SystemInfo)
+    
+    async def get_system_info_public(self) -> EmbyResponse[PublicSystemInfo]:
+        """
+        GET /System/Info/Public
+
+        Get public information about the system Emby is running on.
+
+        Returns:
+            * **200 OK**: Returns the publicly available system info.
+        """
+        endpoint = "/System/Info/Public"
+        return await self._client.request_model("GET", endpoint, emby.PublicSystemInfo)
+    
+    async def get_system_logs_by_name(self, name: str) -> str:
+        """
+        GET /System/Logs/{name}
+
+        Get server logs by the specified name.
+
+        Returns:
+            * **200 OK**: Returns a text string containing the server logs.
+        """
+        endpoint = f"/System/Logs/{name}"
+        response = await self._client.request("GET", endpoint)
+        
+        return response.text
+    
+    async def get_system_logs_lines_by_name(self, name: str, start_index: int = 0, limit: int = 100) -> EmbyResponse[QueryResultString]:
+        """
+        GET /System/Logs/{name}/Lines
+
+        Get server logs by the specified name between the lines of `start_index` and `limit`.
+
+        Returns:
+            * **200 OK**: Returns a text string containing the server logs between the lines of `start_index` and `limit`.
+        
+        Notes:
+            The Emby documentation does not include the usage of pagination parameters.
+            These are however required to prevent returning an empty array!
+        """
+        endpoint = f"/System/Logs/{name}/Lines"
+        return await self._client.request_model("GET", endpoint, emby.QueryResultString, params={
+            "StartIndex": start_index,
+            "Limit": limit
+        })
+
+    async def get_system_logs_query(self, start_index: int = 0, limit: int = 100) -> EmbyResponse[QueryResultString]:
+        """
+        GET /System/Logs/Query
+
+        Get all server logs between the lines of `start_index` and `limit`.
+
+        Returns:
+            * **200 OK**: Returns a text string containing all server logs between the lines of `start_index` and `limit`.
+        """
+        endpoint = f"/System/Logs/Query"
+        return await self._client.request_model("GET", endpoint, emby.QueryResultString, params={
+            "StartIndex": start_index,
+            "Limit": limit
+        })
+
+    async def get_system_releasenotes(self) -> EmbyResponse[Optional[PackageVersionInfo]]:
+        """
+        GET /System/ReleaseNotes
+
+        Get a list of all release notes.
+
+        Returns:
+            * **200 OK**: Returns a list of all release notes.
+            * **204 NO CONTENT**: Returns None if no release notes are available.
+        """
+        endpoint = f"/System/ReleaseNotes"
+        return await self._client.request_model("GET", endpoint, emby.PackageVersionInfo)
+    
+    async def get_system_releasenotes_versions(self) -> EmbyResponse[Optional[List[PackageVersionInfo]]]:
+        """
+        GET /System/ReleaseNotes/Versions
+
+        Get a list of all release note versions.
+
+        Returns:
+            * **200 OK**: Returns a list of all release note versions.
+        """
+        endpoint = f"/System/ReleaseNotes/Versions"
+        return await self._client.request_model("GET", endpoint, List[emby.PackageVersionInfo])
+
+    async def get_system_wakeonlaninfo(self) -> EmbyResponse[Optional[List[WakeOnLanInfo]]]:
+        """
+        GET /System/WakeOnLanInfo
+
+        Get a list of WakeOnLan devices.
+
+        Returns:
+            * **200 OK**: Returns a list of WakeOnLan devices.
+        """
+        endpoint = f"/System/WakeOnLanInfo"
+        return await self._client.request_model("GET", endpoint, List[emby.WakeOnLanInfo])
+
+    async def head_system_ping(self) -> bool:
+        """
+        HEAD /System/Ping
+
+        Ping the Emby API system without receiving a response text.\n
+        Use this for lightweight up-checking of the Emby server.
+
+        Returns:
+            * **200 OK**: Returns the success bool.
+        """
+        endpoint = f"/System/Ping"
+        response = await self._client.request("HEAD", endpoint)
+        
+        return response.status_code == 200
+
+    async def post_system_ping(self) -> str:
+        """
+        POST /System/Ping
+
+        Ping the Emby API system.
+
+        Returns:
+            * **200 OK**: Returns a text string with "Emby Server".
+        """
+        endpoint = "/System/Ping"
+        response = await self._client.request("POST", endpoint)
+        
+        return response.text
+    
+    async def post_system_restart(self) -> bool:
+        """
+        POST /System/Restart
+
+        Restart the server that Emby is running on.
+
+        Returns:
+            * **200 OK**: Returns the success bool.
+        """
+        endpoint = "/System/Restart"
+        response = await self._client.request("POST", endpoint)
+        
+        return response.status_code == 200
+
+    async def post_system_shutdown(self) -> bool:
+        """
+        POST /System/Shutdown
+
+        Shut down the server that Emby is running on.
+
+        Returns:
+            * **200 OK**: Returns the success bool.
+        """
+        endpoint = "/System/Shutdown"
+        response = await self._client.request("POST", endpoint)
+        
+        return response.status_code == 200
@@ -1,9 +1,14 @@
-from typing import List
+from __future__ import annotations
 
-from remby._api.base import BaseModule
-from remby.models.emby._internal import UserDto
+from typing import TYPE_CHECKING, List
+
+from remby._api.base import AsyncBaseModule, BaseModule
+from remby.models import emby
 from remby.models.response import EmbyResponse
 
+if TYPE_CHECKING:
+    from remby.models.emby._internal import UserDto
+
 
 class UsersModule(BaseModule):
     def get_users_public(self) -> EmbyResponse[List[UserDto]]:
@@ -16,9 +21,7 @@ class UsersModule(BaseModule):
             * **200 OK**: Returns the parsed list of User objects.
         """
         endpoint = "/Users/Public"
-        response = self._client.request("GET", endpoint)
-        data = [UserDto.model_validate(item) for item in response.json()]
-        return EmbyResponse.from_httpx(response, data)
+        return self._client.request_model("GET", endpoint, List[emby.UserDto])
     
     def get_users_by_id(self, user_id: str) -> EmbyResponse[UserDto]:
         """
@@ -30,6 +33,30 @@ class UsersModule(BaseModule):
             * **200 OK**: Returns the User object.
         """
         endpoint = f"/Users/{user_id}"
-        response = self._client.request("GET", endpoint)
-        data = UserDto.model_validate(response.json())
-        return EmbyResponse.from_httpx(response, data)
\ No newline at end of file
+        return self._client.request_model("GET", endpoint, emby.UserDto)
+
+
+class AsyncUsersModule(AsyncBaseModule):
+    async def get_users_public(self) -> EmbyResponse[List[UserDto]]:
+        """
+        GET /Users/Public
+
+        Get all public users.
+
+        Returns:
+            * **200 OK**: Returns the parsed list of User objects.
+        """
+        endpoint = "/Users/Public"
+        return await self._client.request_model("GET", endpoint, List[emby.UserDto])
+
+    async def get_users_by_id(self, user_id: str) -> EmbyResponse[UserDto]:
+        """
+        GET /Users/{Id}
+
+        Get a user by id.
+
+        Returns:
+            * **200 OK**: Returns the User object.
+        """
+        endpoint = f"/Users/{user_id}"
+        return await self._client.request_model("GET", endpoint, emby.UserDto)
@@ -0,0 +1,178 @@
+from datetime import datetime
+from os import PathLike
+from typing import Any, Callable, Iterable, Iterator, Literal
+
+from pydantic import BaseModel
+
+from remby.models.lazy import LazyModel
+from remby.models.projection import ItemProjection
+
+ArrowFormat = Literal["parquet", "ipc"]
+
+def _load_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Arrow export requires the pyarrow package, install it with `pip install remby[arrow]`") from e
+    return pyarrow
+
+def _timestamp(value: Any) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+def _provider_ids(value: Any) -> list[tuple[str, str]] | None:
+    return list(value.items()) if value else None
+
+def _media_sources(value: Any) -> list[dict[str, Any]] | None:
+    if value is None:
+        return None
+    return [
+        {
+            "id": source.get("Id"),
+            "path": source.get("Path"),
+            "container": source.get("Container"),
+            "size": source.get("Size"),
+            "bitrate": source.get("Bitrate"),
+            "run_time_ticks": source.get("RunTimeTicks")
+        }
+        for source in value
+    ]
+
+# (column/BaseItemDto field, JSON key, arrow type, converter). The order is the schema order
+# and must only ever be appended to, so files written by different versions stay compatible.
+_COLUMNS: list[tuple[str, str, Callable[[Any], Any], Callable[[Any], Any] | None]] = [
+    ("id", "Id", lambda pa: pa.string(), None),
+    ("name", "Name", lambda pa: pa.string(), None),
+    ("type", "Type", lambda pa: pa.dictionary(pa.int32(), pa.string()), None),
+    ("media_type", "MediaType", lambda pa: pa.dictionary(pa.int32(), pa.string()), None),
+    ("parent_id", "ParentId", lambda pa: pa.string(), None),
+    ("series_id", "SeriesId", lambda pa: pa.string(), None),
+    ("path", "Path", lambda pa: pa.string(), None),
+    ("sort_name", "SortName", lambda pa: pa.string(), None),
+    ("container", "Container", lambda pa: pa.string(), None),
+    ("is_folder", "IsFolder", lambda pa: pa.bool_(), None),
+    ("production_year", "ProductionYear", lambda pa: pa.int32(), None),
+    ("index_number", "IndexNumber", lambda pa: pa.int32(), None),
+    ("parent_index_number", "ParentIndexNumber", lambda pa: pa.int32(), None),
+    ("official_rating", "OfficialRating", lambda pa: pa.string(), None),
+    ("community_rating", "CommunityRating", lambda pa: pa.float64(), None),
+    ("run_time_ticks", "RunTimeTicks", lambda pa: pa.int64(), None),
+    ("size", "Size", lambda pa: pa.int64(), None),
+    ("date_created", "DateCreated", lambda pa: pa.timestamp("us", tz="UTC"), _timestamp),
+    ("date_modified", "DateModified", lambda pa: pa.timestamp("us", tz="UTC"), _timestamp),
+    ("premiere_date", "PremiereDate", lambda pa: pa.timestamp("us", tz="UTC"), _timestamp),
+    ("genres", "Genres", lambda pa: pa.list_(pa.string()), None),
+    ("tags", "Tags", lambda pa: pa.list_(pa.string()), None),
+    ("provider_ids", "ProviderIds", lambda pa: pa.map_(pa.string(), pa.string()), _provider_ids),
+    ("media_sources", "MediaSources", lambda pa: pa.list_(pa.struct([
+        ("id", pa.string()),
+        ("path", pa.string()),
+        ("container", pa.string()),
+        ("size", pa.int64()),
+        ("bitrate", pa.int64()),
+        ("run_time_ticks", pa.int64())
+    ])), _media_sources)
+]
+
+def __getattr__(name: str) -> Any:
+    # `ARROW_PROJECTION` transfers one field per schema column. Projections load the
+    # generated models, so it is created on first access and then kept as a global.
+    if name == "ARROW_PROJECTION":
+        value = globals()[name] = ItemProjection(*(column for column, _, _, _ in _COLUMNS))
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def item_schema() -> Any:
+    """Return the `pyarrow.Schema` of exported items."""
+    pa = _load_pyarrow()
+    return pa.schema([(column, type_(pa)) for column, _, type_, _ in _COLUMNS])
+
+def _item_json(item: Any) -> dict[str, Any]:
+    if isinstance(item, dict):
+        return item
+    if isinstance(item, LazyModel):
+        return item.raw
+    if isinstance(item, BaseModel):
+        return item.model_dump(mode="json", by_alias=True, exclude_none=True)
+    raise TypeError(f"Cannot export {type(item).__name__} as an item")
+
+def item_columns(items: Iterable[Any]) -> dict[str, list[Any]]:
+    """Turn items into a dict of column lists matching `item_schema()`."""
+    columns: dict[str, list[Any]] = {column: [] for column, _, _, _ in _COLUMNS}
+    for item in items:
+        data = _item_json(item)
+        for column, key, _, convert in _COLUMNS:
+            value = data.get(key)
+            columns[column].append(convert(value) if convert and value is not None else value)
+    return columns
+
+def item_record_batches(items: Iterable[Any], batch_size: int = 10_000) -> Iterator[Any]:
+    """
+    Yield `pyarrow.RecordBatch`es of `batch_size` rows (the last one may be shorter).
+
+    Only one batch worth of items is buffered at a time.
+    """
+    pa = _load_pyarrow()
+    schema = item_schema()
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield pa.RecordBatch.from_pydict(item_columns(batch), schema=schema)
+            batch = []
+    if batch:
+        yield pa.RecordBatch.from_pydict(item_columns(batch), schema=schema)
+
+class ArrowItemWriter:
+    """
+    Streams items into a Parquet or Arrow IPC file in fixed-size row groups.
+
+    Items can be `BaseItemDto`s, `LazyModel`s or plain dicts. The cheapest source is
+    `iter_items(query, response_format="dict", projection=remby.ARROW_PROJECTION)`, which
+    skips model construction and only transfers the exported fields. Every
+    `row_group_size` items are written out as one Parquet row group (or IPC record
+    batch), so memory stays bounded regardless of the library size.
+    """
+    def __init__(self, path: str | PathLike[str], format: ArrowFormat = "parquet", row_group_size: int = 10_000, compression: str | None = "zstd") -> None:
+        if row_group_size < 1:
+            raise ValueError("ArrowItemWriter.row_group_size must be at least 1")
+        self._pa = pa = _load_pyarrow()
+        self.schema = item_schema()
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._pending: list[Any] = []
+        if format == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema, compression=compression or "none")
+        elif format == "ipc":
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+        else:
+            raise ValueError(f"Unknown Arrow format: {format!r}")
+
+    def write(self, items: Iterable[Any]) -> None:
+        """
+        Buffer `items` and write out every full row group.
+
+        A trailing partial row group is kept until the next call or `close()`.
+        """
+        for item in items:
+            self._pending.append(item)
+            if len(self._pending) >= self.row_group_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        self._writer.write_batch(self._pa.RecordBatch.from_pydict(item_columns(self._pending), schema=self.schema))
+        self.rows += len(self._pending)
+        self._pending = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ArrowItemWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
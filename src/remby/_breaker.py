@@ -0,0 +1,83 @@
+from enum import Enum
+import threading
+import time
+
+from remby.exceptions import CircuitOpenError
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """
+    Client-side circuit breaker for an Emby server.
+
+    After `failure_threshold` consecutive failures (timeouts, other transport errors
+    or 5xx responses) the circuit opens and every request fails fast with
+    `CircuitOpenError`. Once `recovery_timeout` seconds have passed, the next request
+    is held back while the client probes the server with `HEAD /System/Ping`:
+    a healthy probe closes the circuit, a failed one keeps it open for another
+    `recovery_timeout`.
+    """
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError("CircuitBreaker.failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._failures
+
+    def before_request(self) -> bool:
+        """
+        Raise `CircuitOpenError` while the circuit is open.
+
+        Returns `True` if the caller has been elected to probe the server before
+        its request may be sent, `False` if the request can go out right away.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return False
+            if self._state is CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._state = CircuitState.HALF_OPEN
+                return True
+            remaining = max(self.recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+        raise CircuitOpenError(f"Circuit open after {self._failures} consecutive failures, retry in {remaining:.1f}s")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def record_probe(self, healthy: bool) -> None:
+        with self._lock:
+            if healthy:
+                self._state = CircuitState.CLOSED
+                self._failures = 0
+            else:
+                self._open()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
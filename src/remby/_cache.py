@@ -0,0 +1,300 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Mapping
+from urllib.parse import urlencode
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from remby._sqlite import SQLiteConnections, transaction
+
+def cache_key(method: str, endpoint: str, params: Mapping[str, Any] | None = None, response_type: Any = None) -> str:
+    """
+    Build a stable cache key from the method, endpoint and canonicalized query params.
+
+    Caches holding validated objects also pass the `response_type`, since the same
+    request can be validated into different models (e.g. a projection's slim page).
+    """
+    query = urlencode(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+    key = f"{method.upper()} {endpoint}?{query}"
+    if response_type is None:
+        return key
+    name = f"{response_type.__module__}.{response_type.__qualname__}" if isinstance(response_type, type) else repr(response_type)
+    return f"{key} -> {name}"
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response.
+
+    `data` holds the validated object. Backends that can't keep Python objects
+    around store the raw body in `content` instead and leave `data` as `None`.
+    Entries whose response carried an `ETag` or `Last-Modified` header can be
+    revalidated with a conditional request once they are stale.
+    """
+    endpoint: str
+    status_code: int
+    headers: dict[str, str]
+    expires_at: float
+    size: int
+    data: Any = None
+    content: bytes | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    revalidations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+class ResponseCache(ABC):
+    """
+    Base class for response caches attached to `EmbyClient(cache=...)`.
+
+    Only GET requests to endpoints matching one of the glob patterns in `ttls`
+    are cached, for the number of seconds given. `default_ttl` applies to all
+    other endpoints; leave it at `None` to only cache the configured ones.
+
+    Backends that keep validated objects set `stores_objects`; all others receive
+    entries carrying the raw response body in `CacheEntry.content`.
+    """
+    stores_objects = True
+
+    def __init__(self, ttls: Mapping[str, float] | None = None, default_ttl: float | None = None) -> None:
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Return the entry stored under `key`, or `None`.
+
+        Stale entries are only returned if they can be revalidated; they count as a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store `entry` under `key`, evicting older entries if needed."""
+
+    @abstractmethod
+    def invalidate(self, pattern: str = "*") -> int:
+        """Drop all entries whose endpoint matches the glob `pattern` and return how many were dropped."""
+
+    def clear(self) -> None:
+        self.invalidate("*")
+
+class MemoryCache(ResponseCache):
+    """
+    In-memory LRU cache of validated response objects.
+
+    Cache hits return the already-validated Pydantic objects, so they skip both the
+    network round trip and JSON parsing. Callers share these objects and must not
+    mutate them. The cache is bounded by `max_bytes`, measured as the size of the
+    response bodies the entries were parsed from.
+    """
+    def __init__(self, ttls: Mapping[str, float] | None = None, default_ttl: float | None = None, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__(ttls, default_ttl)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.record("misses")
+                return None
+            self._entries.move_to_end(key)
+            if not entry.is_fresh:
+                self.stats.record("misses")
+                if entry.revalidatable:
+                    return entry
+                self._remove(key)
+                self.stats.record("expirations")
+                return None
+        self.stats.record("hits")
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.record("evictions")
+
+    def invalidate(self, pattern: str = "*") -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if fnmatchcase(entry.endpoint, pattern)]
+            for key in keys:
+                self._remove(key)
+        self.stats.record("invalidations", len(keys))
+        return len(keys)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent response cache backed by a local SQLite file.
+
+    Entries survive process restarts, so short-lived workers can start warm. Response
+    bodies are stored as-is and validated again on a hit. The file runs in WAL mode and
+    may be shared by several processes; every thread gets its own connection. Once the
+    stored bodies exceed `max_bytes`, the least recently used entries are evicted.
+    """
+    stores_objects = False
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            endpoint TEXT NOT NULL,
+            status_code INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            content BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            revalidatable INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+    """
+
+    def __init__(self, path: str | os.PathLike[str], ttls: Mapping[str, float] | None = None, default_ttl: float | None = None, max_bytes: int = 256 * 1024 * 1024, busy_timeout: float = 10.0) -> None:
+        super().__init__(ttls, default_ttl)
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self._connections = SQLiteConnections(self.path, busy_timeout)
+        self._connections.get().executescript(self._SCHEMA)
+
+    @property
+    def size(self) -> int:
+        row = self._connections.get().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    def __len__(self) -> int:
+        return int(self._connections.get().execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def get(self, key: str) -> CacheEntry | None:
+        connection = self._connections.get()
+        row = connection.execute(
+            "SELECT endpoint, status_code, headers, content, size, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats.record("misses")
+            return None
+        endpoint, status_code, headers, content, size, expires_at = row
+        entry = CacheEntry(
+            endpoint=endpoint,
+            status_code=status_code,
+            headers=json.loads(headers),
+            expires_at=expires_at,
+            size=size,
+            content=content,
+        )
+        now = time.time()
+        if not entry.is_fresh:
+            self.stats.record("misses")
+            if entry.revalidatable:
+                return entry
+            connection.execute("DELETE FROM responses WHERE key = ? AND expires_at <= ?", (key, now))
+            self.stats.record("expirations")
+            return None
+        connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.record("hits")
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes or entry.content is None:
+            return
+        connection = self._connections.get()
+        now = time.time()
+        with transaction(connection):
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.endpoint, entry.status_code, json.dumps(entry.headers), entry.content, entry.size, entry.expires_at, now, entry.revalidatable),
+            )
+            connection.execute("DELETE FROM responses WHERE expires_at <= ? AND NOT revalidatable", (now,))
+            evicted = self._evict(connection)
+        if evicted:
+            self.stats.record("evictions", evicted)
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        evicted = 0
+        if total <= self.max_bytes:
+            return evicted
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        return evicted
+
+    def invalidate(self, pattern: str = "*") -> int:
+        removed = self._connections.get().execute("DELETE FROM responses WHERE endpoint GLOB ?", (pattern,)).rowcount
+        self.stats.record("invalidations", removed)
+        return removed
+
+    def close(self) -> None:
+        self._connections.close()
+
@@ -1,46 +1,347 @@
-from typing import Any
+from contextlib import AsyncExitStack, ExitStack
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping
+import asyncio
 import logging
+import time
 import httpx
 
-from remby._api.items import ItemsModule
-from remby._api.users import UsersModule
-from remby.exceptions import AuthenticationError, EmbyException
-from remby._api.system import SystemModule
+from remby._api.items import AsyncItemsModule, ItemsModule
+from remby._api.users import AsyncUsersModule, UsersModule
+from remby.exceptions import AuthenticationError, CircuitOpenError, EmbyException
+from remby._api.system import AsyncSystemModule, SystemModule
+from remby._breaker import CircuitBreaker
+from remby._cache import CacheEntry, ResponseCache, cache_key
+from remby._decoding import DecodeOptions, JsonBackend, ResponseFormat, check_options, decode
+from remby._ratelimit import RateLimiter
+from remby._retry import RetryPolicy
+from remby._singleflight import AsyncSingleFlight, SingleFlight, request_key
+from remby._streaming import ItemsSplitter
+from remby.models.response import EmbyResponse
+
+# Set while the circuit breaker probes the server, so the probe itself bypasses the breaker and retries.
+_probing: ContextVar[bool] = ContextVar("remby_probing", default=False)
+
+def _enable_debug_logging() -> None:
+    logging.basicConfig(level=logging.DEBUG)
+    logging.getLogger("httpx").setLevel(logging.DEBUG)
+    logging.getLogger("httpcore").setLevel(logging.DEBUG)
+
+def _default_headers(api_key: str) -> dict[str, str]:
+    return {
+        "Accept": "application/json",
+        "X-Emby-Token": api_key
+    }
+
+def _translate_error(e: httpx.HTTPError) -> EmbyException:
+    if isinstance(e, httpx.HTTPStatusError):
+        if e.response.status_code in (401, 403):
+            return AuthenticationError(f"Authentication failed: {e.response.text}")
+        return EmbyException(f"HTTP Status Error: {e.response.status_code}")
+    return EmbyException(f"Network or routing error occurred: {e}")
+
+def _is_server_failure(e: httpx.HTTPError) -> bool:
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    return isinstance(e, httpx.TransportError)
+
+class _HeldStream(httpx.SyncByteStream):
+    """Response body that releases the rate limiter budget held for it once it is closed."""
+    def __init__(self, stream: Any, hold: ExitStack) -> None:
+        self._stream = stream
+        self._hold = hold
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._hold.close()
+
+class _AsyncHeldStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, hold: AsyncExitStack) -> None:
+        self._stream = stream
+        self._hold = hold
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            await self._hold.aclose()
+
+def _finish_items(splitter: ItemsSplitter) -> None:
+    try:
+        splitter.finish()
+    except ValueError as e:
+        raise EmbyException(f"Incomplete /Items body: {e}") from e
+
+def _cache_slot(cache: ResponseCache | None, method: str, endpoint: str, response_type: Any, options: DecodeOptions, kwargs: Mapping[str, Any]) -> tuple[str, float] | None:
+    if cache is None or method.upper() != "GET" or set(kwargs) - {"params"}:
+        return None
+    # Object caches hold validated models, which can't be handed out as dicts or bytes.
+    if cache.stores_objects and options.response_format != "model":
+        return None
+    ttl = cache.ttl_for(endpoint)
+    if ttl is None:
+        return None
+    return cache_key(method, endpoint, kwargs.get("params"), response_type if cache.stores_objects else None), ttl
+
+def _model_response(response: httpx.Response, response_type: Any, options: DecodeOptions) -> EmbyResponse[Any]:
+    if response.status_code == 204:
+        return EmbyResponse.from_httpx(response, None)
+    return EmbyResponse.from_httpx(response, decode(response_type, response.content, options))
+
+def _cache_entry(cache: ResponseCache, endpoint: str, response: httpx.Response, result: EmbyResponse[Any], ttl: float) -> CacheEntry:
+    return CacheEntry(
+        endpoint=endpoint,
+        status_code=result.status_code,
+        headers=result.headers,
+        expires_at=time.time() + ttl,
+        size=len(response.content),
+        data=result.data if cache.stores_objects else None,
+        content=None if cache.stores_objects else response.content,
+    )
+
+def _cached_response(entry: CacheEntry, response_type: Any, options: DecodeOptions, revalidated: bool = False) -> EmbyResponse[Any]:
+    data = entry.data
+    if entry.content is not None and entry.status_code != 204:
+        data = decode(response_type, entry.content, options)
+    return EmbyResponse(data=data, status_code=entry.status_code, headers=entry.headers, from_cache=True, revalidated=revalidated)
+
+def _revalidated_entry(entry: CacheEntry, response: httpx.Response, ttl: float) -> CacheEntry:
+    headers = dict(entry.headers)
+    for name in ("etag", "last-modified"):
+        if name in response.headers:
+            headers[name] = response.headers[name]
+    return replace(entry, headers=headers, expires_at=time.time() + ttl)
 
 class EmbyClient:
-    def __init__(self, base_url: str, api_key: str, debug: bool = False) -> None:
+    """
+    Synchronous Emby API client.
+
+    Connection handling is configured through keyword arguments:
+
+    * `timeout`: a single timeout in seconds, or an `httpx.Timeout` with separate
+      connect/read/write/pool timeouts, e.g. `httpx.Timeout(10.0, connect=2.0)`.
+    * `max_connections`, `max_keepalive_connections`, `keepalive_expiry`: connection
+      pool size and how long idle connections are kept alive.
+    * `http2`: multiplex requests over HTTP/2 connections (requires `remby[http2]`).
+
+    Response bodies are validated straight from bytes by pydantic-core. Pass
+    `json_backend="orjson"` (requires `remby[orjson]`) to parse with orjson instead.
+    With `validate=False` the server's JSON is trusted and models are returned as
+    `LazyModel` views over the parsed JSON, which is much cheaper for bulk scans that
+    only read a few fields but leaves values uncoerced, e.g. datetimes stay strings.
+    `response_format="dict"` returns plain parsed JSON and `response_format="raw"` the
+    undecoded body bytes, for pipelines that forward Emby's JSON unchanged.
+
+    With `coalesce=True`, concurrent identical GETs made through `request_model`
+    (same endpoint, params and response type) share one network call and one parsed
+    result. Callers then receive the same `EmbyResponse` object and must not mutate it.
+
+    A `ResponseCache` (e.g. `MemoryCache`) passed as `cache` serves repeated GETs
+    through `request_model` from memory for the TTL configured per endpoint. Once an
+    entry is stale, it is revalidated with `If-None-Match`/`If-Modified-Since` if the
+    server sent an `ETag`/`Last-Modified`, and a **304** serves the cached object again
+    with `EmbyResponse.revalidated` set.
+    """
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        debug: bool = False,
+        *,
+        timeout: float | httpx.Timeout = 10.0,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce: bool = False,
+        cache: ResponseCache | None = None,
+        json_backend: JsonBackend = "pydantic",
+        validate: bool = True,
+        response_format: ResponseFormat = "model",
+    ) -> None:
         self.base_url = base_url
         self.api_key = api_key
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.coalesce = coalesce
+        self.cache = cache
+        self.json_backend = json_backend
+        self.validate = validate
+        self.response_format = response_format
+        check_options(self._decode_options())
 
         if debug:
-            logging.basicConfig(level=logging.DEBUG)
-            logging.getLogger("httpx").setLevel(logging.DEBUG)
-            logging.getLogger("httpcore").setLevel(logging.DEBUG)
-        
+            _enable_debug_logging()
+
         self._session = httpx.Client(
             base_url=self.base_url,
-            headers={
-                "Accept": "application/json",
-                "X-Emby-Token": self.api_key
-            },
-            timeout=10.0,
+            headers=_default_headers(self.api_key),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
         )
-        
+
+        self._inflight = SingleFlight()
+
         self.system = SystemModule(self)
         self.items = ItemsModule(self)
         self.users = UsersModule(self)
-    
-    def request(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
-        try:
-            response = self._session.request(method, endpoint, **kwargs)
-            response.raise_for_status()
-            return response
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code in (401, 403):
-                raise AuthenticationError(f"Authentication failed: {e.response.text}") from e
-            raise EmbyException(f"HTTP Status Error: {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            raise EmbyException(f"Network or routing error occurred: {e}") from e
+
+    def request(self, method: str, endpoint: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        probing = _probing.get()
+        retry = None if probing else self.retry
+        breaker = None if probing else self.circuit_breaker
+        if retry:
+            retry.stats.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker and breaker.before_request():
+                self._probe(breaker)
+            started = time.perf_counter()
+            try:
+                if retry:
+                    retry.stats.record_attempt()
+                response = self._send(method, endpoint, stream, **kwargs)
+                if stream and response.is_error:
+                    response.read()
+                if response.status_code != 304:
+                    response.raise_for_status()
+                if breaker:
+                    breaker.record_success()
+                return response
+            except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                if breaker and _is_server_failure(e):
+                    breaker.record_failure()
+                elif breaker:
+                    breaker.record_success()
+                failed = e.response if isinstance(e, httpx.HTTPStatusError) else None
+                if not (retry and retry.should_retry(method, attempt, response=failed, error=None if failed else e)):
+                    raise _translate_error(e) from e
+                delay = retry.get_delay(attempt, failed)
+                retry.stats.record_retry(delay, time.perf_counter() - started)
+                time.sleep(delay)
+
+    def _decode_options(self, validate: bool | None = None, response_format: ResponseFormat | None = None) -> DecodeOptions:
+        return DecodeOptions(
+            backend=self.json_backend,
+            validate=self.validate if validate is None else validate,
+            response_format=self.response_format if response_format is None else response_format,
+        )
+
+    def request_model(self, method: str, endpoint: str, response_type: Any, validate: bool | None = None, response_format: ResponseFormat | None = None, **kwargs: Any) -> EmbyResponse[Any]:
+        """
+        Send a request and validate the JSON body into `response_type`.
+
+        A **204 NO CONTENT** response results in `data=None`. `validate` and
+        `response_format` override the client's settings for this call.
+        """
+        options = self._decode_options(validate, response_format)
+        if self.coalesce and method.upper() == "GET":
+            key = request_key(method, endpoint, (response_type, options), kwargs)
+            if key is not None:
+                return self._inflight.do(key, lambda: self._fetch_model(method, endpoint, response_type, options, **kwargs))
+        return self._fetch_model(method, endpoint, response_type, options, **kwargs)
+
+    def _fetch_model(self, method: str, endpoint: str, response_type: Any, options: DecodeOptions, **kwargs: Any) -> EmbyResponse[Any]:
+        slot = _cache_slot(self.cache, method, endpoint, response_type, options, kwargs)
+        entry = None
+        if self.cache is not None and slot:
+            entry = self.cache.get(slot[0])
+            if entry is not None and entry.is_fresh:
+                return _cached_response(entry, response_type, options)
+        if entry is not None:
+            kwargs["headers"] = entry.conditional_headers()
+        response = self.request(method, endpoint, **kwargs)
+        if self.cache is not None and slot and entry is not None and response.status_code == 304:
+            entry = _revalidated_entry(entry, response, slot[1])
+            self.cache.set(slot[0], entry)
+            self.cache.stats.record("revalidations")
+            return _cached_response(entry, response_type, options, revalidated=True)
+        result = _model_response(response, response_type, options)
+        # Unvalidated objects must not end up in caches that hand them out to validating callers.
+        if self.cache is not None and slot and (options.validated_models or not self.cache.stores_objects):
+            self.cache.set(slot[0], _cache_entry(self.cache, endpoint, response, result, slot[1]))
+        return result
+
+    def stream_items(self, method: str, endpoint: str, item_type: Any, validate: bool | None = None, response_format: ResponseFormat | None = None, chunk_size: int = 65_536, **kwargs: Any) -> Iterator[Any]:
+        """
+        Send a request and yield the entries of the body's `Items` array one by one.
+
+        The body is read in `chunk_size` pieces and every item is decoded into
+        `item_type` as soon as it is complete, so only about one item is held in
+        memory instead of the whole page. Streamed responses bypass the cache.
+        """
+        options = self._decode_options(validate, response_format)
+        splitter = ItemsSplitter()
+        response = self.request(method, endpoint, stream=True, **kwargs)
+        try:
+            for chunk in response.iter_bytes(chunk_size):
+                for item in splitter.feed(chunk):
+                    yield decode(item_type, item, options)
+            _finish_items(splitter)
+        except httpx.HTTPError as e:
+            # The body failed after the request itself succeeded, so count it against the server here.
+            if self.circuit_breaker and _is_server_failure(e):
+                self.circuit_breaker.record_failure()
+            raise _translate_error(e) from e
+        finally:
+            response.close()
+
+    def _send(self, method: str, endpoint: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        if self.rate_limiter is None:
+            return self._dispatch(method, endpoint, stream, **kwargs)
+        if not stream:
+            with self.rate_limiter.acquire(endpoint):
+                return self._dispatch(method, endpoint, stream, **kwargs)
+        # A streamed body is read after this returns, so its in-flight slot is held until the response is closed.
+        hold = ExitStack()
+        hold.enter_context(self.rate_limiter.acquire(endpoint))
+        try:
+            response = self._dispatch(method, endpoint, stream, **kwargs)
+        except BaseException:
+            hold.close()
+            raise
+        response.stream = _HeldStream(response.stream, hold)
+        return response
+
+    def _dispatch(self, method: str, endpoint: str, stream: bool, **kwargs: Any) -> httpx.Response:
+        if stream:
+            return self._session.send(self._session.build_request(method, endpoint, **kwargs), stream=True)
+        return self._session.request(method, endpoint, **kwargs)
+
+    def _probe(self, breaker: CircuitBreaker) -> None:
+        token = _probing.set(True)
+        healthy = False
+        try:
+            healthy = self.system.head_system_ping()
+        except EmbyException:
+            pass
+        finally:
+            _probing.reset(token)
+            # Also reached when the probe is cancelled or interrupted, which must
+            # re-open the circuit instead of leaving it half-open for good.
+            breaker.record_probe(healthy)
+        if not healthy:
+            raise CircuitOpenError("Circuit open: health probe HEAD /System/Ping failed")
 
     def close(self) -> None:
         self._session.close()
@@ -49,4 +350,206 @@ class EmbyClient:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self.close()
\ No newline at end of file
+        self.close()
+
+class AsyncEmbyClient:
+    """
+    Asyncio counterpart of `EmbyClient` built on `httpx.AsyncClient`.
+
+    All module methods are coroutines, so many requests can be in flight
+    on a single event loop at once (e.g. via `asyncio.gather`). Accepts the
+    same connection options as `EmbyClient`. Disk-backed caches such as
+    `SQLiteCache` are read and written in a worker thread.
+    """
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        debug: bool = False,
+        *,
+        timeout: float | httpx.Timeout = 10.0,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        coalesce: bool = False,
+        cache: ResponseCache | None = None,
+        json_backend: JsonBackend = "pydantic",
+        validate: bool = True,
+        response_format: ResponseFormat = "model",
+    ) -> None:
+        self.base_url = base_url
+        self.api_key = api_key
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.coalesce = coalesce
+        self.cache = cache
+        self.json_backend = json_backend
+        self.validate = validate
+        self.response_format = response_format
+        check_options(self._decode_options())
+
+        if debug:
+            _enable_debug_logging()
+
+        self._session = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=_default_headers(self.api_key),
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+        )
+
+        self._inflight = AsyncSingleFlight()
+
+        self.system = AsyncSystemModule(self)
+        self.items = AsyncItemsModule(self)
+        self.users = AsyncUsersModule(self)
+
+    async def request(self, method: str, endpoint: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        probing = _probing.get()
+        retry = None if probing else self.retry
+        breaker = None if probing else self.circuit_breaker
+        if retry:
+            retry.stats.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker and breaker.before_request():
+                await self._probe(breaker)
+            started = time.perf_counter()
+            try:
+                if retry:
+                    retry.stats.record_attempt()
+                response = await self._send(method, endpoint, stream, **kwargs)
+                if stream and response.is_error:
+                    await response.aread()
+                if response.status_code != 304:
+                    response.raise_for_status()
+                if breaker:
+                    breaker.record_success()
+                return response
+            except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                if breaker and _is_server_failure(e):
+                    breaker.record_failure()
+                elif breaker:
+                    breaker.record_success()
+                failed = e.response if isinstance(e, httpx.HTTPStatusError) else None
+                if not (retry and retry.should_retry(method, attempt, response=failed, error=None if failed else e)):
+                    raise _translate_error(e) from e
+                delay = retry.get_delay(attempt, failed)
+                retry.stats.record_retry(delay, time.perf_counter() - started)
+                await asyncio.sleep(delay)
+
+    def _decode_options(self, validate: bool | None = None, response_format: ResponseFormat | None = None) -> DecodeOptions:
+        return DecodeOptions(
+            backend=self.json_backend,
+            validate=self.validate if validate is None else validate,
+            response_format=self.response_format if response_format is None else response_format,
+        )
+
+    async def request_model(self, method: str, endpoint: str, response_type: Any, validate: bool | None = None, response_format: ResponseFormat | None = None, **kwargs: Any) -> EmbyResponse[Any]:
+        options = self._decode_options(validate, response_format)
+        if self.coalesce and method.upper() == "GET":
+            key = request_key(method, endpoint, (response_type, options), kwargs)
+            if key is not None:
+                return await self._inflight.do(key, lambda: self._fetch_model(method, endpoint, response_type, options, **kwargs))
+        return await self._fetch_model(method, endpoint, response_type, options, **kwargs)
+
+    async def _fetch_model(self, method: str, endpoint: str, response_type: Any, options: DecodeOptions, **kwargs: Any) -> EmbyResponse[Any]:
+        slot = _cache_slot(self.cache, method, endpoint, response_type, options, kwargs)
+        entry = None
+        if self.cache is not None and slot:
+            entry = await self._cache_call(self.cache.get, slot[0])
+            if entry is not None and entry.is_fresh:
+                return _cached_response(entry, response_type, options)
+        if entry is not None:
+            kwargs["headers"] = entry.conditional_headers()
+        response = await self.request(method, endpoint, **kwargs)
+        if self.cache is not None and slot and entry is not None and response.status_code == 304:
+            entry = _revalidated_entry(entry, response, slot[1])
+            await self._cache_call(self.cache.set, slot[0], entry)
+            self.cache.stats.record("revalidations")
+            return _cached_response(entry, response_type, options, revalidated=True)
+        result = _model_response(response, response_type, options)
+        # Unvalidated objects must not end up in caches that hand them out to validating callers.
+        if self.cache is not None and slot and (options.validated_models or not self.cache.stores_objects):
+            await self._cache_call(self.cache.set, slot[0], _cache_entry(self.cache, endpoint, response, result, slot[1]))
+        return result
+
+    async def _cache_call(self, call: Callable[..., Any], *args: Any) -> Any:
+        # Object caches live in memory; byte caches (e.g. `SQLiteCache`) hit the disk and
+        # may wait on its lock, so they run in a worker thread instead of on the event loop.
+        if self.cache is not None and self.cache.stores_objects:
+            return call(*args)
+        return await asyncio.to_thread(call, *args)
+
+    async def stream_items(self, method: str, endpoint: str, item_type: Any, validate: bool | None = None, response_format: ResponseFormat | None = None, chunk_size: int = 65_536, **kwargs: Any) -> AsyncIterator[Any]:
+        options = self._decode_options(validate, response_format)
+        splitter = ItemsSplitter()
+        response = await self.request(method, endpoint, stream=True, **kwargs)
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                for item in splitter.feed(chunk):
+                    yield decode(item_type, item, options)
+            _finish_items(splitter)
+        except httpx.HTTPError as e:
+            # The body failed after the request itself succeeded, so count it against the server here.
+            if self.circuit_breaker and _is_server_failure(e):
+                self.circuit_breaker.record_failure()
+            raise _translate_error(e) from e
+        finally:
+            await response.aclose()
+
+    async def _send(self, method: str, endpoint: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        if self.rate_limiter is None:
+            return await self._dispatch(method, endpoint, stream, **kwargs)
+        if not stream:
+            async with self.rate_limiter.aacquire(endpoint):
+                return await self._dispatch(method, endpoint, stream, **kwargs)
+        hold = AsyncExitStack()
+        await hold.enter_async_context(self.rate_limiter.aacquire(endpoint))
+        try:
+            response = await self._dispatch(method, endpoint, stream, **kwargs)
+        except BaseException:
+            await hold.aclose()
+            raise
+        response.stream = _AsyncHeldStream(response.stream, hold)
+        return response
+
+    async def _dispatch(self, method: str, endpoint: str, stream: bool, **kwargs: Any) -> httpx.Response:
+        if stream:
+            return await self._session.send(self._session.build_request(method, endpoint, **kwargs), stream=True)
+        return await self._session.request(method, endpoint, **kwargs)
+
+    async def _probe(self, breaker: CircuitBreaker) -> None:
+        token = _probing.set(True)
+        healthy = False
+        try:
+            healthy = await self.system.head_system_ping()
+        except EmbyException:
+            pass
+        finally:
+            _probing.reset(token)
+            # Also reached when the probe is cancelled or interrupted, which must
+            # re-open the circuit instead of leaving it half-open for good.
+            breaker.record_probe(healthy)
+        if not healthy:
+            raise CircuitOpenError("Circuit open: health probe HEAD /System/Ping failed")
+
+    async def aclose(self) -> None:
+        await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncEmbyClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Any, Literal
+import json
+import threading
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+from remby.models.lazy import lazy_converter
+
+JsonBackend = Literal["pydantic", "orjson", "json"]
+ResponseFormat = Literal["model", "dict", "raw"]
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    """
+    How a response body is turned into `EmbyResponse.data`.
+
+    `response_format="model"` validates into the response model (or builds `LazyModel`
+    views with `validate=False`), `"dict"` returns the parsed JSON as plain dicts and
+    lists, and `"raw"` returns the undecoded body bytes.
+    """
+    backend: JsonBackend = "pydantic"
+    validate: bool = True
+    response_format: ResponseFormat = "model"
+
+    @property
+    def validated_models(self) -> bool:
+        return self.response_format == "model" and self.validate
+
+_adapters: dict[Any, TypeAdapter[Any]] = {}
+_adapters_lock = threading.Lock()
+
+def _is_model(response_type: Any) -> bool:
+    return isinstance(response_type, type) and issubclass(response_type, BaseModel)
+
+def type_adapter(response_type: Any) -> TypeAdapter[Any]:
+    """
+    Return the shared `TypeAdapter` for `response_type`, building it on first use.
+
+    Building an adapter compiles a pydantic-core validator, so adapters for shapes
+    like `List[PackageVersionInfo]` are built once per process and reused by all modules.
+    """
+    adapter = _adapters.get(response_type)
+    if adapter is None:
+        with _adapters_lock:
+            adapter = _adapters.get(response_type)
+            if adapter is None:
+                adapter = _adapters[response_type] = TypeAdapter(response_type)
+    return adapter
+
+def _load_orjson() -> Any:
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError("json_backend='orjson' requires the orjson package, install it with `pip install remby[orjson]`") from e
+    return orjson
+
+def check_options(options: DecodeOptions) -> None:
+    if options.backend == "orjson":
+        _load_orjson()
+    elif options.backend not in ("pydantic", "json"):
+        raise ValueError(f"Unknown JSON backend: {options.backend!r}")
+    if options.response_format not in ("model", "dict", "raw"):
+        raise ValueError(f"Unknown response format: {options.response_format!r}")
+
+def loads(content: bytes, backend: JsonBackend = "pydantic") -> Any:
+    if backend == "pydantic":
+        return from_json(content)
+    if backend == "orjson":
+        return _load_orjson().loads(content)
+    return json.loads(content)
+
+def decode(response_type: Any, content: bytes, options: DecodeOptions = DecodeOptions()) -> Any:
+    """
+    Decode a JSON body into `response_type` (a model class or any type `TypeAdapter` accepts).
+
+    The default `"pydantic"` backend feeds the raw bytes straight into pydantic-core's JSON
+    validator, which skips building an intermediate dict tree. `"orjson"` and `"json"` parse
+    into Python objects first and validate those.
+
+    With `validate=False` the body is trusted: it is only parsed, and models are returned
+    as `LazyModel` views that convert fields on first access.
+    """
+    if options.response_format == "raw":
+        return content
+    if options.response_format == "dict":
+        return loads(content, options.backend)
+    if not options.validate:
+        loaded = loads(content, options.backend)
+        convert = lazy_converter(response_type)
+        return convert(loaded) if convert and loaded is not None else loaded
+    if options.backend == "pydantic":
+        if _is_model(response_type):
+            return response_type.model_validate_json(content)
+        return type_adapter(response_type).validate_json(content)
+    loaded = loads(content, options.backend)
+    if _is_model(response_type):
+        return response_type.model_validate(loaded)
+    return type_adapter(response_type).validate_python(loaded)
@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
+import json
+import os
+import sqlite3
+import time
+
+from remby._scan import scan_items, server_ids
+from remby._sqlite import SQLiteConnections, transaction
+from remby.models import emby
+from remby.models.items import GetItemRequest
+
+if TYPE_CHECKING:
+    from remby._client import EmbyClient
+    from remby.models.emby._internal import BaseItemDto
+
+SyncMode = Literal["full", "incremental"]
+
+@dataclass
+class SyncResult:
+    """Outcome of one `LibraryMirror.sync()` pass."""
+    mode: SyncMode
+    upserted: int = 0
+    deleted: int = 0
+    reconciled: bool = False
+    seconds: float = 0.0
+
+class LibraryMirror:
+    """
+    Local SQLite copy of an Emby library, kept up to date with incremental syncs.
+
+    The first `sync()` mirrors every item matching `query` via `iter_items`. Later
+    syncs only request items saved since the previous pass (`MinDateLastSaved`)
+    and, with a `user_id`, items whose user data changed (`MinDateLastSavedForUser`).
+    Both cut-offs are moved back by `overlap` seconds to absorb clock skew between
+    this machine and the server. Incremental queries can't see deletions, so every
+    `reconcile_interval` seconds the mirror fetches the server's ID set and drops
+    local items that no longer exist.
+
+    Items are stored as the server's JSON and read back without any network round
+    trip. The database runs in WAL mode, so readers in other threads or processes
+    are not blocked by a running sync.
+
+    The default query asks for `DEFAULT_FIELDS`, which fill the indexed columns
+    (`sort_name`, `path`, ...). A custom `query` should request them as well, plus
+    whatever else its readers need, since Emby leaves them out otherwise.
+    """
+    DEFAULT_FIELDS = "SortName,Path,ParentId,ProviderIds,DateCreated,DateModified"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS items (
+            id TEXT PRIMARY KEY,
+            type TEXT,
+            parent_id TEXT,
+            name TEXT,
+            sort_name TEXT,
+            path TEXT,
+            data TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS items_parent_id ON items (parent_id);
+        CREATE INDEX IF NOT EXISTS items_type ON items (type);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(
+        self,
+        client: "EmbyClient",
+        path: str | os.PathLike[str],
+        query: GetItemRequest | None = None,
+        user_id: str | None = None,
+        page_size: int = 500,
+        reconcile_interval: float | None = 3600.0,
+        overlap: float = 60.0,
+        busy_timeout: float = 10.0,
+    ) -> None:
+        self.client = client
+        self.path = Path(path)
+        self.query = query or GetItemRequest(recursive=True, fields=self.DEFAULT_FIELDS)
+        self.user_id = user_id
+        self.page_size = page_size
+        self.reconcile_interval = reconcile_interval
+        self.overlap = overlap
+        self.busy_timeout = busy_timeout
+        self._connections = SQLiteConnections(self.path, busy_timeout)
+        self._connections.get().executescript(self._SCHEMA)
+
+    def _state(self, key: str) -> str | None:
+        row = self._connections.get().execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, connection: sqlite3.Connection, key: str, value: str) -> None:
+        connection.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, value))
+
+    @property
+    def last_synced(self) -> datetime | None:
+        value = self._state("last_synced")
+        return datetime.fromisoformat(value) if value else None
+
+    @property
+    def last_reconciled(self) -> datetime | None:
+        value = self._state("last_reconciled")
+        return datetime.fromisoformat(value) if value else None
+
+    def _iter(self, query: GetItemRequest) -> Iterator[dict[str, Any]]:
+        return scan_items(self.client, query, self.user_id, self.page_size)
+
+    def _upsert(self, connection: sqlite3.Connection, items: Iterable[dict[str, Any]], seen: set[str] | None = None) -> int:
+        now = time.time()
+        count = 0
+        batch: list[tuple[Any, ...]] = []
+
+        def flush() -> None:
+            with transaction(connection):
+                connection.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+            batch.clear()
+
+        for item in items:
+            item_id = item["Id"]
+            if seen is not None:
+                seen.add(item_id)
+            batch.append((item_id, item.get("Type"), item.get("ParentId"), item.get("Name"), item.get("SortName"), item.get("Path"), json.dumps(item), now))
+            count += 1
+            if len(batch) >= self.page_size:
+                flush()
+        if batch:
+            flush()
+        return count
+
+    def _delete_missing(self, connection: sqlite3.Connection, server_ids: set[str]) -> int:
+        local_ids = {row[0] for row in connection.execute("SELECT id FROM items")}
+        missing = [(item_id,) for item_id in local_ids - server_ids]
+        if missing:
+            with transaction(connection):
+                connection.executemany("DELETE FROM items WHERE id = ?", missing)
+        return len(missing)
+
+    def _cutoff(self, started: datetime) -> str:
+        return (started - timedelta(seconds=self.overlap)).isoformat(timespec="seconds")
+
+    def sync(self, full: bool = False) -> SyncResult:
+        """
+        Bring the mirror up to date and return what changed.
+
+        Runs a full pass on the first call or with `full=True`, an incremental pass
+        otherwise, and reconciles deletions when `reconcile_interval` has elapsed.
+        """
+        started = datetime.now(timezone.utc)
+        clock = time.perf_counter()
+        connection = self._connections.get()
+        last_synced = self._state("last_synced")
+        if full or last_synced is None:
+            result = SyncResult("full")
+            seen: set[str] = set()
+            result.upserted = self._upsert(connection, self._iter(self.query), seen)
+            result.deleted = self._delete_missing(connection, seen)
+            result.reconciled = True
+        else:
+            result = SyncResult("incremental")
+            result.upserted = self._upsert(connection, self._iter(self.query.model_copy(update={"min_date_last_saved": last_synced})))
+            if self.user_id is not None:
+                result.upserted += self._upsert(connection, self._iter(self.query.model_copy(update={"min_date_last_saved_for_user": last_synced})))
+            last_reconciled = self.last_reconciled
+            if self.reconcile_interval is not None and (last_reconciled is None or (started - last_reconciled).total_seconds() >= self.reconcile_interval):
+                result.deleted = self._reconcile(connection)
+                result.reconciled = True
+        self._set_state(connection, "last_synced", self._cutoff(started))
+        if result.reconciled:
+            self._set_state(connection, "last_reconciled", started.isoformat())
+        result.seconds = time.perf_counter() - clock
+        return result
+
+    def _reconcile(self, connection: sqlite3.Connection) -> int:
+        return self._delete_missing(connection, server_ids(self.client, self.query, self.user_id, self.page_size))
+
+    def reconcile(self) -> int:
+        """Drop local items that no longer exist on the server and return how many were removed."""
+        connection = self._connections.get()
+        deleted = self._reconcile(connection)
+        self._set_state(connection, "last_reconciled", datetime.now(timezone.utc).isoformat())
+        return deleted
+
+    def __len__(self) -> int:
+        return int(self._connections.get().execute("SELECT COUNT(*) FROM items").fetchone()[0])
+
+    def __contains__(self, item_id: object) -> bool:
+        return self._connections.get().execute("SELECT 1 FROM items WHERE id = ?", (item_id,)).fetchone() is not None
+
+    def get_raw(self, item_id: str) -> dict[str, Any] | None:
+        """Return the stored JSON of an item, or `None` if it isn't mirrored."""
+        row = self._connections.get().execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get(self, item_id: str) -> "BaseItemDto | None":
+        """Return a mirrored item as a validated `BaseItemDto`, or `None` if it isn't mirrored."""
+        row = self._connections.get().execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return emby.BaseItemDto.model_validate_json(row[0]) if row else None
+
+    def iter_raw(self, item_type: str | None = None, parent_id: str | None = None) -> Iterator[dict[str, Any]]:
+        """Yield the stored JSON of all mirrored items, optionally filtered by `Type` and `ParentId`."""
+        clauses, params = [], []
+        if item_type is not None:
+            clauses.append("type = ?")
+            params.append(item_type)
+        if parent_id is not None:
+            clauses.append("parent_id = ?")
+            params.append(parent_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        for (data,) in self._connections.get().execute(f"SELECT data FROM items{where} ORDER BY sort_name, id", params):
+            yield json.loads(data)
+
+    def close(self) -> None:
+        self._connections.close()
+
+    def __enter__(self) -> "LibraryMirror":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+import threading
+
+from remby._scan import scan_items, server_ids
+from remby.models.items import GetItemRequest
+from remby.models.lazy import LazyModel
+from remby.models.projection import ItemProjection
+
+if TYPE_CHECKING:
+    from remby._client import EmbyClient
+
+def provider_key(provider: str, value: str) -> str:
+    """Return the `AnyProviderIdEquals` form of a provider ID, e.g. `"imdb.tt0133093"`."""
+    return f"{provider.lower()}.{value}"
+
+def _normalize(key: str) -> str:
+    provider, _, value = key.partition(".")
+    if not value:
+        raise ValueError(f"Provider IDs must look like 'provider.id', got {key!r}")
+    return provider_key(provider, value)
+
+def _item_provider_ids(item: Any) -> tuple[str | None, Iterable[tuple[str, str]]]:
+    if isinstance(item, dict):
+        return item.get("Id"), (item.get("ProviderIds") or {}).items()
+    if isinstance(item, LazyModel):
+        return _item_provider_ids(item.raw)
+    provider_ids = item.provider_ids
+    if provider_ids is None:
+        return item.id, ()
+    if isinstance(provider_ids, tuple):
+        return item.id, provider_ids
+    return item.id, getattr(provider_ids, "root", provider_ids).items()
+
+class ProviderIdIndex:
+    """
+    In-memory reverse index from external provider IDs (IMDb, TMDb, TVDb, ...) to Emby item IDs.
+
+    `build()` fills it from a full scan that only transfers `Id` and `ProviderIds`,
+    `refresh()` picks up items saved since the last scan (`MinDateLastSaved`), and
+    `update()` adds items from any other scan, e.g. `BaseItemDto`s, plain item dicts or
+    an `ItemSnapshot`. Incremental scans can't see deletions, so every
+    `reconcile_interval` seconds `refresh()` also fetches the server's ID set and
+    drops items that no longer exist. `resolve_provider_ids()` answers from the
+    index and asks the server only for the misses, `batch_size` IDs per
+    `AnyProviderIdEquals` query.
+    """
+    def __init__(self, client: "EmbyClient", query: GetItemRequest | None = None, user_id: str | None = None, page_size: int = 500, batch_size: int = 50, overlap: float = 60.0, reconcile_interval: float | None = 3600.0) -> None:
+        self.client = client
+        self.query = query or GetItemRequest(recursive=True)
+        self.user_id = user_id
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.overlap = overlap
+        self.reconcile_interval = reconcile_interval
+        self.last_scanned: datetime | None = None
+        self.last_reconciled: datetime | None = None
+        self._projection = ItemProjection("id", "provider_ids")
+        self._items: dict[str, set[str]] = {}
+        self._keys: dict[str, tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        provider, _, value = key.partition(".")
+        return bool(value) and provider_key(provider, value) in self._items
+
+    def _iter(self, query: GetItemRequest) -> Iterator[dict[str, Any]]:
+        return scan_items(self.client, query, self.user_id, self.page_size, self._projection)
+
+    def update(self, items: Iterable[Any]) -> int:
+        """Index (or re-index) `items` and return how many were processed."""
+        count = 0
+        # `items` may be a network scan, so the lock is only held while each item is applied.
+        for item in items:
+            item_id, provider_ids = _item_provider_ids(item)
+            if item_id is None:
+                continue
+            keys = tuple(provider_key(provider, value) for provider, value in provider_ids if value)
+            with self._lock:
+                self._remove(item_id)
+                for key in keys:
+                    self._items.setdefault(key, set()).add(item_id)
+                if keys:
+                    self._keys[item_id] = keys
+            count += 1
+        return count
+
+    def _remove(self, item_id: str) -> None:
+        for key in self._keys.pop(item_id, ()):
+            ids = self._items.get(key)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._items[key]
+
+    def remove(self, item_ids: Iterable[str]) -> None:
+        with self._lock:
+            for item_id in item_ids:
+                self._remove(item_id)
+
+    def build(self) -> int:
+        """Replace the index with a full scan of `query` and return the number of items scanned."""
+        started = datetime.now(timezone.utc)
+        with self._lock:
+            self._items.clear()
+            self._keys.clear()
+        count = self.update(self._iter(self.query))
+        self.last_scanned = self.last_reconciled = started
+        return count
+
+    def refresh(self) -> int:
+        """
+        Index items saved since the last scan (a full `build()` if there was none)
+        and reconcile deletions when `reconcile_interval` has elapsed.
+        """
+        if self.last_scanned is None:
+            return self.build()
+        started = datetime.now(timezone.utc)
+        since = (self.last_scanned - timedelta(seconds=self.overlap)).isoformat(timespec="seconds")
+        count = self.update(self._iter(self.query.model_copy(update={"min_date_last_saved": since})))
+        self.last_scanned = started
+        if self.reconcile_interval is not None and (self.last_reconciled is None or (started - self.last_reconciled).total_seconds() >= self.reconcile_interval):
+            self.reconcile()
+        return count
+
+    def reconcile(self) -> int:
+        """Drop items that no longer exist on the server and return how many were removed."""
+        started = datetime.now(timezone.utc)
+        ids = server_ids(self.client, self.query, self.user_id, self.page_size)
+        with self._lock:
+            stale = [item_id for item_id in self._keys if item_id not in ids]
+            for item_id in stale:
+                self._remove(item_id)
+        self.last_reconciled = started
+        return len(stale)
+
+    def lookup(self, key: str) -> list[str]:
+        """Return the item IDs indexed under `key` (e.g. `"tmdb.603"`) without asking the server."""
+        key = _normalize(key)
+        with self._lock:
+            return sorted(self._items.get(key, ()))
+
+    def resolve_provider_ids(self, keys: Iterable[str]) -> dict[str, list[str]]:
+        """
+        Map every `provider.id` key to the Emby item IDs carrying it.
+
+        Keys missing from the index are looked up on the server in batches and the
+        results are added to the index. Keys the server doesn't know map to `[]`.
+        """
+        keys = list(keys)
+        normalized = {key: _normalize(key) for key in keys}
+        misses = list(dict.fromkeys(value for value in normalized.values() if value not in self._items))
+        for offset in range(0, len(misses), self.batch_size):
+            batch = misses[offset:offset + self.batch_size]
+            query = self.query.model_copy(update={"any_provider_id_equals": ",".join(batch)})
+            self.update(self._iter(query))
+        with self._lock:
+            return {key: sorted(self._items.get(normalized[key], ())) for key in keys}
@@ -0,0 +1,94 @@
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import AsyncIterator, Iterator
+import asyncio
+import threading
+import time
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A request budget.
+
+    `rate` is the sustained number of requests per second and `burst` the number of
+    requests that may be sent back to back before the rate applies. `max_in_flight`
+    caps the number of concurrent requests. `None` disables the respective limit.
+    """
+    rate: float | None = None
+    burst: int = 1
+    max_in_flight: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("RateLimit.rate must be positive")
+        if self.burst < 1:
+            raise ValueError("RateLimit.burst must be at least 1")
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError("RateLimit.max_in_flight must be at least 1")
+
+class _Budget:
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(limit.max_in_flight) if limit.max_in_flight else None
+        self.async_semaphore = asyncio.Semaphore(limit.max_in_flight) if limit.max_in_flight else None
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller has to wait before using it."""
+        if self.limit.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._updated) * self.limit.rate, float(self.limit.burst))
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.rate
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter and concurrency governor for `EmbyClient`.
+
+    The global budget applies to every request. Endpoints matching one of the
+    glob patterns in `endpoints` (e.g. `"/Items*"` or `"/Users/*/Items*"`) use
+    their own budget instead, so that bulk scans cannot starve health checks.
+    The first matching pattern wins. A single limiter may be shared by several
+    clients to enforce a combined budget.
+    """
+    def __init__(self, rate: float | None = None, burst: int = 1, max_in_flight: int | None = None, endpoints: dict[str, RateLimit] | None = None) -> None:
+        self._default = _Budget(RateLimit(rate=rate, burst=burst, max_in_flight=max_in_flight))
+        self._endpoints = [(pattern, _Budget(limit)) for pattern, limit in (endpoints or {}).items()]
+
+    def _budget(self, endpoint: str) -> _Budget:
+        for pattern, budget in self._endpoints:
+            if fnmatchcase(endpoint, pattern):
+                return budget
+        return self._default
+
+    @contextmanager
+    def acquire(self, endpoint: str) -> Iterator[None]:
+        budget = self._budget(endpoint)
+        delay = budget.reserve()
+        if delay:
+            time.sleep(delay)
+        if budget.semaphore is None:
+            yield
+            return
+        with budget.semaphore:
+            yield
+
+    @asynccontextmanager
+    async def aacquire(self, endpoint: str) -> AsyncIterator[None]:
+        budget = self._budget(endpoint)
+        delay = budget.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        if budget.async_semaphore is None:
+            yield
+            return
+        async with budget.async_semaphore:
+            yield
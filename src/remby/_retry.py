@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import random
+import threading
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+@dataclass
+class RetryStats:
+    """
+    Running counters of a `RetryPolicy`.
+
+    `delay_seconds` is the time spent sleeping between attempts and
+    `failed_attempt_seconds` the time spent on attempts that were retried,
+    so their sum is the latency added by retries.
+    """
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    delay_seconds: float = 0.0
+    failed_attempt_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_attempt(self) -> None:
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, delay: float, attempt_seconds: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.delay_seconds += delay
+            self.failed_attempt_seconds += attempt_seconds
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry behaviour for `EmbyClient.request` and `AsyncEmbyClient.request`.
+
+    Transport errors (timeouts, connection resets, ...) and responses with a status in
+    `retry_status_codes` are retried up to `max_attempts` total attempts. The delay grows as
+    `backoff_factor * 2 ** (attempt - 1)`, capped at `max_backoff`, and is drawn uniformly
+    from `[0, delay]` when `jitter` is enabled. A `Retry-After` header takes precedence
+    when `respect_retry_after` is set. Only methods in `retry_methods` are retried, which
+    by default excludes POST so that e.g. `/System/Restart` is never sent twice.
+    """
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    stats: RetryStats = field(default_factory=RetryStats, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("RetryPolicy.max_attempts must be at least 1")
+
+    def is_retryable(self, method: str, response: httpx.Response | None = None, error: Exception | None = None) -> bool:
+        if method.upper() not in self.retry_methods:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.retry_status_codes
+
+    def should_retry(self, method: str, attempt: int, response: httpx.Response | None = None, error: Exception | None = None) -> bool:
+        if not self.is_retryable(method, response, error):
+            return False
+        if attempt >= self.max_attempts:
+            self.stats.record_exhausted()
+            return False
+        return True
+
+    def get_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING, Any, Iterator
+
+from remby.models.items import GetItemRequest
+from remby.models.projection import ItemProjection
+
+if TYPE_CHECKING:
+    from remby._client import EmbyClient
+
+def scan_items(client: "EmbyClient", query: GetItemRequest, user_id: str | None = None, page_size: int = 500, projection: ItemProjection | None = None) -> Iterator[dict[str, Any]]:
+    """Yield every item matching `query` as a plain dict, as `user_id` sees them if given."""
+    items = client.items
+    if user_id is None:
+        return items.iter_items(query, page_size=page_size, response_format="dict", projection=projection)
+    return items.iter_items_by_userid(user_id, query, page_size=page_size, response_format="dict", projection=projection)
+
+def server_ids(client: "EmbyClient", query: GetItemRequest, user_id: str | None = None, page_size: int = 500) -> set[str]:
+    """Return the IDs of every item matching `query`, transferring nothing but `Id`."""
+    return {item["Id"] for item in scan_items(client, query, user_id, page_size, ItemProjection("id"))}
@@ -0,0 +1,68 @@
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+import asyncio
+import threading
+
+def request_key(method: str, endpoint: str, response_type: Any, kwargs: Mapping[str, Any]) -> Hashable | None:
+    """
+    Build a hashable key identifying a request, or `None` if it can't be shared.
+
+    Only requests whose sole keyword argument is `params` are keyed; the params
+    are canonicalized so that ordering and value types don't matter.
+    """
+    if set(kwargs) - {"params"}:
+        return None
+    params = kwargs.get("params") or {}
+    canonical = tuple(sorted((str(name), str(value)) for name, value in params.items()))
+    return (method.upper(), endpoint, canonical, response_type)
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key across threads into a single call."""
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls with the same key across tasks of one event loop into a single call.
+
+    The shared call runs in its own task that every caller, the first one included,
+    awaits through `asyncio.shield`, so cancelling one caller doesn't cancel the
+    call for the others.
+    """
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
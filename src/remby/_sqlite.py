@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+import os
+import sqlite3
+import threading
+
+class SQLiteConnections:
+    """
+    Per-thread connections to one SQLite file in WAL mode.
+
+    WAL lets readers in other threads or processes run while a writer holds the
+    lock, and `busy_timeout` is how long a writer waits for that lock. Connections
+    run in autocommit mode; use `transaction()` to group statements.
+    """
+    def __init__(self, path: str | os.PathLike[str], busy_timeout: float = 10.0) -> None:
+        self.path = Path(path)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Close the calling thread's connection. Other threads' connections close when their thread exits."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+@contextmanager
+def transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    """Run the block in a `BEGIN IMMEDIATE` transaction, rolled back if it raises."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
@@ -0,0 +1,108 @@
+from typing import Any
+import codecs
+import json
+import re
+
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'["\\]')
+_SEPARATORS = re.compile(r'[\s,]*')
+_ITEMS_KEY = re.compile(r'"Items"\s*:\s*$')
+_decoder = json.JSONDecoder()
+
+class ItemsSplitter:
+    """
+    Incremental parser that cuts the elements of a top-level `"Items"` array out
+    of a JSON body fed in arbitrary chunks.
+
+    Every element is handed out as soon as it is complete, as its own JSON document
+    that can be validated on its own. Elements are delimited with the C scanner of
+    `json.JSONDecoder.raw_decode`, and an element cut off at the end of a chunk is
+    simply retried once more data arrived, so the buffer holds about one item.
+    Everything outside the array is kept and parsed by `finish()`, so
+    `TotalRecordCount` is available once the body has been read.
+    """
+    def __init__(self) -> None:
+        self._text = ""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._depth = 0
+        self._in_string = False
+        self._in_items = False
+        self._outer: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add `chunk` and return the items completed by it."""
+        text = self._text + self._utf8.decode(chunk)
+        items: list[bytes] = []
+        pos = 0
+        while pos < len(text):
+            if not self._in_items:
+                pos = self._scan_outer(text, pos)
+                if not self._in_items:
+                    break
+                continue
+            pos = _SEPARATORS.match(text, pos).end()
+            if pos >= len(text):
+                break
+            if text[pos] == "]":
+                self._in_items = False
+                self._depth -= 1
+                self._outer.append("]")
+                pos += 1
+                continue
+            try:
+                _, end = _decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                # The item continues in the next chunk.
+                break
+            items.append(text[pos:end].encode())
+            pos = end
+        self._text = text[pos:]
+        return items
+
+    def _scan_outer(self, text: str, pos: int) -> int:
+        """
+        Track the structure outside the `Items` array, copying it to `_outer`.
+
+        Returns where scanning stopped: right after the array's `[` once it was found,
+        or at the end of `text` (before an unfinished escape sequence).
+        """
+        start = pos
+        while True:
+            if self._in_string:
+                match = _STRING_END.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                if text[match.start()] == "\\":
+                    if match.end() >= len(text):
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+            match = _STRUCTURAL.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            char = text[match.start()]
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 2 and char == "[" and _ITEMS_KEY.search("".join(self._outer)[-64:] + text[start:match.start()]):
+                    self._in_items = True
+                    break
+            else:
+                self._depth -= 1
+        self._outer.append(text[start:pos])
+        return pos
+
+    def finish(self) -> dict[str, Any]:
+        """Return the body without its items, e.g. `{"Items": [], "TotalRecordCount": 120}`."""
+        if self._depth or self._in_string or self._text.strip():
+            raise ValueError("Truncated JSON body")
+        outer = "".join(self._outer)
+        return json.loads(outer) if outer.strip() else {}
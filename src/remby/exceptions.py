@@ -2,4 +2,7 @@ class EmbyException(Exception):
     pass
 
 class AuthenticationError(EmbyException):
-    pass
\ No newline at end of file
+    pass
+
+class CircuitOpenError(EmbyException):
+    pass
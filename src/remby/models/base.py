@@ -0,0 +1,18 @@
+from typing import Generic
+
+import pydantic
+from pydantic import ConfigDict
+from pydantic.root_model import RootModelRootType
+
+class BaseModel(pydantic.BaseModel):
+    """
+    Base of the generated Emby models.
+
+    Validators are built on first use instead of at import time (`defer_build`),
+    so importing remby doesn't pay for the ~250 models most programs never touch.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+class RootModel(pydantic.RootModel[RootModelRootType], Generic[RootModelRootType]):
+    """`pydantic.RootModel` with `defer_build`, see `BaseModel`."""
+    model_config = ConfigDict(defer_build=True)
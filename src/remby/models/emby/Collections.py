@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from remby.models.base import BaseModel
 
 
 class CollectionCreationResult(BaseModel):
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import Field
+
+from remby.models.base import BaseModel, RootModel
 
 from .._internal import (
     CodecProfile,
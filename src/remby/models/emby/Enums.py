@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import RootModel
+from remby.models.base import RootModel
 
 
 class UIViewType(RootModel[Literal["RegularPage", "Dialog", "Wizard"]]):
@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
-from pydantic import AwareDatetime, BaseModel, Field
+from pydantic import AwareDatetime, Field
+
+from remby.models.base import BaseModel
 
 from .._internal import NameIdPair
 
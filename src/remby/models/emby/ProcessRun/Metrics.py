@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from datetime import time as time_aliased
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from remby.models.base import BaseModel
 
 
 class ProcessMetricPoint(BaseModel):
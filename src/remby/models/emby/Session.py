@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from ipaddress import IPv4Address
 
-from pydantic import AwareDatetime, BaseModel, Field
+from pydantic import AwareDatetime, Field
+
+from remby.models.base import BaseModel
 
 from . import Entities
 from ._internal import BaseItemDto, PlayerStateInfo, SessionUserInfo, TranscodingInfo
@@ -2,223 +2,227 @@
 #   filename:  openapi.json
 #   timestamp: 2026-02-21T20:33:41+00:00
 
-from ._internal import (
-    AccessSchedule,
-    ActivityLogEntry,
-    AlbumInfo,
-    AllThemeMediaResult,
-    ArtistInfo,
-    AuthenticateUser,
-    AuthenticateUserByName,
-    BaseItemDto,
-    BaseItemPerson,
-    BaseRefreshRequest,
-    BitRate,
-    BookInfo,
-    ChannelManagementInfo,
-    ChapterInfo,
-    ClientCapabilities,
-    CodecConfiguration,
-    CodecDirections,
-    CodecKinds,
-    CodecProfile,
-    CodecType,
-    ColorFormats,
-    ContainerProfile,
-    ContentSection,
-    CreateUserByName,
-    DayOfWeek,
-    DefaultDirectoryBrowserInfo,
-    DeviceProfile,
-    DirectPlayProfile,
-    DisplayPreferences,
-    DlnaProfileType,
-    DynamicDayOfWeek,
-    EditObjectContainer,
-    EncodingContext,
-    ExtendedVideoSubTypes,
-    ExtendedVideoTypes,
-    ExternalIdInfo,
-    ExternalUrl,
-    FeatureInfo,
-    FeatureType,
-    ForgotPassword,
-    ForgotPasswordAction,
-    ForgotPasswordPin,
-    ForgotPasswordResult,
-    GameInfo,
-    GeneralCommand,
-    GetDirectoryContents,
-    ImageInfo,
-    ImageOption,
-    ImageProviderInfo,
-    ImageSavingConvention,
-    ImageType,
-    InstallationInfo,
-    ItemCounts,
-    ItemFileInfo,
-    ItemFileType,
-    ItemLookupInfo,
-    LevelInformation,
-    LibraryOptionInfo,
-    LibraryOptions,
-    LibraryOptionsResult,
-    LibraryTypeOptions,
-    LinkedItemInfo,
-    LiveStreamRequest,
-    LiveStreamResponse,
-    LocationType,
-    LogFile,
-    MarkerType,
-    MediaPathInfo,
-    MediaProtocol,
-    MediaSourceInfo,
-    MediaSourceType,
-    MediaStream,
-    MediaStreamType,
-    MediaUrl,
-    MetadataEditorInfo,
-    MetadataFeatures,
-    MetadataFields,
-    MetadataRefreshMode,
-    MovieInfo,
-    MusicVideoInfo,
-    NameIdPair,
-    NameLongIdPair,
-    NameValuePair,
-    NotificationCategoryInfo,
-    NotificationTypeInfo,
-    OperatingSystem,
-    PackageInfo,
-    PackageTargetSystem,
-    PackageVersionClass,
-    PackageVersionInfo,
-    ParentalRating,
-    PathSubstitution,
-    PersonLookupInfo,
-    PersonType,
-    PinRedeemResult,
-    PlaybackErrorCode,
-    PlaybackInfoRequest,
-    PlaybackInfoResponse,
-    PlaybackProgressInfo,
-    PlaybackStartInfo,
-    PlaybackStopInfo,
-    PlayCommand,
-    PlayerStateInfo,
-    PlayMethod,
-    PlayRequest,
-    PlaystateCommand,
-    PlaystateRequest,
-    ProfileCondition,
-    ProfileConditionType,
-    ProfileConditionValue,
-    ProfileInformation,
-    ProfileLevelInformation,
-    ProgressEvent,
-    ProviderIdDictionary,
-    ProxyHeaderMode,
-    PublicSystemInfo,
-    QueryResultActivityLogEntry,
-    QueryResultBaseItemDto,
-    QueryResultChannelManagementInfo,
-    QueryResultLogFile,
-    QueryResultString,
-    QueryResultSyncJob,
-    QueryResultSyncJobItem,
-    QueryResultUserDto,
-    QueryResultVirtualFolderInfo,
-    QueueItem,
-    RatingType,
-    RecommendationDto,
-    RecommendationType,
-    RemoteImageInfo,
-    RemoteImageResult,
-    RemoteSearchQueryAlbumInfo,
-    RemoteSearchQueryArtistInfo,
-    RemoteSearchQueryBookInfo,
-    RemoteSearchQueryGameInfo,
-    RemoteSearchQueryItemLookupInfo,
-    RemoteSearchQueryMovieInfo,
-    RemoteSearchQueryMusicVideoInfo,
-    RemoteSearchQueryPersonLookupInfo,
-    RemoteSearchQuerySeriesInfo,
-    RemoteSearchQueryTrailerInfo,
-    RemoteSearchResult,
-    RemoteSubtitleInfo,
-    RepeatMode,
-    Resolution,
-    ResolutionWithRate,
-    ResponseProfile,
-    RunUICommand,
-    ScrollDirection,
-    SecondaryFrameworks,
-    SegmentSkipMode,
-    SeriesDisplayOrder,
-    SeriesInfo,
-    ServerConfiguration,
-    SessionUserInfo,
-    SleepTimerMode,
-    SongInfo,
-    SortOrder,
-    SubtitleDeliveryMethod,
-    SubtitleLocationType,
-    SubtitlePlaybackMode,
-    SubtitleProfile,
-    SyncCategory,
-    SyncDataRequest,
-    SyncDataResponse,
-    SyncDialogOptions,
-    SyncedItem,
-    SyncedItemProgress,
-    SyncJob,
-    SyncJobCreationResult,
-    SyncJobItem,
-    SyncJobItemStatus,
-    SyncJobOption,
-    SyncJobRequest,
-    SyncJobStatus,
-    SyncProfileOption,
-    SyncQualityOption,
-    SyncTarget,
-    SystemEvent,
-    SystemInfo,
-    TaskCompletionStatus,
-    TaskInfo,
-    TaskResult,
-    TaskState,
-    TaskTriggerInfo,
-    TextSectionInfo,
-    ThemeMediaResult,
-    TrailerInfo,
-    TranscodeReason,
-    TranscodeSeekInfo,
-    TranscodingInfo,
-    TranscodingProfile,
-    TransportStreamTimestamp,
-    TupleDoubleDouble,
-    TypeOptions,
-    UICommand,
-    UITabPageInfo,
-    UIViewInfo,
-    UnratedItem,
-    UpdateUserPassword,
-    UserAction,
-    UserActionType,
-    UserConfiguration,
-    UserDto,
-    UserItemDataDto,
-    UserItemShareLevel,
-    UserNotificationInfo,
-    UserPolicy,
-    ValidatePath,
-    Version,
-    Video3DFormat,
-    VideoCodecBase,
-    VideoMediaTypes,
-    VirtualFolderInfo,
-    WakeOnLanInfo,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._internal import (
+        AccessSchedule,
+        ActivityLogEntry,
+        AlbumInfo,
+        AllThemeMediaResult,
+        ArtistInfo,
+        AuthenticateUser,
+        AuthenticateUserByName,
+        BaseItemDto,
+        BaseItemPerson,
+        BaseRefreshRequest,
+        BitRate,
+        BookInfo,
+        ChannelManagementInfo,
+        ChapterInfo,
+        ClientCapabilities,
+        CodecConfiguration,
+        CodecDirections,
+        CodecKinds,
+        CodecProfile,
+        CodecType,
+        ColorFormats,
+        ContainerProfile,
+        ContentSection,
+        CreateUserByName,
+        DayOfWeek,
+        DefaultDirectoryBrowserInfo,
+        DeviceProfile,
+        DirectPlayProfile,
+        DisplayPreferences,
+        DlnaProfileType,
+        DynamicDayOfWeek,
+        EditObjectContainer,
+        EncodingContext,
+        ExtendedVideoSubTypes,
+        ExtendedVideoTypes,
+        ExternalIdInfo,
+        ExternalUrl,
+        FeatureInfo,
+        FeatureType,
+        ForgotPassword,
+        ForgotPasswordAction,
+        ForgotPasswordPin,
+        ForgotPasswordResult,
+        GameInfo,
+        GeneralCommand,
+        GetDirectoryContents,
+        ImageInfo,
+        ImageOption,
+        ImageProviderInfo,
+        ImageSavingConvention,
+        ImageType,
+        InstallationInfo,
+        ItemCounts,
+        ItemFileInfo,
+        ItemFileType,
+        ItemLookupInfo,
+        LevelInformation,
+        LibraryOptionInfo,
+        LibraryOptions,
+        LibraryOptionsResult,
+        LibraryTypeOptions,
+        LinkedItemInfo,
+        LiveStreamRequest,
+        LiveStreamResponse,
+        LocationType,
+        LogFile,
+        MarkerType,
+        MediaPathInfo,
+        MediaProtocol,
+        MediaSourceInfo,
+        MediaSourceType,
+        MediaStream,
+        MediaStreamType,
+        MediaUrl,
+        MetadataEditorInfo,
+        MetadataFeatures,
+        MetadataFields,
+        MetadataRefreshMode,
+        MovieInfo,
+        MusicVideoInfo,
+        NameIdPair,
+        NameLongIdPair,
+        NameValuePair,
+        NotificationCategoryInfo,
+        NotificationTypeInfo,
+        OperatingSystem,
+        PackageInfo,
+        PackageTargetSystem,
+        PackageVersionClass,
+        PackageVersionInfo,
+        ParentalRating,
+        PathSubstitution,
+        PersonLookupInfo,
+        PersonType,
+        PinRedeemResult,
+        PlaybackErrorCode,
+        PlaybackInfoRequest,
+        PlaybackInfoResponse,
+        PlaybackProgressInfo,
+        PlaybackStartInfo,
+        PlaybackStopInfo,
+        PlayCommand,
+        PlayerStateInfo,
+        PlayMethod,
+        PlayRequest,
+        PlaystateCommand,
+        PlaystateRequest,
+        ProfileCondition,
+        ProfileConditionType,
+        ProfileConditionValue,
+        ProfileInformation,
+        ProfileLevelInformation,
+        ProgressEvent,
+        ProviderIdDictionary,
+        ProxyHeaderMode,
+        PublicSystemInfo,
+        QueryResultActivityLogEntry,
+        QueryResultBaseItemDto,
+        QueryResultChannelManagementInfo,
+        QueryResultLogFile,
+        QueryResultString,
+        QueryResultSyncJob,
+        QueryResultSyncJobItem,
+        QueryResultUserDto,
+        QueryResultVirtualFolderInfo,
+        QueueItem,
+        RatingType,
+        RecommendationDto,
+        RecommendationType,
+        RemoteImageInfo,
+        RemoteImageResult,
+        RemoteSearchQueryAlbumInfo,
+        RemoteSearchQueryArtistInfo,
+        RemoteSearchQueryBookInfo,
+        RemoteSearchQueryGameInfo,
+        RemoteSearchQueryItemLookupInfo,
+        RemoteSearchQueryMovieInfo,
+        RemoteSearchQueryMusicVideoInfo,
+        RemoteSearchQueryPersonLookupInfo,
+        RemoteSearchQuerySeriesInfo,
+        RemoteSearchQueryTrailerInfo,
+        RemoteSearchResult,
+        RemoteSubtitleInfo,
+        RepeatMode,
+        Resolution,
+        ResolutionWithRate,
+        ResponseProfile,
+        RunUICommand,
+        ScrollDirection,
+        SecondaryFrameworks,
+        SegmentSkipMode,
+        SeriesDisplayOrder,
+        SeriesInfo,
+        ServerConfiguration,
+        SessionUserInfo,
+        SleepTimerMode,
+        SongInfo,
+        SortOrder,
+        SubtitleDeliveryMethod,
+        SubtitleLocationType,
+        SubtitlePlaybackMode,
+        SubtitleProfile,
+        SyncCategory,
+        SyncDataRequest,
+        SyncDataResponse,
+        SyncDialogOptions,
+        SyncedItem,
+        SyncedItemProgress,
+        SyncJob,
+        SyncJobCreationResult,
+        SyncJobItem,
+        SyncJobItemStatus,
+        SyncJobOption,
+        SyncJobRequest,
+        SyncJobStatus,
+        SyncProfileOption,
+        SyncQualityOption,
+        SyncTarget,
+        SystemEvent,
+        SystemInfo,
+        TaskCompletionStatus,
+        TaskInfo,
+        TaskResult,
+        TaskState,
+        TaskTriggerInfo,
+        TextSectionInfo,
+        ThemeMediaResult,
+        TrailerInfo,
+        TranscodeReason,
+        TranscodeSeekInfo,
+        TranscodingInfo,
+        TranscodingProfile,
+        TransportStreamTimestamp,
+        TupleDoubleDouble,
+        TypeOptions,
+        UICommand,
+        UITabPageInfo,
+        UIViewInfo,
+        UnratedItem,
+        UpdateUserPassword,
+        UserAction,
+        UserActionType,
+        UserConfiguration,
+        UserDto,
+        UserItemDataDto,
+        UserItemShareLevel,
+        UserNotificationInfo,
+        UserPolicy,
+        ValidatePath,
+        Version,
+        Video3DFormat,
+        VideoCodecBase,
+        VideoMediaTypes,
+        VirtualFolderInfo,
+        WakeOnLanInfo,
+    )
 
 __all__ = [
     "AccessSchedule",
@@ -437,3 +441,15 @@ __all__ = [
     "VirtualFolderInfo",
     "WakeOnLanInfo",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Re-exports are resolved on first access, so importing the package is cheap.
+    if name in __all__:
+        value = globals()[name] = getattr(import_module("._internal", __name__), name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
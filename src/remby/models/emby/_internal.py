@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import AwareDatetime, BaseModel, Field, RootModel
+from pydantic import AwareDatetime, Field
+
+from remby.models.base import BaseModel, RootModel
 
 from . import (
     Connect,
@@ -0,0 +1,115 @@
+from types import NoneType, UnionType
+from typing import Any, Callable, Union, get_args, get_origin
+import threading
+
+from pydantic import BaseModel, RootModel
+
+Converter = Callable[[Any], Any]
+
+_converters: dict[Any, Converter | None] = {}
+_fields: dict[type[BaseModel], dict[str, tuple[str, Converter | None]]] = {}
+_lock = threading.RLock()
+
+class LazyModel:
+    """
+    Unvalidated, attribute-access view over a raw JSON object shaped like `model`.
+
+    Returned by requests made with `validate=False`. Attributes use the model's field
+    names (`item.provider_ids`, `item.media_sources`) and are converted on first access:
+    nested objects become `LazyModel`s as well, root models (e.g. `ProviderIdDictionary`)
+    are built without validation and scalars are returned as sent by the server, so
+    datetimes stay ISO strings. Nothing is checked, so only use it for trusted servers.
+    """
+    __slots__ = ("_model", "_data", "_values")
+
+    def __init__(self, model: type[BaseModel], data: dict[str, Any]) -> None:
+        self._model = model
+        self._data = data
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Slots and dunder lookups (copy, pickle) must not reach `_values`, which
+            # may not be set yet on an instance that is being reconstructed.
+            raise AttributeError(name)
+        values = self._values
+        if name in values:
+            return values[name]
+        target = field_plan(self._model).get(name)
+        if target is None:
+            raise AttributeError(f"{self._model.__name__} has no field {name!r}")
+        alias, convert = target
+        raw = self._data.get(alias)
+        value = values[name] = convert(raw) if convert and raw is not None else raw
+        return value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Converted values are rebuilt on access, so only the model and raw data are copied.
+        return LazyModel, (self._model, self._data)
+
+    @property
+    def model_type(self) -> type[BaseModel]:
+        return self._model
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The underlying JSON object, keyed by the server's field names."""
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        """Validate the raw data into a regular instance of the model."""
+        return self._model.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}]({self._data!r})"
+
+def field_plan(model: type[BaseModel]) -> dict[str, tuple[str, Converter | None]]:
+    plan = _fields.get(model)
+    if plan is None:
+        with _lock:
+            plan = _fields.get(model)
+            if plan is None:
+                plan = _fields[model] = {
+                    name: (field.alias or name, lazy_converter(field.annotation))
+                    for name, field in model.model_fields.items()
+                }
+    return plan
+
+def _root_converter(model: type[RootModel[Any]]) -> Converter:
+    def build(value: Any) -> Any:
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", {"root": value})
+        object.__setattr__(instance, "__pydantic_fields_set__", {"root"})
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+    return build
+
+def lazy_converter(annotation: Any) -> Converter | None:
+    """
+    Return a function turning parsed JSON into the lazy form of `annotation`,
+    or `None` if the parsed value can be used as-is.
+    """
+    with _lock:
+        if annotation in _converters:
+            return _converters[annotation]
+        result: Converter | None = None
+        origin = get_origin(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, RootModel):
+            result = _root_converter(annotation)
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            model = annotation
+            result = lambda value: LazyModel(model, value) if isinstance(value, dict) else value
+        elif origin in (Union, UnionType):
+            options = [arg for arg in get_args(annotation) if arg is not NoneType]
+            result = lazy_converter(options[0]) if len(options) == 1 else None
+        elif origin is list:
+            item = lazy_converter(get_args(annotation)[0])
+            if item is not None:
+                result = lambda value: [item(entry) if entry is not None else None for entry in value]
+        elif origin is dict:
+            entry_value = lazy_converter(get_args(annotation)[1])
+            if entry_value is not None:
+                result = lambda value: {key: entry_value(entry) if entry is not None else None for key, entry in value.items()}
+        _converters[annotation] = result
+        return result
@@ -0,0 +1,82 @@
+from copy import copy
+import threading
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from remby.models import emby
+from remby.models.items import GetItemRequest
+
+_models: dict[tuple[str, ...], tuple[type[BaseModel], type[BaseModel]]] = {}
+_lock = threading.Lock()
+_CONFIG = ConfigDict(defer_build=True)
+
+def _is_image_field(name: str) -> bool:
+    return "image" in name
+
+def _build(fields: tuple[str, ...]) -> tuple[type[BaseModel], type[BaseModel]]:
+    definitions = {name: (emby.BaseItemDto.model_fields[name].annotation, copy(emby.BaseItemDto.model_fields[name])) for name in fields}
+    model = create_model(f"BaseItemDto[{', '.join(fields)}]", __config__=_CONFIG, __module__=__name__, **definitions)
+    page = create_model(
+        f"QueryResultBaseItemDto[{', '.join(fields)}]",
+        __config__=_CONFIG,
+        __module__=__name__,
+        items=(list[model] | None, Field(None, alias="Items")),
+        total_record_count=(int | None, Field(None, alias="TotalRecordCount"))
+    )
+    return model, page
+
+class ItemProjection:
+    """
+    A subset of `BaseItemDto` fields to request from and validate out of `/Items`.
+
+    `ItemProjection("id", "name", "provider_ids")` adds the matching `Fields`,
+    `EnableImages` and `EnableUserData` parameters to a query and validates the
+    response into a slim model that only declares those attributes, so the
+    remaining keys of every item are skipped instead of being validated. Slim
+    models are built once per set of field names and shared process-wide.
+    """
+    __slots__ = ("fields", "model", "page_model")
+
+    def __init__(self, *fields: str) -> None:
+        if not fields:
+            raise ValueError("ItemProjection requires at least one field")
+        unknown = [name for name in fields if name not in emby.BaseItemDto.model_fields]
+        if unknown:
+            raise ValueError(f"BaseItemDto has no field(s) {', '.join(map(repr, unknown))}")
+        self.fields = tuple(sorted(set(fields)))
+        self.model, self.page_model = _projection_models(self.fields)
+
+    @property
+    def enable_images(self) -> bool:
+        return any(_is_image_field(name) for name in self.fields)
+
+    @property
+    def enable_user_data(self) -> bool:
+        return "user_data" in self.fields
+
+    def apply(self, query: GetItemRequest) -> GetItemRequest:
+        """Return a copy of `query` that asks the server for exactly the projected fields."""
+        aliases = (emby.BaseItemDto.model_fields[name].alias or name for name in self.fields)
+        return query.model_copy(update={
+            "fields": ",".join(aliases),
+            "enable_images": self.enable_images,
+            "enable_user_data": self.enable_user_data
+        })
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ItemProjection) and other.fields == self.fields
+
+    def __hash__(self) -> int:
+        return hash(self.fields)
+
+    def __repr__(self) -> str:
+        return f"ItemProjection({', '.join(map(repr, self.fields))})"
+
+def _projection_models(fields: tuple[str, ...]) -> tuple[type[BaseModel], type[BaseModel]]:
+    models = _models.get(fields)
+    if models is None:
+        with _lock:
+            models = _models.get(fields)
+            if models is None:
+                models = _models[fields] = _build(fields)
+    return models
@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+import sys
+
+from remby.models.projection import ItemProjection
+
+def _provider_ids(value: Any) -> tuple[tuple[str, str], ...] | None:
+    if value is None:
+        return None
+    mapping = getattr(value, "root", value)
+    if not mapping:
+        return None
+    return tuple((sys.intern(key), id_) for key, id_ in mapping.items())
+
+def _datetime(value: Any) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+@dataclass(frozen=True, slots=True)
+class ItemRecord:
+    """
+    Compact, immutable record of the `BaseItemDto` fields most jobs need.
+
+    A slotted record has no per-instance dict and only keeps nine attributes,
+    so a few hundred thousand of them fit where the same number of full models
+    would take gigabytes. `type` and provider names are interned and provider
+    IDs are stored as a tuple of pairs.
+    """
+    id: str
+    name: str | None = None
+    type: str | None = None
+    parent_id: str | None = None
+    path: str | None = None
+    provider_ids: tuple[tuple[str, str], ...] | None = None
+    run_time_ticks: int | None = None
+    size: int | None = None
+    date_modified: datetime | None = None
+
+    @classmethod
+    def from_item(cls, item: Any) -> "ItemRecord":
+        """
+        Build a record from a `BaseItemDto`, a projected or `LazyModel` item, or
+        a plain item dict as yielded with `response_format="dict"`.
+        """
+        if isinstance(item, dict):
+            return cls(
+                item["Id"],
+                item.get("Name"),
+                _intern(item.get("Type")),
+                item.get("ParentId"),
+                item.get("Path"),
+                _provider_ids(item.get("ProviderIds")),
+                item.get("RunTimeTicks"),
+                item.get("Size"),
+                _datetime(item.get("DateModified"))
+            )
+        return cls(
+            item.id,
+            item.name,
+            _intern(item.type),
+            item.parent_id,
+            item.path,
+            _provider_ids(item.provider_ids),
+            item.run_time_ticks,
+            item.size,
+            _datetime(item.date_modified)
+        )
+
+    def provider_id(self, provider: str) -> str | None:
+        """Return the ID this item has at `provider` (e.g. `"Tmdb"`), matched case-insensitively."""
+        for name, value in self.provider_ids or ():
+            if name.lower() == provider.lower():
+                return value
+        return None
+
+class ItemSnapshot:
+    """
+    An in-memory collection of `ItemRecord`s, e.g. a full library snapshot.
+
+    Build it from any item iterable, typically
+    `client.items.iter_items(query, projection=RECORD_PROJECTION)` or the same
+    with `response_format="dict"`, and check its footprint with `memory_usage()`.
+    """
+    __slots__ = ("records",)
+
+    def __init__(self, records: Iterable[ItemRecord] = ()) -> None:
+        self.records: list[ItemRecord] = list(records)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Any]) -> "ItemSnapshot":
+        return cls(map(ItemRecord.from_item, items))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        self.records.extend(map(ItemRecord.from_item, items))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ItemRecord]:
+        return iter(self.records)
+
+    def __getitem__(self, index: int) -> ItemRecord:
+        return self.records[index]
+
+    def memory_usage(self) -> int:
+        """
+        Return the deep size of the snapshot in bytes.
+
+        Objects shared between records (interned strings, small ints) are counted once.
+        """
+        seen: set[int] = set()
+
+        def size(value: Any) -> int:
+            if value is None or id(value) in seen:
+                return 0
+            seen.add(id(value))
+            total = sys.getsizeof(value)
+            if isinstance(value, tuple):
+                total += sum(size(entry) for entry in value)
+            return total
+
+        total = size(self.records)
+        for record in self.records:
+            total += size(record)
+            for name in ItemRecord.__slots__:
+                total += size(getattr(record, name))
+        return total
+
+    def bytes_per_item(self) -> float:
+        return self.memory_usage() / len(self.records) if self.records else 0.0
+
+RECORD_FIELDS = ("id", "name", "type", "parent_id", "path", "provider_ids", "run_time_ticks", "size", "date_modified")
+
+def __getattr__(name: str) -> Any:
+    # Cached after the first access, which loads the generated models.
+    if name == "RECORD_PROJECTION":
+        value = globals()[name] = ItemProjection(*RECORD_FIELDS)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
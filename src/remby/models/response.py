@@ -8,6 +8,8 @@ class EmbyResponse(BaseModel, Generic[T]):
     data: T
     status_code: int
     headers: dict[str, str]
+    from_cache: bool = False
+    revalidated: bool = False
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -17,4 +19,4 @@ class EmbyResponse(BaseModel, Generic[T]):
             data=data,
             status_code=response.status_code,
             headers=dict(response.headers),
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+
+import pytest
+import respx
+from httpx import Response
+from remby import ARROW_PROJECTION, ArrowItemWriter, EmbyClient, GetItemRequest
+from remby._arrow import item_columns
+from remby.models.emby._internal import BaseItemDto
+
+ITEM = {
+    "Id": "1",
+    "Name": "Movie",
+    "Type": "Movie",
+    "Genres": ["Action"],
+    "ProviderIds": {"Tmdb": "603"},
+    "DateModified": "2024-06-01T12:00:00.0000000Z",
+    "MediaSources": [{"Id": "s1", "Path": "/media/movie.mkv", "Size": 10, "MediaStreams": []}]
+}
+
+def test_item_columns_from_dicts_and_models():
+    columns = item_columns([ITEM, BaseItemDto.model_validate({**ITEM, "Id": "2"})])
+
+    assert columns["id"] == ["1", "2"]
+    assert columns["genres"] == [["Action"], ["Action"]]
+    assert columns["provider_ids"] == [[("Tmdb", "603")], [("Tmdb", "603")]]
+    assert columns["date_modified"][0] == datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+    assert columns["media_sources"][1][0]["size"] == 10
+    assert columns["premiere_date"] == [None, None]
+
+@respx.mock
+def test_arrow_writer_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    def respond(request):
+        start = int(request.url.params["StartIndex"])
+        limit = int(request.url.params["Limit"])
+        return Response(200, json={
+            "Items": [{**ITEM, "Id": str(index)} for index in range(start, min(start + limit, 25))],
+            "TotalRecordCount": 25
+        })
+
+    respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    path = tmp_path / "items.parquet"
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        with ArrowItemWriter(path, row_group_size=10) as writer:
+            writer.write(client.items.iter_items(GetItemRequest(), page_size=7, response_format="dict", projection=ARROW_PROJECTION))
+
+    parquet = pq.ParquetFile(path)
+    assert [parquet.metadata.row_group(index).num_rows for index in range(parquet.num_row_groups)] == [10, 10, 5]
+    assert parquet.read().column("id").to_pylist() == [str(index) for index in range(25)]
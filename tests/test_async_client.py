@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+from remby import AsyncEmbyClient, ItemsCursor
+from remby.exceptions import AuthenticationError
+from remby.models.emby._internal import BaseItemDto
+from remby.models.items import GetItemRequest
+
+@respx.mock
+def test_async_get_system_ping():
+    respx.get("http://localhost:8096/System/Ping").mock(return_value=Response(200, text="Emby Server"))
+
+    async def run() -> str:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return await client.system.get_system_ping()
+
+    assert asyncio.run(run()) == "Emby Server"
+
+@respx.mock
+def test_async_get_items():
+    respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json={
+        "Items": [{"Name": "Bad", "Id": "12345", "Type": "MusicAlbum"}],
+        "TotalRecordCount": 1
+    }))
+
+    async def run():
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return await client.items.get_items(GetItemRequest(recursive=True))
+
+    result = asyncio.run(run())
+
+    assert result.data.items is not None
+    assert result.data.items[0].id == "12345"
+    assert isinstance(result.data.items[0], BaseItemDto)
+
+@respx.mock
+def test_async_iter_items_multi_page():
+    mock_url = "http://localhost:8096/Items"
+    route1 = respx.get(mock_url, params={"StartIndex": "0"}).mock(
+        return_value=Response(200, json={
+            "Items": [{"Name": "Page1-Item", "Id": "1"}],
+            "TotalRecordCount": 2
+        })
+    )
+    route2 = respx.get(mock_url, params={"StartIndex": "1"}).mock(
+        return_value=Response(200, json={
+            "Items": [{"Name": "Page2-Item", "Id": "2"}],
+            "TotalRecordCount": 2
+        })
+    )
+
+    async def run() -> list[BaseItemDto]:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return [item async for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=1)]
+
+    items = asyncio.run(run())
+
+    assert [item.name for item in items] == ["Page1-Item", "Page2-Item"]
+    assert route1.called
+    assert route2.called
+
+@respx.mock
+def test_async_concurrent_requests():
+    respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+    respx.get("http://localhost:8096/Users/2").mock(return_value=Response(200, json={"Id": "2"}))
+
+    async def run():
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return await asyncio.gather(client.users.get_users_by_id("1"), client.users.get_users_by_id("2"))
+
+    first, second = asyncio.run(run())
+
+    assert first.data.id == "1"
+    assert second.data.id == "2"
+
+@respx.mock
+def test_async_unauthorized():
+    respx.get("http://localhost:8096/System/Info").mock(return_value=Response(401, text="Unauthorized"))
+
+    async def run() -> None:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="invalid_token") as client:
+            await client.system.get_system_info()
+
+    with pytest.raises(AuthenticationError):
+        asyncio.run(run())
+
+@respx.mock
+def test_async_iter_items_prefetch():
+    respx.get("http://localhost:8096/Items").mock(
+        side_effect=lambda request: Response(200, json={
+            "Items": [{"Id": str(int(request.url.params["StartIndex"]) + offset)} for offset in range(int(request.url.params["Limit"]))],
+            "TotalRecordCount": 7
+        })
+    )
+
+    async def run() -> list[BaseItemDto]:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return [item async for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=3, max_items=7, prefetch=2)]
+
+    items = asyncio.run(run())
+
+    assert [item.id for item in items] == [str(index) for index in range(7)]
+
+@respx.mock
+def test_async_get_items_by_ids():
+    def respond(request):
+        chunk = request.url.params["Ids"].split(",")
+        return Response(200, json={"Items": [{"Id": item_id} for item_id in chunk if item_id != "b"], "TotalRecordCount": len(chunk)})
+
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    async def run():
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="test", response_format="raw") as client:
+            return await client.items.get_items_by_ids(["a", "b", "c"], max_url_bytes=35)
+
+    result = asyncio.run(run())
+
+    assert route.call_count == 3
+    assert result.items == [{"Id": "a"}, {"Id": "c"}]
+    assert result.missing == ["b"]
+
+@respx.mock
+def test_async_iter_items_keyset_pagination():
+    library = [{"Id": str(index), "SortName": name} for index, name in enumerate(["a", "a", "a", "b", "c"])]
+
+    def respond(request):
+        params = request.url.params
+        start = int(params.get("StartIndex", "0"))
+        matching = [item for item in library if item["SortName"] >= params.get("NameStartsWithOrGreater", "")]
+        return Response(200, json={"Items": matching[start:start + int(params["Limit"])], "TotalRecordCount": len(matching)})
+
+    respx.get("http://localhost:8096/Users/u1/Items").mock(side_effect=respond)
+
+    async def run() -> list[BaseItemDto]:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return [item async for item in client.items.iter_items_by_userid("u1", GetItemRequest(recursive=True), page_size=2, pagination="keyset")]
+
+    items = asyncio.run(run())
+
+    assert [item.id for item in items] == ["0", "1", "2", "3", "4"]
+
+@respx.mock
+def test_async_iter_items_resumes_cursor():
+    def respond(request):
+        start = int(request.url.params["StartIndex"])
+        limit = int(request.url.params["Limit"])
+        return Response(200, json={"Items": [{"Id": str(index)} for index in range(start, min(start + limit, 7))], "TotalRecordCount": 7})
+
+    respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+    cursor = ItemsCursor()
+
+    async def run(max_items=None) -> list[BaseItemDto]:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+            return [item async for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=2, max_items=max_items, cursor=cursor)]
+
+    first = asyncio.run(run(max_items=3))
+    rest = asyncio.run(run())
+
+    assert [item.id for item in first + rest] == [str(index) for index in range(7)]
+    assert (cursor.start, cursor.total, cursor.done) == (7, 7, True)
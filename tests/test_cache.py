@@ -0,0 +1,224 @@
+import asyncio
+import threading
+import time
+
+import respx
+from httpx import Response
+from remby import AsyncEmbyClient, CacheEntry, EmbyClient, GetItemRequest, ItemProjection, MemoryCache, SQLiteCache
+from remby._cache import cache_key
+from remby.models.emby._internal import BaseItemDto
+
+def _entry(endpoint: str, size: int, ttl: float = 60.0) -> CacheEntry:
+    return CacheEntry(endpoint=endpoint, status_code=200, headers={}, expires_at=time.time() + ttl, size=size, data=endpoint)
+
+def test_cache_key_is_canonical():
+    assert cache_key("get", "/Items", {"Limit": 10, "Recursive": True}) == cache_key("GET", "/Items", {"Recursive": "True", "Limit": "10"})
+    assert cache_key("GET", "/Items", {"Limit": 10}) != cache_key("GET", "/Items", {"Limit": 11})
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_bytes=100)
+    cache.set("a", _entry("/a", 40))
+    cache.set("b", _entry("/b", 40))
+    assert cache.get("a") is not None
+
+    cache.set("c", _entry("/c", 40))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.size == 80
+    assert cache.stats.evictions == 1
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache()
+    cache.set("a", _entry("/a", 1, ttl=-1.0))
+
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+def test_memory_cache_ttl_patterns():
+    cache = MemoryCache(ttls={"/System/Info*": 300, "/Users/*": 60})
+
+    assert cache.ttl_for("/System/Info/Public") == 300
+    assert cache.ttl_for("/Users/1") == 60
+    assert cache.ttl_for("/Items") is None
+
+@respx.mock
+def test_client_serves_repeated_gets_from_cache():
+    route = respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+    cache = MemoryCache(ttls={"/Users/*": 60})
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+        first = client.users.get_users_by_id("1")
+        second = client.users.get_users_by_id("1")
+
+    assert route.call_count == 1
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.data is first.data
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+@respx.mock
+def test_client_invalidation_and_uncached_endpoints():
+    users = respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+    items = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json={"Items": [], "TotalRecordCount": 0}))
+    cache = MemoryCache(ttls={"/Users/*": 60})
+
+    async def run() -> None:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+            await client.users.get_users_by_id("1")
+            assert cache.invalidate("/Users/*") == 1
+            await client.users.get_users_by_id("1")
+            await client.items.get_items(GetItemRequest())
+            await client.items.get_items(GetItemRequest())
+
+    asyncio.run(run())
+
+    assert users.call_count == 2
+    assert items.call_count == 2
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    first = SQLiteCache(path)
+    first.set("a", CacheEntry(endpoint="/Items", status_code=200, headers={"etag": "1"}, expires_at=time.time() + 60, size=2, content=b"{}"))
+    first.close()
+
+    second = SQLiteCache(path)
+    entry = second.get("a")
+
+    assert entry is not None
+    assert entry.content == b"{}"
+    assert entry.headers == {"etag": "1"}
+    assert second.stats.hits == 1
+
+def test_sqlite_cache_evicts_and_invalidates(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite", max_bytes=10)
+    for key in ("a", "b", "c"):
+        cache.set(key, CacheEntry(endpoint=f"/Users/{key}", status_code=200, headers={}, expires_at=time.time() + 60, size=4, content=b"null"))
+        time.sleep(0.001)
+
+    assert cache.get("a") is None
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+    assert cache.invalidate("/Users/*") == 2
+    assert len(cache) == 0
+
+@respx.mock
+def test_client_with_sqlite_cache_warm_start(tmp_path):
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json={
+        "Items": [{"Name": "Bad", "Id": "12345"}],
+        "TotalRecordCount": 1
+    }))
+    path = tmp_path / "cache.sqlite"
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=SQLiteCache(path, ttls={"/Items": 60})) as client:
+        client.items.get_items(GetItemRequest(recursive=True, limit=1))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=SQLiteCache(path, ttls={"/Items": 60})) as client:
+        result = client.items.get_items(GetItemRequest(limit=1, recursive=True))
+
+    assert route.call_count == 1
+    assert result.from_cache is True
+    assert result.data.items is not None
+    assert result.data.items[0].name == "Bad"
+
+@respx.mock
+def test_stale_entry_is_revalidated_with_etag():
+    def respond(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(304, headers={"ETag": '"v1"'})
+        return Response(200, json={"Id": "1"}, headers={"ETag": '"v1"'})
+
+    route = respx.get("http://localhost:8096/Users/1").mock(side_effect=respond)
+    cache = MemoryCache(ttls={"/Users/*": 0})
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+        first = client.users.get_users_by_id("1")
+        second = client.users.get_users_by_id("1")
+
+    assert route.call_count == 2
+    assert first.revalidated is False
+    assert second.revalidated is True
+    assert second.from_cache is True
+    assert second.data is first.data
+    assert cache.stats.revalidations == 1
+
+@respx.mock
+def test_stale_sqlite_entry_is_revalidated_with_last_modified(tmp_path):
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def respond(request):
+        if request.headers.get("If-Modified-Since") == last_modified:
+            return Response(304)
+        return Response(200, json={"Id": "1"}, headers={"Last-Modified": last_modified})
+
+    respx.get("http://localhost:8096/Users/1").mock(side_effect=respond)
+
+    async def run():
+        cache = SQLiteCache(tmp_path / "cache.sqlite", ttls={"/Users/*": 0})
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+            await client.users.get_users_by_id("1")
+            return await client.users.get_users_by_id("1")
+
+    result = asyncio.run(run())
+
+    assert result.revalidated is True
+    assert result.data.id == "1"
+
+@respx.mock
+def test_async_client_keeps_sqlite_cache_off_the_event_loop(tmp_path):
+    respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+    threads = set()
+
+    class RecordingCache(SQLiteCache):
+        def get(self, key):
+            threads.add(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, entry):
+            threads.add(threading.get_ident())
+            super().set(key, entry)
+
+    async def run():
+        cache = RecordingCache(tmp_path / "cache.sqlite", ttls={"/Users/*": 60})
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+            await client.users.get_users_by_id("1")
+            return await client.users.get_users_by_id("1")
+
+    result = asyncio.run(run())
+
+    assert result.from_cache is True
+    assert threads and threading.get_ident() not in threads
+
+@respx.mock
+def test_stale_entry_without_validators_is_refetched():
+    route = respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+    cache = MemoryCache(ttls={"/Users/*": 0})
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+        client.users.get_users_by_id("1")
+        result = client.users.get_users_by_id("1")
+
+    assert route.call_count == 2
+    assert "If-None-Match" not in route.calls.last.request.headers
+    assert result.from_cache is False
+
+@respx.mock
+def test_object_cache_keys_on_response_type():
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json={"Items": [{"Id": "1", "Name": "Movie"}], "TotalRecordCount": 1}))
+    cache = MemoryCache(ttls={"/Items": 60})
+    projection = ItemProjection("id", "name")
+    query = GetItemRequest(recursive=True)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+        slim = client.items.get_items(query, projection=projection)
+        full = client.items.get_items(projection.apply(query))
+        again = client.items.get_items(projection.apply(query))
+
+    assert type(slim.data) is projection.page_model
+    assert isinstance(full.data.items[0], BaseItemDto)
+    assert again.from_cache is True
+    assert route.call_count == 2
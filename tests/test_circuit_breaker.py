@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+from remby import AsyncEmbyClient, CircuitBreaker, CircuitOpenError, CircuitState, EmbyClient
+from remby.exceptions import EmbyException
+
+@respx.mock
+def test_circuit_opens_and_fails_fast():
+    route = respx.get("http://localhost:8096/System/Info").mock(return_value=Response(503))
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", circuit_breaker=breaker) as client:
+        for _ in range(2):
+            with pytest.raises(EmbyException):
+                client.system.get_system_info()
+
+        assert breaker.state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            client.system.get_system_info()
+
+    assert route.call_count == 2
+
+@respx.mock
+def test_circuit_ignores_client_errors():
+    respx.get("http://localhost:8096/Users/1").mock(return_value=Response(404))
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", circuit_breaker=breaker) as client:
+        with pytest.raises(EmbyException):
+            client.users.get_users_by_id("1")
+
+    assert breaker.state is CircuitState.CLOSED
+
+@respx.mock
+def test_circuit_closes_after_successful_probe():
+    respx.get("http://localhost:8096/System/Ping").mock(side_effect=[Response(500), Response(200, text="Emby Server")])
+    probe = respx.head("http://localhost:8096/System/Ping").mock(return_value=Response(200))
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", circuit_breaker=breaker) as client:
+        with pytest.raises(EmbyException):
+            client.system.get_system_ping()
+        assert breaker.state is CircuitState.OPEN
+
+        assert client.system.get_system_ping() == "Emby Server"
+
+    assert probe.call_count == 1
+    assert breaker.state is CircuitState.CLOSED
+
+@respx.mock
+def test_circuit_stays_open_after_failed_probe():
+    route = respx.get("http://localhost:8096/System/Ping").mock(return_value=Response(500))
+    probe = respx.head("http://localhost:8096/System/Ping").mock(return_value=Response(503))
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+
+    async def run() -> None:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", circuit_breaker=breaker) as client:
+            with pytest.raises(EmbyException):
+                await client.system.get_system_ping()
+            with pytest.raises(CircuitOpenError):
+                await client.system.get_system_ping()
+
+    asyncio.run(run())
+
+    assert route.call_count == 1
+    assert probe.call_count == 1
+    assert breaker.state is CircuitState.OPEN
+
+@respx.mock
+def test_cancelled_probe_reopens_circuit():
+    respx.get("http://localhost:8096/System/Ping").mock(side_effect=[Response(500), Response(200, text="Emby Server")])
+    probes = []
+
+    async def probe(request):
+        probes.append(request)
+        if len(probes) == 1:
+            await asyncio.sleep(10)
+        return Response(200)
+
+    respx.head("http://localhost:8096/System/Ping").mock(side_effect=probe)
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+
+    async def run() -> str:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", circuit_breaker=breaker) as client:
+            with pytest.raises(EmbyException):
+                await client.system.get_system_ping()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.system.get_system_ping(), timeout=0.05)
+            assert breaker.state is CircuitState.OPEN
+            return await client.system.get_system_ping()
+
+    assert asyncio.run(run()) == "Emby Server"
+    assert len(probes) == 2
+    assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,40 @@
+import asyncio
+
+import httpx
+from remby import AsyncEmbyClient, EmbyClient
+
+def _spy(monkeypatch, name):
+    captured = {}
+    original = getattr(httpx, name)
+
+    class Spy(original):
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, name, Spy)
+    return captured
+
+def test_client_connection_options(monkeypatch):
+    captured = _spy(monkeypatch, "Client")
+    timeout = httpx.Timeout(10.0, connect=2.0, pool=1.0)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", timeout=timeout, max_connections=5, max_keepalive_connections=2, keepalive_expiry=30.0):
+        pass
+
+    assert captured["timeout"] == timeout
+    limits = captured["limits"]
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (5, 2, 30.0)
+    assert captured["http2"] is False
+
+def test_async_client_connection_options(monkeypatch):
+    captured = _spy(monkeypatch, "AsyncClient")
+
+    async def run() -> None:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", max_connections=8, keepalive_expiry=None):
+            pass
+
+    asyncio.run(run())
+
+    limits = captured["limits"]
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (8, 20, None)
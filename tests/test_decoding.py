@@ -0,0 +1,51 @@
+from typing import List
+
+import pytest
+import respx
+from httpx import Response
+from remby import EmbyClient
+from remby._decoding import DecodeOptions, decode, type_adapter
+from remby.models.emby._internal import QueryResultBaseItemDto, UserDto
+
+PAGE = b'{"Items": [{"Name": "Bad", "Id": "1", "ProviderIds": {"Imdb": "tt1"}, "DateModified": "2024-06-01T12:00:00.0000000Z"}], "TotalRecordCount": 1}'
+
+@pytest.mark.parametrize("backend", ["pydantic", "json", "orjson"])
+def test_decode_backends_agree(backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+
+    expected = QueryResultBaseItemDto.model_validate_json(PAGE)
+
+    assert decode(QueryResultBaseItemDto, PAGE, DecodeOptions(backend=backend)) == expected
+    assert decode(List[UserDto], b'[{"Id": "1"}]', DecodeOptions(backend=backend))[0].id == "1"
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        EmbyClient(base_url="http://localhost:8096", api_key="dummy", json_backend="simdjson")  # type: ignore[arg-type]
+
+@respx.mock
+def test_client_json_backend():
+    pytest.importorskip("orjson")
+    respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", json_backend="orjson") as client:
+        result = client.users.get_users_by_id("1")
+
+    assert result.data.id == "1"
+
+def test_type_adapters_are_built_once():
+    assert type_adapter(List[UserDto]) is type_adapter(List[UserDto])
+
+@respx.mock
+def test_repeated_list_requests_reuse_adapter(monkeypatch):
+    respx.get("http://localhost:8096/Users/Public").mock(return_value=Response(200, json=[{"Id": "1"}]))
+    type_adapter(List[UserDto])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("TypeAdapter rebuilt")
+
+    monkeypatch.setattr("remby._decoding.TypeAdapter", fail)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+        for _ in range(3):
+            assert client.users.get_users_public().data[0].id == "1"
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import remby
+import remby.models.emby as emby
+import remby.models.records as records
+from remby.models.emby._internal import BaseItemDto
+
+SRC = Path(__file__).parent.parent / "src"
+
+def test_import_does_not_load_generated_models():
+    code = "import sys, remby; print('remby.models.emby._internal' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": str(SRC)})
+
+    assert output.stdout.strip() == "False"
+
+def test_lazy_package_exports():
+    assert emby.BaseItemDto is BaseItemDto
+    assert "BaseItemDto" in dir(emby)
+    assert BaseItemDto.model_config.get("defer_build") is True
+
+    with pytest.raises(AttributeError):
+        emby.NotAModel
+
+def test_lazy_projections_are_cached():
+    assert remby.ARROW_PROJECTION is remby.ARROW_PROJECTION
+    assert "id" in remby.ARROW_PROJECTION.fields
+    assert records.RECORD_PROJECTION is records.RECORD_PROJECTION
+
+    with pytest.raises(AttributeError):
+        remby.NotAnExport
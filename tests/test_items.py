@@ -1,8 +1,9 @@
 from pathlib import Path
 
+import pytest
 import respx
 from httpx import Response
-from remby import EmbyClient
+from remby import AdaptivePageSize, EmbyClient, ItemProjection, ItemsCursor
 from remby.models.emby._internal import BaseItemDto
 from remby.models.items import GetItemRequest
 
@@ -133,4 +134,276 @@ def test_get_users_by_userid_items_resume():
     assert len(result.data.items) == 1
     assert result.data.items[0].id == "12345"
     assert result.data.items[0].name == "Bad"
-    assert isinstance(result.data.items[0], BaseItemDto)
\ No newline at end of file
+    assert isinstance(result.data.items[0], BaseItemDto)
+
+@respx.mock
+def test_iter_items_prefetch():
+    mock_url = "http://localhost:8096/Items"
+
+    for index in range(5):
+        respx.get(mock_url, params={"StartIndex": str(index * 2)}).mock(
+            return_value=Response(200, json={
+                "Items": [{"Name": f"Item-{index * 2 + offset}", "Id": str(index * 2 + offset)} for offset in range(2) if index * 2 + offset < 9],
+                "TotalRecordCount": 9
+            })
+        )
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        items = list(client.items.iter_items(GetItemRequest(recursive=True), page_size=2, prefetch=3, read_ahead=4))
+
+    assert [item.id for item in items] == [str(index) for index in range(9)]
+
+@respx.mock
+def test_iter_items_prefetch_max_items():
+    mock_url = "http://localhost:8096/Items"
+    route = respx.get(mock_url).mock(
+        side_effect=lambda request: Response(200, json={
+            "Items": [{"Id": str(int(request.url.params["StartIndex"]) + offset)} for offset in range(int(request.url.params["Limit"]))],
+            "TotalRecordCount": 100
+        })
+    )
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        items = list(client.items.iter_items(GetItemRequest(recursive=True), page_size=2, max_items=5, prefetch=2))
+
+    assert [item.id for item in items] == ["0", "1", "2", "3", "4"]
+    assert route.call_count == 3
+
+def test_adaptive_page_size_bounds():
+    sizing = AdaptivePageSize(initial=100, min_size=10, max_size=400, target_seconds=1.0, target_bytes=1_000_000)
+
+    assert sizing.next_size(100, 100, 0.01, None) == 200
+    assert sizing.next_size(100, 100, 10.0, None) == 50
+    assert sizing.next_size(100, 100, 0.01, 10_000_000) == 50
+    assert sizing.next_size(300, 300, 0.001, 1000) == 400
+    assert sizing.next_size(12, 12, 100.0, None) == 10
+
+@respx.mock
+def test_iter_items_adaptive_page_size():
+    mock_url = "http://localhost:8096/Items"
+    limits = []
+
+    def respond(request):
+        start = int(request.url.params["StartIndex"])
+        limit = int(request.url.params["Limit"])
+        limits.append(limit)
+        return Response(200, json={
+            "Items": [{"Id": str(start + offset)} for offset in range(min(limit, 100 - start))],
+            "TotalRecordCount": 100
+        }, headers={"Content-Length": str(limit * 1000)})
+
+    respx.get(mock_url).mock(side_effect=respond)
+
+    sizing = AdaptivePageSize(initial=40, min_size=5, max_size=80, target_bytes=10_000)
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        items = list(client.items.iter_items(GetItemRequest(recursive=True), page_size=sizing))
+
+    assert [item.id for item in items] == [str(index) for index in range(100)]
+    assert limits[:3] == [40, 20, 10]
+
+@respx.mock
+def test_get_items_with_projection():
+    route = respx.get("http://localhost:8096/Items").mock(
+        return_value=Response(200, json={
+            "Items": [{"Id": "1", "Name": "Movie", "Overview": "...", "ProviderIds": {"Tmdb": "603"}, "ImageTags": {"Primary": "abc"}}],
+            "TotalRecordCount": 1
+        })
+    )
+
+    projection = ItemProjection("provider_ids", "id", "name")
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        response = client.items.get_items(GetItemRequest(recursive=True), projection=projection)
+
+    params = route.calls[0].request.url.params
+    assert params["Fields"] == "Id,Name,ProviderIds"
+    assert params["EnableImages"] == "false"
+    assert params["EnableUserData"] == "false"
+    item = response.data.items[0]
+    assert set(type(item).model_fields) == {"id", "name", "provider_ids"}
+    assert item.provider_ids.root == {"Tmdb": "603"}
+    assert ItemProjection("name", "id", "provider_ids").model is type(item)
+
+def test_item_projection_flags_and_validation():
+    projection = ItemProjection("id", "image_tags", "user_data")
+
+    query = projection.apply(GetItemRequest())
+    assert query.enable_images is True
+    assert query.enable_user_data is True
+
+    with pytest.raises(ValueError):
+        ItemProjection("id", "not_a_field")
+
+@respx.mock
+def test_get_items_by_ids_chunks_and_keeps_order():
+    ids = [f"{index:032x}" for index in range(200)]
+    requested = []
+
+    def respond(request):
+        chunk = request.url.params["Ids"].split(",")
+        requested.append(chunk)
+        assert len(str(request.url)) <= 1024
+        return Response(200, json={"Items": [{"Id": item_id} for item_id in reversed(chunk) if item_id != ids[7]], "TotalRecordCount": len(chunk)})
+
+    respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        result = client.items.get_items_by_ids(ids + [ids[0]], fields=["id", "name"], max_url_bytes=1024, concurrency=4)
+
+    assert len(requested) > 1
+    assert sorted(item_id for chunk in requested for item_id in chunk) == sorted(ids)
+    assert [item.id for item in result.items] == [item_id for item_id in ids if item_id != ids[7]]
+    assert set(type(result.items[0]).model_fields) == {"id", "name"}
+    assert result.missing == [ids[7]]
+
+def _sorted_library(library):
+    def respond(request):
+        params = request.url.params
+        key = params.get("NameStartsWithOrGreater", "")
+        start = int(params.get("StartIndex", "0"))
+        limit = int(params["Limit"])
+        # Ties on SortName come back in a different order once a seek key is set.
+        tiebreak = (lambda item: [-ord(char) for char in item["Id"]]) if key else (lambda item: item["Id"])
+        matching = sorted((item for item in library if item["SortName"] >= key), key=lambda item: (item["SortName"], tiebreak(item)))
+        return Response(200, json={"Items": matching[start:start + limit], "TotalRecordCount": len(matching)})
+    return respond
+
+@respx.mock
+def test_iter_items_keyset_pagination():
+    library = [{"Id": f"{index:02d}", "SortName": name} for index, name in enumerate(["a", "b", "b", "b", "c", "d", "e", "f", "g"])]
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=_sorted_library(library))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        items = []
+        for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=2, response_format="dict", pagination="keyset"):
+            items.append(item)
+            if len(items) == 3:
+                # An item inserted before the scan position mustn't shift the remaining pages.
+                library.append({"Id": "99", "SortName": "a"})
+
+    ids = [item["Id"] for item in items]
+    assert sorted(ids) == [f"{index:02d}" for index in range(9)]
+    assert [library[int(item_id)]["SortName"] for item_id in ids] == sorted(library[index]["SortName"] for index in range(9))
+    params = [call.request.url.params for call in route.calls]
+    assert params[0]["SortBy"] == "SortName"
+    assert params[0]["Fields"] == "SortName"
+    assert "NameStartsWithOrGreater" not in params[0]
+    assert (params[1]["NameStartsWithOrGreater"], params[1]["Limit"]) == ("b", "3")
+    assert all("StartIndex" not in param for param in params)
+
+@respx.mock
+def test_iter_items_keyset_adds_sort_name_to_projection():
+    library = [{"Id": str(index), "Name": f"Item {index}", "SortName": f"item {index}"} for index in range(5)]
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=_sorted_library(library))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        items = list(client.items.iter_items(GetItemRequest(recursive=True), page_size=2, max_items=4, projection=ItemProjection("id", "name"), pagination="keyset"))
+        with pytest.raises(ValueError):
+            list(client.items.iter_items(GetItemRequest(recursive=True), prefetch=2, pagination="keyset"))
+
+    assert [item.name for item in items] == ["Item 0", "Item 1", "Item 2", "Item 3"]
+    assert route.calls[0].request.url.params["Fields"] == "Id,Name,SortName"
+
+def _offset_library(count):
+    def respond(request):
+        start = int(request.url.params["StartIndex"])
+        limit = int(request.url.params["Limit"])
+        return Response(200, json={"Items": [{"Id": str(index)} for index in range(start, min(start + limit, count))], "TotalRecordCount": count})
+    return respond
+
+@respx.mock
+def test_iter_items_resumes_from_checkpoint(tmp_path):
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=_offset_library(10))
+    checkpoint = tmp_path / "scan.json"
+    processed = []
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        with pytest.raises(RuntimeError):
+            for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=3, response_format="dict", checkpoint=checkpoint, checkpoint_every=2):
+                if item["Id"] == "7":
+                    raise RuntimeError("worker died")
+                processed.append(item["Id"])
+
+        saved = ItemsCursor.load(checkpoint)
+        assert (saved.start, saved.yielded, saved.total, saved.done) == (6, 6, 10, False)
+
+        calls = route.call_count
+        resumed = [item["Id"] for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=3, response_format="dict", checkpoint=checkpoint, checkpoint_every=2)]
+
+        assert resumed == ["6", "7", "8", "9"]
+        assert route.calls[calls].request.url.params["StartIndex"] == "6"
+        assert not checkpoint.exists()
+        rerun = [item["Id"] for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=3, response_format="dict", checkpoint=checkpoint)]
+        assert rerun == [str(index) for index in range(10)]
+
+        ItemsCursor(query_hash=saved.query_hash, start=10, yielded=10, total=10, done=True).save(checkpoint)
+        assert len(list(client.items.iter_items(GetItemRequest(recursive=True), page_size=3, response_format="dict", checkpoint=checkpoint))) == 10
+
+@respx.mock
+def test_iter_items_keyset_cursor_round_trip():
+    library = [{"Id": str(index), "SortName": name} for index, name in enumerate(["a", "b", "b", "b", "c"])]
+    respx.get("http://localhost:8096/Items").mock(side_effect=_sorted_library(library))
+    query = GetItemRequest(recursive=True)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        cursor = ItemsCursor()
+        first = [item["Id"] for item in client.items.iter_items(query, page_size=2, max_items=3, response_format="dict", pagination="keyset", cursor=cursor)]
+        restored = ItemsCursor.from_json(cursor.to_json())
+        rest = [item["Id"] for item in client.items.iter_items(query, page_size=2, response_format="dict", pagination="keyset", cursor=restored)]
+
+        with pytest.raises(ValueError):
+            list(client.items.iter_items(GetItemRequest(recursive=False), response_format="dict", pagination="keyset", cursor=ItemsCursor.from_json(cursor.to_json())))
+
+    assert (cursor.key, len(cursor.tied), cursor.yielded) == ("b", 2, 3)
+    assert sorted(first + rest) == ["0", "1", "2", "3", "4"]
+    assert restored.yielded == 5 and restored.done
+
+@respx.mock
+def test_iter_items_checkpoint_survives_short_prefetched_page(tmp_path):
+    def respond(request):
+        start = int(request.url.params["StartIndex"])
+        limit = int(request.url.params["Limit"])
+        end = min(start + limit, 12)
+        if start == 3:
+            # A short window whose remainder comes back empty, as if items 4 and 5 were deleted.
+            end = 4
+        elif start == 4:
+            end = start
+        return Response(200, json={"Items": [{"Id": str(index)} for index in range(start, end)], "TotalRecordCount": 12})
+
+    respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+    checkpoint = tmp_path / "scan.json"
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        with pytest.raises(RuntimeError):
+            for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=3, prefetch=2, response_format="dict", checkpoint=checkpoint):
+                if item["Id"] == "10":
+                    raise RuntimeError("worker died")
+
+        assert ItemsCursor.load(checkpoint).done is False
+        resumed = [item["Id"] for item in client.items.iter_items(GetItemRequest(recursive=True), page_size=3, response_format="dict", checkpoint=checkpoint)]
+
+    assert resumed == ["9", "10", "11"]
+
+@respx.mock
+def test_get_items_by_ids_always_requests_id():
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json={"Items": [{"Id": "a", "Name": "Movie"}], "TotalRecordCount": 1}))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        result = client.items.get_items_by_ids(["a", "b"], fields=["name"])
+
+    assert route.calls[0].request.url.params["Fields"] == "Id,Name"
+    assert [item.name for item in result.items] == ["Movie"]
+    assert result.missing == ["b"]
+
+@respx.mock
+def test_iter_items_keyset_respects_query_start_and_sort():
+    library = [{"Id": str(index), "SortName": name} for index, name in enumerate(["a", "m", "n", "z"])]
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=_sorted_library(library))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        items = list(client.items.iter_items(GetItemRequest(name_starts_with_or_greater="m"), page_size=10, response_format="dict", pagination="keyset"))
+        with pytest.raises(ValueError):
+            list(client.items.iter_items(GetItemRequest(sort_by="DateCreated"), pagination="keyset"))
+
+    assert [item["Id"] for item in items] == ["1", "2", "3"]
+    assert route.calls[0].request.url.params["NameStartsWithOrGreater"] == "m"
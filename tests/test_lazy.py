@@ -0,0 +1,77 @@
+import copy
+import pickle
+
+import respx
+from httpx import Response
+from remby import EmbyClient, GetItemRequest, LazyModel, MemoryCache
+from remby._decoding import DecodeOptions, decode
+from remby.models.emby._internal import BaseItemDto, ProviderIdDictionary, QueryResultBaseItemDto
+
+PAGE = {
+    "Items": [
+        {
+            "Name": "Bad",
+            "Id": "1",
+            "DateModified": "2024-06-01T12:00:00.0000000Z",
+            "ProviderIds": {"Imdb": "tt1"},
+            "MediaSources": [{"Size": 42, "MediaStreams": [{"Codec": "hevc", "Type": "Video"}]}],
+            "People": [{"Name": "Michael", "Type": "Actor"}],
+        }
+    ],
+    "TotalRecordCount": 1,
+}
+
+def test_unvalidated_decode_returns_lazy_models():
+    page = decode(QueryResultBaseItemDto, Response(200, json=PAGE).content, DecodeOptions(validate=False))
+
+    assert isinstance(page, LazyModel)
+    assert page.total_record_count == 1
+    item = page.items[0]
+    assert item.model_type is BaseItemDto
+    assert item.name == "Bad"
+    assert item.overview is None
+    assert item.date_modified == "2024-06-01T12:00:00.0000000Z"
+    assert isinstance(item.provider_ids, ProviderIdDictionary)
+    assert item.provider_ids.root == {"Imdb": "tt1"}
+    assert item.media_sources[0].size == 42
+    assert item.media_sources[0].media_streams[0].codec == "hevc"
+    assert item.people[0].name == "Michael"
+    assert item.to_model() == BaseItemDto.model_validate(PAGE["Items"][0])
+
+def test_lazy_models_can_be_copied_and_pickled():
+    item = decode(QueryResultBaseItemDto, Response(200, json=PAGE).content, DecodeOptions(validate=False)).items[0]
+    assert item.name == "Bad"
+
+    shallow = copy.copy(item)
+    deep = copy.deepcopy(item)
+    restored = pickle.loads(pickle.dumps(item))
+
+    for clone in (shallow, deep, restored):
+        assert clone.model_type is BaseItemDto
+        assert clone.media_sources[0].media_streams[0].codec == "hevc"
+    assert deep.raw == item.raw and deep.raw is not item.raw
+    assert restored.raw == item.raw
+
+@respx.mock
+def test_iter_items_without_validation():
+    respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json=PAGE))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", validate=False) as client:
+        items = list(client.items.iter_items(GetItemRequest(recursive=True)))
+
+    assert len(items) == 1
+    assert isinstance(items[0], LazyModel)
+    assert items[0].id == "1"
+
+@respx.mock
+def test_unvalidated_results_are_not_served_from_object_caches():
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json=PAGE))
+    cache = MemoryCache(ttls={"/Items": 60})
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=cache) as client:
+        trusted = client.items.get_items(GetItemRequest(), validate=False)
+        validated = client.items.get_items(GetItemRequest())
+
+    assert route.call_count == 2
+    assert isinstance(trusted.data, LazyModel)
+    assert isinstance(validated.data, QueryResultBaseItemDto)
@@ -0,0 +1,57 @@
+import respx
+from httpx import Response
+from remby import EmbyClient, GetItemRequest, LibraryMirror
+
+def library(ids):
+    return [{"Id": item_id, "Name": f"Item {item_id}", "Type": "Movie", "ParentId": "p"} for item_id in ids]
+
+@respx.mock
+def test_library_mirror_full_incremental_and_reconcile(tmp_path):
+    server = {"items": library(["1", "2", "3"]), "changed": []}
+    seen_params = []
+
+    def respond(request):
+        params = dict(request.url.params)
+        seen_params.append(params)
+        items = server["changed"] if "MinDateLastSaved" in params else server["items"]
+        start, limit = int(params["StartIndex"]), int(params["Limit"])
+        return Response(200, json={"Items": items[start:start + limit], "TotalRecordCount": len(items)})
+
+    respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        mirror = LibraryMirror(client, tmp_path / "mirror.sqlite", GetItemRequest(recursive=True), page_size=2, reconcile_interval=0)
+
+        first = mirror.sync()
+        assert (first.mode, first.upserted, first.deleted) == ("full", 3, 0)
+        assert len(mirror) == 3
+
+        server["items"] = library(["1", "3"])
+        server["changed"] = [{"Id": "3", "Name": "Renamed", "Type": "Movie", "ParentId": "p"}]
+        second = mirror.sync()
+
+        assert (second.mode, second.upserted, second.deleted, second.reconciled) == ("incremental", 1, 1, True)
+        assert "MinDateLastSaved" in seen_params[2]
+        assert seen_params[-1]["Fields"] == "Id"
+        assert "2" not in mirror
+        assert mirror.get("3").name == "Renamed"
+        assert [item["Id"] for item in mirror.iter_raw(item_type="Movie")] == ["1", "3"]
+        mirror.close()
+
+    # The state survives a restart, so the next sync is incremental.
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        with LibraryMirror(client, tmp_path / "mirror.sqlite", reconcile_interval=None) as mirror:
+            assert mirror.sync().mode == "incremental"
+            assert mirror.get_raw("1")["Name"] == "Item 1"
+
+@respx.mock
+def test_library_mirror_user_data_pass(tmp_path):
+    route = respx.get("http://localhost:8096/Users/u/Items").mock(return_value=Response(200, json={"Items": [], "TotalRecordCount": 0}))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        with LibraryMirror(client, tmp_path / "mirror.sqlite", user_id="u", reconcile_interval=None) as mirror:
+            mirror.sync()
+            mirror.sync()
+
+    assert "MinDateLastSavedForUser" in route.calls[-1].request.url.params
+    assert route.calls[0].request.url.params["Fields"] == LibraryMirror.DEFAULT_FIELDS
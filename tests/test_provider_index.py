@@ -0,0 +1,98 @@
+import threading
+from types import SimpleNamespace
+
+import respx
+from httpx import Response
+from remby import EmbyClient, GetItemRequest, ItemRecord, ProviderIdIndex
+from remby.models.emby._internal import BaseItemDto
+
+ITEMS = [
+    {"Id": "1", "ProviderIds": {"Imdb": "tt0133093", "Tmdb": "603"}},
+    {"Id": "2", "ProviderIds": {"Tvdb": "81189"}},
+]
+
+@respx.mock
+def test_build_and_resolve_with_server_fallback():
+    def respond(request):
+        params = request.url.params
+        if "AnyProviderIdEquals" in params:
+            assert params["AnyProviderIdEquals"] == "tmdb.1396,imdb.tt0000000"
+            return Response(200, json={"Items": [{"Id": "3", "ProviderIds": {"Tmdb": "1396"}}], "TotalRecordCount": 1})
+        return Response(200, json={"Items": ITEMS, "TotalRecordCount": 2})
+
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        index = ProviderIdIndex(client, GetItemRequest(recursive=True), batch_size=10)
+        assert index.build() == 2
+        assert route.calls[0].request.url.params["Fields"] == "Id,ProviderIds"
+
+        resolved = index.resolve_provider_ids(["IMDB.tt0133093", "tvdb.81189", "tmdb.1396", "imdb.tt0000000", "tmdb.1396"])
+
+    assert resolved == {"IMDB.tt0133093": ["1"], "tvdb.81189": ["2"], "tmdb.1396": ["3"], "imdb.tt0000000": []}
+    assert route.call_count == 2
+
+def test_update_reindexes_and_accepts_any_item_shape():
+    index = ProviderIdIndex(client=None)
+    index.update([BaseItemDto.model_validate(ITEMS[0]), ItemRecord.from_item(ITEMS[1])])
+    assert index.lookup("tmdb.603") == ["1"]
+    assert index.lookup("tvdb.81189") == ["2"]
+
+    index.update([{"Id": "1", "ProviderIds": {"Tmdb": "604"}}])
+    assert index.lookup("tmdb.603") == []
+    assert index.lookup("tmdb.604") == ["1"]
+
+    index.remove(["2"])
+    assert "tvdb.81189" not in index
+
+@respx.mock
+def test_refresh_reconciles_deleted_items():
+    library = list(ITEMS)
+
+    def respond(request):
+        params = request.url.params
+        if "MinDateLastSaved" in params:
+            return Response(200, json={"Items": [], "TotalRecordCount": 0})
+        return Response(200, json={"Items": [{"Id": item["Id"]} for item in library] if params["Fields"] == "Id" else library, "TotalRecordCount": len(library)})
+
+    respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        index = ProviderIdIndex(client, GetItemRequest(recursive=True), reconcile_interval=0.0)
+        index.build()
+        library.pop(1)
+        index.refresh()
+
+    assert index.lookup("tvdb.81189") == []
+    assert index.lookup("tmdb.603") == ["1"]
+
+def test_contains_ignores_malformed_keys():
+    index = ProviderIdIndex(client=None)
+    index.update(ITEMS)
+    assert "tmdb.603" in index
+    assert "tmdb" not in index
+    assert 603 not in index
+
+def test_update_does_not_hold_the_lock_while_scanning():
+    server = SimpleNamespace(items=SimpleNamespace(iter_items=lambda *args, **kwargs: iter([{"Id": "3", "ProviderIds": {"Tmdb": "1396"}}])))
+    index = ProviderIdIndex(client=server)
+    index.update(ITEMS[:1])
+    scanning, resume = threading.Event(), threading.Event()
+
+    def scan():
+        yield ITEMS[1]
+        scanning.set()
+        resume.wait(5)
+
+    worker = threading.Thread(target=index.update, args=(scan(),))
+    worker.start()
+    try:
+        assert scanning.wait(5)
+        answered = []
+        reader = threading.Thread(target=lambda: answered.append(index.resolve_provider_ids(["tmdb.603", "tmdb.1396"])))
+        reader.start()
+        reader.join(1)
+        assert answered == [{"tmdb.603": ["1"], "tmdb.1396": ["3"]}]
+    finally:
+        resume.set()
+        worker.join()
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+
+import respx
+from httpx import Response, SyncByteStream
+from remby import AsyncEmbyClient, EmbyClient, GetItemRequest, RateLimit, RateLimiter
+
+def test_token_bucket_allows_burst_then_throttles():
+    limiter = RateLimiter(rate=10.0, burst=3)
+
+    started = time.monotonic()
+    for _ in range(5):
+        with limiter.acquire("/Items"):
+            pass
+    elapsed = time.monotonic() - started
+
+    assert 0.15 <= elapsed < 1.0
+
+def test_endpoint_budget_does_not_starve_other_endpoints():
+    limiter = RateLimiter(rate=1000.0, burst=100, endpoints={"/Items*": RateLimit(rate=1.0, burst=1)})
+
+    with limiter.acquire("/Items"):
+        pass
+
+    started = time.monotonic()
+    for _ in range(10):
+        with limiter.acquire("/System/Ping"):
+            pass
+
+    assert time.monotonic() - started < 0.5
+
+def test_max_in_flight_limits_concurrency():
+    limiter = RateLimiter(max_in_flight=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, peak
+        with limiter.acquire("/Items"):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+
+@respx.mock
+def test_client_requests_go_through_limiter():
+    respx.get("http://localhost:8096/System/Ping").mock(return_value=Response(200, text="Emby Server"))
+    limiter = RateLimiter(rate=20.0, burst=1)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", rate_limiter=limiter) as client:
+        started = time.monotonic()
+        for _ in range(3):
+            client.system.get_system_ping()
+
+    assert time.monotonic() - started >= 0.09
+
+@respx.mock
+def test_async_client_respects_max_in_flight():
+    active = 0
+    peak = 0
+
+    async def respond(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(200, json={"Id": "1"})
+
+    respx.get("http://localhost:8096/Users/1").mock(side_effect=respond)
+
+    async def run() -> None:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", rate_limiter=RateLimiter(max_in_flight=3)) as client:
+            await asyncio.gather(*(client.users.get_users_by_id("1") for _ in range(10)))
+
+    asyncio.run(run())
+
+    assert peak == 3
+
+@respx.mock
+def test_streamed_body_holds_in_flight_slot_until_closed():
+    class Body(SyncByteStream):
+        def __iter__(self):
+            yield b'{"Items": [{"Id": "1"}, '
+            yield b'{"Id": "2"}], "TotalRecordCount": 2}'
+
+    respx.get("http://localhost:8096/Items").mock(return_value=Response(200, stream=Body()))
+    respx.get("http://localhost:8096/System/Ping").mock(return_value=Response(200, text="Emby Server"))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", rate_limiter=RateLimiter(max_in_flight=1)) as client:
+        items = client.items.stream_items(GetItemRequest(recursive=True), response_format="dict", chunk_size=1)
+        assert next(items) == {"Id": "1"}
+
+        ping = threading.Thread(target=client.system.get_system_ping)
+        ping.start()
+        ping.join(0.1)
+        assert ping.is_alive()
+
+        items.close()
+        ping.join(1.0)
+        assert not ping.is_alive()
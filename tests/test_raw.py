@@ -0,0 +1,49 @@
+import asyncio
+
+import respx
+from httpx import Response
+from remby import AsyncEmbyClient, EmbyClient, GetItemRequest, MemoryCache, SQLiteCache
+
+PAGE = {"Items": [{"Name": "Bad", "Id": "1"}], "TotalRecordCount": 1}
+
+@respx.mock
+def test_get_items_raw_and_dict_formats():
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json=PAGE))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
+        raw = client.items.get_items(GetItemRequest(), response_format="raw")
+        plain = client.items.get_items(GetItemRequest(), response_format="dict")
+
+    assert raw.data == route.calls[0].response.content
+    assert plain.data == PAGE
+
+@respx.mock
+def test_iter_items_yields_dicts_for_raw_clients():
+    mock_url = "http://localhost:8096/Items"
+    respx.get(mock_url, params={"StartIndex": "0"}).mock(return_value=Response(200, json={"Items": [{"Id": "1"}], "TotalRecordCount": 2}))
+    respx.get(mock_url, params={"StartIndex": "1"}).mock(return_value=Response(200, json={"Items": [{"Id": "2"}], "TotalRecordCount": 2}))
+
+    async def run() -> list:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", response_format="raw") as client:
+            return [item async for item in client.items.iter_items(GetItemRequest(), page_size=1)]
+
+    assert asyncio.run(run()) == [{"Id": "1"}, {"Id": "2"}]
+
+@respx.mock
+def test_raw_format_bypasses_object_cache_but_uses_body_cache(tmp_path):
+    route = respx.get("http://localhost:8096/Users/1").mock(return_value=Response(200, json={"Id": "1"}))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=MemoryCache(ttls={"/Users/*": 60}), response_format="raw") as client:
+        client.users.get_users_by_id("1")
+        client.users.get_users_by_id("1")
+
+    assert route.call_count == 2
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", cache=SQLiteCache(tmp_path / "cache.sqlite", ttls={"/Users/*": 60})) as client:
+        client.users.get_users_by_id("1")
+        client.response_format = "dict"
+        cached = client.users.get_users_by_id("1")
+
+    assert route.call_count == 3
+    assert cached.from_cache is True
+    assert cached.data == {"Id": "1"}
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+
+import respx
+from httpx import Response
+from remby import EmbyClient, GetItemRequest, ItemRecord, ItemSnapshot
+from remby.models.emby._internal import BaseItemDto
+from remby.models.records import RECORD_PROJECTION
+
+ITEM = {
+    "Id": "1",
+    "Name": "Movie",
+    "Type": "Movie",
+    "ParentId": "3",
+    "Path": "/media/movie.mkv",
+    "ProviderIds": {"Tmdb": "603", "Imdb": "tt0133093"},
+    "RunTimeTicks": 81_600_000_000,
+    "Size": 4_000_000_000,
+    "DateModified": "2024-06-01T12:00:00.0000000Z",
+    "Overview": "Not kept"
+}
+
+def test_item_record_from_dict_and_model_match():
+    from_dict = ItemRecord.from_item(ITEM)
+    from_model = ItemRecord.from_item(BaseItemDto.model_validate(ITEM))
+
+    assert from_dict == from_model
+    assert from_dict.date_modified == datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+    assert from_dict.provider_id("tmdb") == "603"
+    assert from_dict.provider_id("Tvdb") is None
+    assert not hasattr(from_dict, "__dict__")
+
+@respx.mock
+def test_item_snapshot_from_projected_pages():
+    route = respx.get("http://localhost:8096/Items").mock(
+        return_value=Response(200, json={"Items": [ITEM, {**ITEM, "Id": "2", "ProviderIds": {}}], "TotalRecordCount": 2})
+    )
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        snapshot = ItemSnapshot.from_items(client.items.iter_items(GetItemRequest(recursive=True), projection=RECORD_PROJECTION))
+
+    assert route.calls[0].request.url.params["Fields"] == "DateModified,Id,Name,ParentId,Path,ProviderIds,RunTimeTicks,Size,Type"
+    assert [record.id for record in snapshot] == ["1", "2"]
+    assert snapshot[1].provider_ids is None
+    assert 0 < snapshot.bytes_per_item() < 2000
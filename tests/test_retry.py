@@ -0,0 +1,71 @@
+import httpx
+import pytest
+import respx
+from httpx import Response
+from remby import EmbyClient, RetryPolicy
+from remby.exceptions import EmbyException
+from remby._retry import _parse_retry_after
+
+@respx.mock
+def test_retry_recovers_from_server_error():
+    route = respx.get("http://localhost:8096/System/Ping").mock(side_effect=[
+        Response(503),
+        httpx.ConnectError("connection reset"),
+        Response(200, text="Emby Server"),
+    ])
+
+    policy = RetryPolicy(max_attempts=3, backoff_factor=0)
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", retry=policy) as client:
+        result = client.system.get_system_ping()
+
+    assert result == "Emby Server"
+    assert route.call_count == 3
+    assert policy.stats.requests == 1
+    assert policy.stats.attempts == 3
+    assert policy.stats.retries == 2
+    assert policy.stats.exhausted == 0
+
+@respx.mock
+def test_retry_gives_up_after_max_attempts():
+    route = respx.get("http://localhost:8096/System/Ping").mock(return_value=Response(502))
+
+    policy = RetryPolicy(max_attempts=2, backoff_factor=0)
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", retry=policy) as client:
+        with pytest.raises(EmbyException):
+            client.system.get_system_ping()
+
+    assert route.call_count == 2
+    assert policy.stats.exhausted == 1
+
+@respx.mock
+def test_retry_skips_non_idempotent_methods():
+    route = respx.post("http://localhost:8096/System/Restart").mock(return_value=Response(503))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", retry=RetryPolicy(backoff_factor=0)) as client:
+        with pytest.raises(EmbyException):
+            client.system.post_system_restart()
+
+    assert route.call_count == 1
+
+@respx.mock
+def test_retry_skips_client_errors():
+    route = respx.get("http://localhost:8096/Users/1").mock(return_value=Response(404))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", retry=RetryPolicy(backoff_factor=0)) as client:
+        with pytest.raises(EmbyException):
+            client.users.get_users_by_id("1")
+
+    assert route.call_count == 1
+
+def test_retry_delay_honours_retry_after():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+
+    assert policy.get_delay(1) == 1.0
+    assert policy.get_delay(3) == 4.0
+    assert policy.get_delay(10) == 5.0
+    assert policy.get_delay(1, Response(429, headers={"Retry-After": "2"})) == 2.0
+    assert policy.get_delay(1, Response(429, headers={"Retry-After": "120"})) == 5.0
+
+def test_parse_retry_after_http_date():
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_retry_after("not a date") is None
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import respx
+from httpx import Response
+from remby import AsyncEmbyClient, EmbyClient
+from remby.models.items import GetItemRequest
+from remby._singleflight import request_key
+
+def test_request_key_canonicalizes_params():
+    first = request_key("get", "/Items", object, {"params": {"Limit": 10, "Recursive": True}})
+    second = request_key("GET", "/Items", object, {"params": {"Recursive": "True", "Limit": "10"}})
+
+    assert first == second
+    assert request_key("GET", "/Items", object, {"json": {}}) is None
+
+@respx.mock
+def test_concurrent_identical_gets_share_one_call():
+    barrier = threading.Barrier(4)
+
+    def respond(request):
+        time.sleep(0.1)
+        return Response(200, json={"Id": "1"})
+
+    route = respx.get("http://localhost:8096/Users/1").mock(side_effect=respond)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="dummy", coalesce=True) as client:
+        def call():
+            barrier.wait()
+            return client.users.get_users_by_id("1")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: call(), range(4)))
+
+    assert route.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert results[0].data.id == "1"
+
+@respx.mock
+def test_different_params_are_not_coalesced():
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json={"Items": [], "TotalRecordCount": 0}))
+
+    async def run() -> None:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", coalesce=True) as client:
+            await asyncio.gather(
+                client.items.get_items(GetItemRequest(parent_id="1")),
+                client.items.get_items(GetItemRequest(parent_id="2")),
+            )
+
+    asyncio.run(run())
+
+    assert route.call_count == 2
+
+@respx.mock
+def test_async_identical_gets_share_one_call():
+    async def respond(request):
+        await asyncio.sleep(0.05)
+        return Response(200, json={"Items": [], "TotalRecordCount": 0})
+
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    async def run():
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", coalesce=True) as client:
+            return await asyncio.gather(*(client.items.get_items(GetItemRequest(recursive=True)) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert route.call_count == 1
+    assert all(result is results[0] for result in results)
+
+@respx.mock
+def test_async_cancelled_leader_does_not_cancel_followers():
+    async def respond(request):
+        await asyncio.sleep(0.05)
+        return Response(200, json={"Items": [], "TotalRecordCount": 0})
+
+    route = respx.get("http://localhost:8096/Items").mock(side_effect=respond)
+
+    async def run():
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="dummy", coalesce=True) as client:
+            leader = asyncio.create_task(client.items.get_items(GetItemRequest(recursive=True)))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(client.items.get_items(GetItemRequest(recursive=True))) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return leader, await asyncio.gather(*followers)
+
+    leader, results = asyncio.run(run())
+
+    assert leader.cancelled()
+    assert route.call_count == 1
+    assert all(result.data.total_record_count == 0 for result in results)
@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response, SyncByteStream
+from remby import AsyncEmbyClient, CircuitBreaker, CircuitState, EmbyClient, EmbyException, GetItemRequest, ItemProjection
+from remby._streaming import ItemsSplitter
+
+BODY = {
+    "Items": [
+        {"Id": "1", "Name": "Quote \" and [bracket", "Genres": ["A", "B"], "MediaSources": [{"Path": "C:\\\\media\\\\}"}]},
+        {"Id": "2", "Name": "{not an object}", "ProviderIds": {"Tmdb": "2"}},
+        {"Id": "3", "Name": "Ünïcode ✓"}
+    ],
+    "TotalRecordCount": 3
+}
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 10_000])
+def test_items_splitter_handles_any_chunking(chunk_size):
+    content = json.dumps(BODY, ensure_ascii=False).encode()
+    splitter = ItemsSplitter()
+
+    items = []
+    for offset in range(0, len(content), chunk_size):
+        items.extend(splitter.feed(content[offset:offset + chunk_size]))
+
+    assert [json.loads(item) for item in items] == BODY["Items"]
+    assert splitter.finish() == {"Items": [], "TotalRecordCount": 3}
+
+def test_items_splitter_rejects_truncated_body():
+    splitter = ItemsSplitter()
+    splitter.feed(b'{"TotalRecordCount": 3, "Items": [{"Id": "1"}, {"Id": "2"')
+
+    with pytest.raises(ValueError):
+        splitter.finish()
+
+@respx.mock
+def test_stream_items():
+    route = respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json=BODY))
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+        stream = client.items.stream_items(GetItemRequest(limit=3), projection=ItemProjection("id", "name"), chunk_size=16)
+        first = next(stream)
+        rest = list(stream)
+
+    assert route.calls[0].request.url.params["Fields"] == "Id,Name"
+    assert first.id == "1"
+    assert [item.name for item in rest] == ["{not an object}", "Ünïcode ✓"]
+
+@respx.mock
+def test_async_stream_items_raw_and_errors():
+    respx.get("http://localhost:8096/Items").mock(return_value=Response(200, json=BODY))
+    respx.get("http://localhost:8096/Users/1/Items").mock(return_value=Response(500))
+
+    async def run() -> list:
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+            items = [item async for item in client.items.stream_items(GetItemRequest(), response_format="dict")]
+            with pytest.raises(EmbyException):
+                [item async for item in client.items.stream_items_by_userid("1", GetItemRequest())]
+            return items
+
+    assert asyncio.run(run()) == BODY["Items"]
+
+@respx.mock
+def test_stream_items_translates_body_failures():
+    class Dropped(SyncByteStream):
+        def __iter__(self):
+            yield b'{"Items": [{"Id": "1"}, '
+            raise httpx.ReadError("connection reset")
+
+    route = respx.get("http://localhost:8096/Items")
+    route.side_effect = [Response(200, stream=Dropped()), Response(200, content=b'{"Items": [{"Id": "1"}')]
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+
+    with EmbyClient(base_url="http://localhost:8096", api_key="test", circuit_breaker=breaker) as client:
+        with pytest.raises(EmbyException):
+            list(client.items.stream_items(GetItemRequest(), response_format="dict", chunk_size=1))
+        assert breaker.state is CircuitState.OPEN
+
+        breaker.reset()
+        with pytest.raises(EmbyException, match="Incomplete"):
+            list(client.items.stream_items(GetItemRequest(), response_format="dict"))
+
+@respx.mock
+def test_async_stream_items_translates_truncated_body():
+    respx.get("http://localhost:8096/Items").mock(return_value=Response(200, content=b'{"Items": [{"Id": "1"}, {"Id"'))
+
+    async def run() -> list:
+        items = []
+        async with AsyncEmbyClient(base_url="http://localhost:8096", api_key="test") as client:
+            with pytest.raises(EmbyException):
+                async for item in client.items.stream_items(GetItemRequest(), response_format="dict"):
+                    items.append(item)
+        return items
+
+    assert asyncio.run(run()) == [{"Id": "1"}]
@@ -246,4 +246,4 @@ def test_post_system_shutdown():
     with EmbyClient(base_url="http://localhost:8096", api_key="dummy") as client:
         result = client.system.post_system_shutdown()
 
-    assert result is True
\ No newline at end of file
+    assert result is True
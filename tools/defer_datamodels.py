@@ -0,0 +1,70 @@
+# defer_datamodels.py
+# version 1.0
+#
+# Post-processes the models generated by generate_datamodels.sh so that they
+# derive from remby.models.base instead of pydantic, which builds their
+# validators lazily (defer_build), and turns the package __init__ re-exports
+# into a module __getattr__, so `import remby` doesn't load _internal at all.
+#
+#   python tools/defer_datamodels.py src/remby/models/emby
+
+import re
+import sys
+from pathlib import Path
+
+PYDANTIC_IMPORT = re.compile(r"^from pydantic import (.+)$", re.MULTILINE)
+INTERNAL_IMPORT = re.compile(r"^from \._internal import \(\n(.*?)^\)\n", re.MULTILINE | re.DOTALL)
+LAZY_INIT_HEADER = """from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._internal import (
+{names}    )
+"""
+LAZY_INIT_FOOTER = """
+
+def __getattr__(name: str) -> Any:
+    # Re-exports are resolved on first access, so importing the package is cheap.
+    if name in __all__:
+        value = globals()[name] = getattr(import_module("._internal", __name__), name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+"""
+DEFERRED = ("BaseModel", "RootModel")
+
+def patch(source: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        names = [name.strip() for name in match.group(1).split(",")]
+        deferred = [name for name in names if name in DEFERRED]
+        if not deferred:
+            return match.group(0)
+        kept = [name for name in names if name not in DEFERRED]
+        lines = []
+        if kept:
+            lines.append(f"from pydantic import {', '.join(kept)}\n")
+        lines.append(f"from remby.models.base import {', '.join(deferred)}")
+        return "\n".join(lines)
+    return PYDANTIC_IMPORT.sub(replace, source, count=1)
+
+def lazy_init(source: str) -> str:
+    match = INTERNAL_IMPORT.search(source)
+    if match is None:
+        return source
+    names = "".join(f"    {line}\n" for line in match.group(1).splitlines())
+    return source[:match.start()] + LAZY_INIT_HEADER.format(names=names) + source[match.end():] + LAZY_INIT_FOOTER
+
+def main() -> None:
+    package = Path(sys.argv[1])
+    for path in sorted(package.rglob("*.py")):
+        source = path.read_text(encoding="UTF-8")
+        patched = lazy_init(source) if path == package / "__init__.py" else patch(source)
+        if patched != source:
+            path.write_text(patched, encoding="UTF-8")
+            print(f"patched {path}")
+
+if __name__ == "__main__":
+    main()